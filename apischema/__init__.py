@@ -21,6 +21,7 @@ __all__ = [
     "serializer",
     "settings",
     "type_name",
+    "validation_method",
     "validator",
 ]
 
@@ -40,7 +41,7 @@ from . import (  # noqa: F401
 from .aliases import alias
 from .conversions import deserializer, serializer
 from .dependencies import dependent_required
-from .deserialization import deserialization_method, deserialize
+from .deserialization import deserialization_method, deserialize, validation_method
 from .discriminators import discriminator
 from .metadata import properties
 from .ordering import order
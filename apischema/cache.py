@@ -1,9 +1,12 @@
 __all__ = ["cache", "reset", "set_size"]
 import sys
 from functools import lru_cache
-from typing import Callable, Iterator, MutableMapping, TypeVar, cast
+from itertools import chain
+from typing import Callable, Iterator, MutableMapping, Optional, TypeVar, cast
 
 _cached: list = []
+# caches with their own size, which is not modified by set_size
+_sized: list = []
 
 Func = TypeVar("Func", bound=Callable)
 
@@ -14,8 +17,26 @@ def cache(func: Func) -> Func:
     return cached
 
 
+def sized_cache(size: Optional[int]) -> Callable[[Func], Func]:
+    """Cache with its own size (None for no limit), not modified by set_size but
+    still cleared by reset"""
+
+    def decorator(func: Func) -> Func:
+        cached = cast(Func, lru_cache(size)(func))
+        _sized.append(cached)
+        return cached
+
+    return decorator
+
+
+def unbounded_cache(func: Func) -> Func:
+    """Cache without size limit, for functions whose arguments are bounded (e.g.
+    by the number of types), but still cleared by reset"""
+    return sized_cache(None)(func)
+
+
 def reset():
-    for cached in _cached:
+    for cached in chain(_cached, _sized):
         cached.cache_clear()
 
 
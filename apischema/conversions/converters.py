@@ -45,7 +45,9 @@ Deserializer = TypeVar(
 )
 Serializer = TypeVar("Serializer", bound=Union[Callable, Conversion, property, type])
 
-default_deserialization: Callable[[type], Optional[AnyConversion]] = _deserializers.get
+
+def default_deserialization(tp: Type) -> Optional[AnyConversion]:
+    return _deserializers.get(tp)
 
 
 def default_serialization(tp: Type) -> Optional[AnyConversion]:
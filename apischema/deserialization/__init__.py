@@ -3,6 +3,7 @@ import dataclasses
 import inspect
 import re
 from collections import defaultdict
+from contextlib import suppress
 from enum import Enum
 from functools import lru_cache, partial
 from typing import (
@@ -59,6 +60,7 @@ from apischema.deserialization.methods import (
     FlattenedField,
     FloatMethod,
     FrozenSetMethod,
+    InternStrMethod,
     IntMethod,
     ListCheckOnlyMethod,
     ListMethod,
@@ -76,6 +78,7 @@ from apischema.deserialization.methods import (
     SetMethod,
     SimpleObjectMethod,
     StrMethod,
+    StrParserMethod,
     SubprimitiveMethod,
     TupleMethod,
     TypeCheckMethod,
@@ -242,6 +245,44 @@ def constraints_validators(
     return result
 
 
+def coercion_candidates(value: Any) -> Sequence[Any]:
+    if isinstance(value, str):
+        candidates = []
+        for cls in (int, float):
+            with suppress(ValueError):
+                candidates.append(cls(value))
+        return candidates
+    elif value is not None:
+        return [str(value)]
+    else:
+        return []
+
+
+@cache
+def literal_tables(
+    values: Tuple[Any, ...], coercer: Optional[Coercer]
+) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    """Precompute the tables used by LiteralMethod, shared between all methods
+    deserializing the same Literal/Enum.
+
+    The coerced table maps the most common coerced forms of the values (string form
+    of numbers, etc.) to the values, avoiding to call the coercer for them; it is
+    keyed by (type, data), as equal data of different types (1, 1.0, True) may not
+    be coerced the same way."""
+    value_map = dict(zip(literal_values(values), values))
+    coerced_map: Dict[Any, Any] = {}
+    if coercer is not None:
+        for raw, value in value_map.items():
+            for candidate in coercion_candidates(raw):
+                key = (candidate.__class__, candidate)
+                if candidate in value_map or key in coerced_map:
+                    continue
+                with suppress(Exception):
+                    if coercer(type(raw), candidate) == raw:
+                        coerced_map[key] = value
+    return value_map, coerced_map
+
+
 class DeserializationMethodVisitor(
     RecursiveConversionsVisitor[Deserialization, DeserializationMethodFactory],
     DeserializationVisitor[DeserializationMethodFactory],
@@ -390,9 +431,10 @@ class DeserializationMethodVisitor(
         def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
             from apischema import settings
 
-            value_map = dict(zip(literal_values(values), values))
+            value_map, coerced_map = literal_tables(tuple(values), self.coercer)
             return LiteralMethod(
                 value_map,
+                coerced_map,
                 preformat_error(settings.errors.one_of, list(value_map)),
                 self.coercer,
                 tuple(set(map(type, value_map))),
@@ -415,6 +457,34 @@ class DeserializationMethodVisitor(
 
         return self._factory(factory, dict)
 
+    def _constructor(
+        self, cls: type, fields: Sequence[ObjectField]
+    ) -> Optional[Constructor]:
+        from apischema import settings
+
+        if is_typed_dict(cls):
+            return NoConstructor(cls)
+        elif (
+            settings.deserialization.override_dataclass_constructors
+            and is_raw_dataclass(cls)
+        ):
+            return FieldsConstructor(
+                cls,
+                len(fields),
+                tuple(
+                    DefaultField(f.name, f.default)
+                    for f in dataclasses.fields(cls)
+                    if f.default is not dataclasses.MISSING
+                ),
+                tuple(
+                    FactoryField(f.name, f.default_factory)
+                    for f in dataclasses.fields(cls)
+                    if f.default_factory is not dataclasses.MISSING
+                ),
+            )
+        else:
+            return None
+
     def object(
         self, tp: Type, fields: Sequence[ObjectField]
     ) -> DeserializationMethodFactory:
@@ -487,27 +557,7 @@ class DeserializationMethodVisitor(
                     )
             object_constraints = constraints_validators(constraints)[dict]
             all_alliases = set(alias_by_name.values())
-            constructor: Optional[Constructor] = None
-            if is_typed_dict(cls):
-                constructor = NoConstructor(cls)
-            elif (
-                settings.deserialization.override_dataclass_constructors
-                and is_raw_dataclass(cls)
-            ):
-                constructor = FieldsConstructor(
-                    cls,
-                    len(fields),
-                    tuple(
-                        DefaultField(f.name, f.default)
-                        for f in dataclasses.fields(cls)
-                        if f.default is not dataclasses.MISSING
-                    ),
-                    tuple(
-                        FactoryField(f.name, f.default_factory)
-                        for f in dataclasses.fields(cls)
-                        if f.default_factory is not dataclasses.MISSING
-                    ),
-                )
+            constructor = self._constructor(cls, fields)
             if (
                 not object_constraints
                 and not flattened_fields
@@ -558,13 +608,20 @@ class DeserializationMethodVisitor(
 
     def primitive(self, cls: Type) -> DeserializationMethodFactory:
         def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
+            from apischema import settings
+
             validators = constraints_validators(constraints)[cls]
             if cls is NoneType:
                 return NoneMethod()
             elif cls is bool:
                 return BoolMethod()
             elif cls is str:
-                return ConstrainedStrMethod(validators) if validators else StrMethod()
+                method: DeserializationMethod = (
+                    ConstrainedStrMethod(validators) if validators else StrMethod()
+                )
+                if settings.deserialization.intern_strings:
+                    method = InternStrMethod(method)
+                return method
             elif cls is int:
                 return ConstrainedIntMethod(validators) if validators else IntMethod()
             elif cls is float:
@@ -663,6 +720,12 @@ class DeserializationMethodVisitor(
 
             if len(conv_alternatives) > 1:
                 return ConversionUnionMethod(conv_alternatives)
+            elif (
+                conv_alternatives[0].value_error
+                and type(conv_alternatives[0].method) is StrMethod
+            ):
+                # Parsing of string-convertible types, e.g. datetime or UUID
+                return StrParserMethod(conv_alternatives[0].converter)
             elif conv_alternatives[0].value_error:
                 return ConversionWithValueErrorMethod(
                     conv_alternatives[0].converter, conv_alternatives[0].method
@@ -872,3 +935,164 @@ def deserialize(
         schema=schema,
         validators=validators,
     )(data)
+
+
+class ValidationMethodVisitor(DeserializationMethodVisitor):
+    """Build methods running deserialization checks and constraints, without
+    constructing objects, calling converters or running validators"""
+
+    def __init__(
+        self,
+        additional_properties: bool,
+        aliaser: Aliaser,
+        coercer: Optional[Coercer],
+        default_conversion: DefaultConversion,
+        fall_back_on_default: bool,
+    ):
+        super().__init__(
+            additional_properties,
+            aliaser,
+            coercer,
+            default_conversion,
+            fall_back_on_default,
+            True,
+            (),
+        )
+
+    def visit_not_recursive(self, tp: AnyType) -> DeserializationMethodFactory:
+        return validation_method_factory(
+            tp,
+            self.additional_properties,
+            self.aliaser,
+            self.coercer,
+            self._conversion,
+            self.default_conversion,
+            self.fall_back_on_default,
+        )
+
+    def _factory(
+        self, factory: Factory, cls: Optional[type] = None, validation: bool = True
+    ) -> DeserializationMethodFactory:
+        # Validators need deserialized objects
+        return super()._factory(
+            lambda constraints, _: factory(constraints, ()), cls, validation=False
+        )
+
+    def _constructor(
+        self, cls: type, fields: Sequence[ObjectField]
+    ) -> Optional[Constructor]:
+        return NoConstructor(cls)
+
+    def collection(
+        self, cls: Type[Collection], value_type: AnyType
+    ) -> DeserializationMethodFactory:
+        value_factory = self.visit(value_type)
+
+        def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
+            return ListCheckOnlyMethod(
+                constraints_validators(constraints)[list], value_factory.method
+            )
+
+        return self._factory(factory, list)
+
+    def mapping(
+        self, cls: Type[Mapping], key_type: AnyType, value_type: AnyType
+    ) -> DeserializationMethodFactory:
+        key_factory, value_factory = self.visit(key_type), self.visit(value_type)
+
+        def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
+            return MappingCheckOnly(
+                constraints_validators(constraints)[dict],
+                key_factory.method,
+                value_factory.method,
+            )
+
+        return self._factory(factory, dict)
+
+    def subprimitive(self, cls: Type, superclass: Type) -> DeserializationMethodFactory:
+        return self.primitive(superclass)
+
+    def _visit_conversion(
+        self,
+        tp: AnyType,
+        conversion: Deserialization,
+        dynamic: bool,
+        next_conversion: Optional[AnyConversion],
+    ) -> DeserializationMethodFactory:
+        assert conversion
+        # Only the source of the conversion is checked
+        conv_factories = [
+            self.visit_with_conv(conv.source, sub_conversion(conv, next_conversion))
+            for conv in conversion
+        ]
+
+        def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
+            methods = tuple(
+                (fact if dynamic else fact.merge(constraints)).method
+                for fact in conv_factories
+            )
+            return methods[0] if len(methods) == 1 else UnionMethod(methods)
+
+        return self._factory(factory)
+
+
+@cache
+def validation_method_factory(
+    tp: AnyType,
+    additional_properties: bool,
+    aliaser: Aliaser,
+    coercer: Optional[Coercer],
+    conversion: Optional[AnyConversion],
+    default_conversion: DefaultConversion,
+    fall_back_on_default: bool,
+) -> DeserializationMethodFactory:
+    return ValidationMethodVisitor(
+        additional_properties,
+        aliaser,
+        coercer,
+        default_conversion,
+        fall_back_on_default,
+    ).visit_with_conv(tp, conversion)
+
+
+def validation_method(
+    type: AnyType,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    schema: Optional[Schema] = None,
+) -> Callable[[Any], None]:
+    """Return a function checking that data can be deserialized, raising
+    ValidationError otherwise.
+
+    Type checks and constraints are the ones of deserialization, but objects are not
+    constructed, and converters and validators are not called."""
+    from apischema import settings
+
+    coercer: Optional[Coercer] = None
+    if callable(coerce):
+        coercer = coerce
+    elif opt_or(coerce, settings.deserialization.coerce):
+        coercer = settings.deserialization.coercer
+    method = (
+        validation_method_factory(
+            type,
+            opt_or(additional_properties, settings.additional_properties),
+            opt_or(aliaser, settings.aliaser),
+            coercer,
+            conversion,
+            opt_or(default_conversion, settings.deserialization.default_conversion),
+            opt_or(fall_back_on_default, settings.deserialization.fall_back_on_default),
+        )
+        .merge(get_constraints(schema))
+        .method.deserialize
+    )
+
+    def validate(data: Any):
+        method(data)
+
+    return validate
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from typing import (
     AbstractSet,
@@ -9,6 +10,7 @@ from typing import (
     Optional,
     Pattern,
     Sequence,
+    Set,
     Tuple,
     Union,
 )
@@ -325,6 +327,7 @@ class VariadicTupleMethod(DeserializationMethod):
 @dataclass
 class LiteralMethod(DeserializationMethod):
     value_map: dict
+    coerced_map: dict
     error: Union[str, Callable[[Any], str]]
     coercer: Optional[Coercer]
     types: Tuple[type, ...]
@@ -334,10 +337,13 @@ class LiteralMethod(DeserializationMethod):
             return self.value_map[data]
         except KeyError:
             if self.coercer is not None:
+                key = (data.__class__, data)
+                if key in self.coerced_map:
+                    return self.coerced_map[key]
                 for cls in self.types:
                     try:
                         return self.value_map[self.coercer(cls, data)]
-                    except IndexError:
+                    except (KeyError, ValidationError):
                         pass
             raise ValidationError(format_error(self.error, data))
         except TypeError:
@@ -567,6 +573,9 @@ class ObjectMethod(DeserializationMethod):
     missing: str
     unexpected: str
     aggregate_fields: bool = field(init=False)
+    validators_by_dependencies: Tuple[
+        Tuple[AbstractSet[str], Tuple[int, ...]], ...
+    ] = field(init=False)
 
     def __post_init__(self):
         self.aggregate_fields = bool(
@@ -574,6 +583,14 @@ class ObjectMethod(DeserializationMethod):
             or self.pattern_fields
             or self.additional_field is not None
         )
+        # Validators are grouped by dependencies to check each set only once
+        by_dependencies: Dict[AbstractSet[str], List[int]] = {}
+        for i, validator in enumerate(self.validators):
+            deps = frozenset(validator.dependencies)
+            by_dependencies.setdefault(deps, []).append(i)
+        self.validators_by_dependencies = tuple(
+            (deps, tuple(indices)) for deps, indices in by_dependencies.items()
+        )
 
     def deserialize(self, data: Any) -> Any:
         discriminator: Optional[str] = None
@@ -687,11 +704,19 @@ class ObjectMethod(DeserializationMethod):
                     elif not field_errors or name not in field_errors:
                         assert default_factory is not None
                         init[name] = default_factory()
-            aliases = values.keys()
             # Don't keep validators when all dependencies are default
-            validators = [
-                v for v in self.validators if not v.dependencies.isdisjoint(aliases)
-            ]
+            # (the set is only allocated when validators are skipped)
+            skipped: Optional[Set[int]] = None
+            for dependencies, indices in self.validators_by_dependencies:
+                if dependencies.isdisjoint(values):
+                    if skipped is None:
+                        skipped = set()
+                    skipped.update(indices)
+            validators: Sequence[Validator] = self.validators
+            if skipped:
+                validators = [
+                    v for i, v in enumerate(self.validators) if i not in skipped
+                ]
             if field_errors or errors:
                 error = ValidationError(errors or [], field_errors or {})
                 invalid_fields = self.post_init_modified
@@ -749,6 +774,16 @@ class StrMethod(DeserializationMethod):
         return data
 
 
+@dataclass
+class InternStrMethod(DeserializationMethod):
+    method: DeserializationMethod
+
+    def deserialize(self, data: Any) -> Any:
+        value = self.method.deserialize(data)
+        # str subclasses cannot be interned
+        return sys.intern(value) if type(value) is str else value
+
+
 class BoolMethod(DeserializationMethod):
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, bool):
@@ -813,7 +848,7 @@ class TupleMethod(DeserializationMethod):
             try:
                 elts[i] = elt_method.deserialize(data[i])
             except ValidationError as err:
-                set_child_error(elt_errors, i, err)
+                elt_errors = set_child_error(elt_errors, i, err)
         validate_constraints(data, self.constraints, elt_errors)
         return tuple(elts)
 
@@ -884,6 +919,19 @@ class ConversionWithValueErrorMethod(ConversionMethod):
             raise ValidationError(str(err))
 
 
+@dataclass
+class StrParserMethod(DeserializationMethod):
+    parser: Converter
+
+    def deserialize(self, data: Any) -> Any:
+        if not isinstance(data, str):
+            raise bad_type(data, str)
+        try:
+            return self.parser(data)
+        except ValueError as err:
+            raise ValidationError(str(err))
+
+
 @dataclass
 class ConversionAlternative:
     converter: Converter
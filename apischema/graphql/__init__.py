@@ -1,10 +1,14 @@
 __all__ = [
+    "Broadcast",
     "ID",
     "Mutation",
     "Query",
+    "ResolverCache",
     "Subscription",
+    "cost_validation_rule",
     "graphql_schema",
     "interface",
+    "query_cost",
     "relay",
     "resolver",
 ]
@@ -12,8 +16,10 @@ __all__ = [
 
 try:
     from . import relay
+    from .broadcast import Broadcast
+    from .cost import cost_validation_rule, query_cost
     from .interfaces import interface
-    from .resolvers import resolver
+    from .resolvers import ResolverCache, resolver
     from .schema import ID, Mutation, Query, Subscription, graphql_schema
 except ImportError:
     raise
@@ -0,0 +1,51 @@
+import asyncio
+from typing import AsyncIterator, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+_CLOSED = object()
+
+
+class Broadcast(Generic[T]):
+    """Fan-out of published events to multiple subscribers.
+
+    Each subscriber has its own queue of maxsize events (unbounded if maxsize
+    is 0); publish waits for the queues of slow subscribers to have room.
+    Because the same event object is pushed to all subscribers, subscriptions
+    with share_events=True only resolve it once per context."""
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._queues: List[asyncio.Queue] = []
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._queues)
+
+    async def publish(self, event: T):
+        await asyncio.gather(*(queue.put(event) for queue in self._queues))
+
+    def publish_nowait(self, event: T):
+        """Publish without waiting; events are dropped for subscribers whose
+        queue is full."""
+        for queue in self._queues:
+            if not queue.full():
+                queue.put_nowait(event)
+
+    async def close(self):
+        """End all the subscriptions, after their pending events."""
+        await asyncio.gather(*(queue.put(_CLOSED) for queue in self._queues))
+
+    async def subscribe(self) -> AsyncIterator[T]:
+        """Events are received from the first iteration, so a subscription which
+        is never iterated doesn't block publish."""
+        queue: asyncio.Queue = asyncio.Queue(self.maxsize)
+        self._queues.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                if event is _CLOSED:
+                    break
+                yield event
+        finally:
+            self._queues.remove(queue)
@@ -0,0 +1,175 @@
+from typing import AbstractSet, Any, Collection, Dict, Mapping, Optional, Type
+
+import graphql
+
+COST_EXTENSION = "cost"
+
+
+def multiplier(
+    node: graphql.FieldNode,
+    field: graphql.GraphQLField,
+    multipliers: Collection[str],
+    variables: Optional[Dict[str, Any]],
+    max_multiplier: Optional[int],
+) -> int:
+    arguments = {arg.name.value: arg.value for arg in node.arguments or ()}
+    for name in multipliers:
+        if name not in field.args:
+            continue
+        value: Any = graphql.Undefined
+        if name in arguments:
+            value_node = arguments[name]
+            if isinstance(value_node, graphql.VariableNode) and variables is None:
+                if max_multiplier is not None:
+                    return max_multiplier
+            else:
+                value = graphql.value_from_ast(
+                    value_node, field.args[name].type, variables
+                )
+        if value is graphql.Undefined:
+            value = field.args[name].default_value
+        if isinstance(value, int):
+            return max(value, 0)
+    return 1
+
+
+class CostComputer:
+    def __init__(
+        self,
+        schema: graphql.GraphQLSchema,
+        document: graphql.DocumentNode,
+        default_cost: float,
+        multipliers: Collection[str],
+        variables: Optional[Mapping[str, Any]],
+        max_multiplier: Optional[int] = None,
+    ):
+        self.schema = schema
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, graphql.FragmentDefinitionNode)
+        }
+        self.default_cost = default_cost
+        self.multipliers = multipliers
+        self.variables = dict(variables) if variables is not None else None
+        self.max_multiplier = max_multiplier
+
+    def operation(self, operation: graphql.OperationDefinitionNode) -> float:
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return 0.0
+        return self.selection_set(root_type, operation.selection_set, frozenset())
+
+    def selection_set(
+        self,
+        parent_type: graphql.GraphQLNamedType,
+        selection_set: graphql.SelectionSetNode,
+        visited: AbstractSet[str],
+    ) -> float:
+        cost = 0.0
+        for selection in selection_set.selections:
+            if isinstance(selection, graphql.FieldNode):
+                cost += self.field(parent_type, selection, visited)
+            elif isinstance(selection, graphql.InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    condition = selection.type_condition.name.value
+                    fragment_type = self.schema.get_type(condition) or parent_type
+                cost += self.selection_set(
+                    fragment_type, selection.selection_set, visited
+                )
+            elif isinstance(selection, graphql.FragmentSpreadNode):
+                name = selection.name.value
+                # fragment cycles are reported by another validation rule
+                if name in visited or name not in self.fragments:
+                    continue
+                fragment = self.fragments[name]
+                fragment_type = (
+                    self.schema.get_type(fragment.type_condition.name.value)
+                    or parent_type
+                )
+                cost += self.selection_set(
+                    fragment_type, fragment.selection_set, visited | {name}
+                )
+        return cost
+
+    def field(
+        self,
+        parent_type: graphql.GraphQLNamedType,
+        node: graphql.FieldNode,
+        visited: AbstractSet[str],
+    ) -> float:
+        if not isinstance(
+            parent_type, (graphql.GraphQLObjectType, graphql.GraphQLInterfaceType)
+        ):
+            return 0.0
+        field = parent_type.fields.get(node.name.value)
+        # introspection fields are not part of the type fields
+        if field is None:
+            return 0.0
+        cost = (field.extensions or {}).get(COST_EXTENSION, self.default_cost)
+        if node.selection_set is not None:
+            field_type = graphql.get_named_type(field.type)
+            factor = multiplier(
+                node, field, self.multipliers, self.variables, self.max_multiplier
+            )
+            cost += factor * self.selection_set(field_type, node.selection_set, visited)
+        return cost
+
+
+def query_cost(
+    schema: graphql.GraphQLSchema,
+    document: graphql.DocumentNode,
+    operation_name: Optional[str] = None,
+    variables: Optional[Mapping[str, Any]] = None,
+    *,
+    default_cost: float = 0.0,
+    multipliers: Collection[str] = ("first", "last"),
+) -> float:
+    """Estimate the cost of a query, using resolvers/operations cost.
+
+    Cost of fields with a selection set is added to the cost of their
+    subselection, multiplied by the value of its first argument named in
+    multipliers (e.g. pagination size), or by the argument default value."""
+    computer = CostComputer(schema, document, default_cost, multipliers, variables)
+    for definition in document.definitions:
+        if isinstance(definition, graphql.OperationDefinitionNode) and (
+            operation_name is None
+            or (definition.name and definition.name.value == operation_name)
+        ):
+            return computer.operation(definition)
+    return 0.0
+
+
+def cost_validation_rule(
+    max_cost: float,
+    *,
+    default_cost: float = 0.0,
+    multipliers: Collection[str] = ("first", "last"),
+    max_multiplier: int = 100,
+) -> Type[graphql.ValidationRule]:
+    """Return a validation rule rejecting operations whose cost exceeds max_cost.
+
+    Variables are not available at validation, so multiplier arguments given by
+    a variable are assumed to be max_multiplier (e.g. the maximum page size)."""
+
+    class CostValidationRule(graphql.ValidationRule):
+        def enter_operation_definition(self, node: graphql.OperationDefinitionNode, *_):
+            context = self.context
+            computer = CostComputer(
+                context.schema,
+                context.document,
+                default_cost,
+                multipliers,
+                None,
+                max_multiplier,
+            )
+            cost = computer.operation(node)
+            if cost > max_cost:
+                self.report_error(
+                    graphql.GraphQLError(
+                        f"Query cost {cost} exceeds maximum cost {max_cost}", node
+                    )
+                )
+
+    return CostValidationRule
@@ -6,12 +6,23 @@ __all__ = [
     "Mutation",
     "Node",
     "PageInfo",
+    "async_connection_from_keyset",
     "base64_encoding",
+    "connection_from_keyset",
+    "connection_from_slice",
     "mutations",
     "node",
     "nodes",
+    "nodes_query",
 ]
-from .connections import Connection, Edge, PageInfo
-from .global_identification import GlobalId, Node, node, nodes
+from .connections import (
+    Connection,
+    Edge,
+    PageInfo,
+    async_connection_from_keyset,
+    connection_from_keyset,
+    connection_from_slice,
+)
+from .global_identification import GlobalId, Node, node, nodes, nodes_query
 from .mutations import ClientMutationId, Mutation, mutations
 from .utils import base64_encoding
@@ -1,5 +1,22 @@
 from dataclasses import dataclass
-from typing import Generic, Optional, Sequence, Type, TypeVar
+from inspect import isawaitable
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from apischema.type_names import get_type_name, type_name
 from apischema.types import NoneType
@@ -54,7 +71,7 @@ class PageInfo(Generic[Cursor_]):
         has_next_page: bool = False,
     ) -> "PageInfo":
         start_cursor, end_cursor = None, None
-        if edges is not None:
+        if edges:
             if edges[0] is not None:
                 start_cursor = edges[0].cursor
             if edges[-1] is not None:
@@ -81,3 +98,184 @@ class Connection(Generic[Node_, Cursor_, Edge_]):
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         type_name(graphql=connection_name)(cls)
+
+
+def check_count(name: str, count: Optional[int]):
+    if count is not None and count < 0:
+        raise ValueError(f"{name} must be positive")
+
+
+def make_connection(
+    nodes: Sequence[Node_],
+    cursors: Iterable[Cursor_],
+    has_previous_page: bool,
+    has_next_page: bool,
+    connection_cls: Type[Connection],
+    edge_cls: Type[Edge],
+) -> Connection:
+    edges = [edge_cls(node, cursor) for node, cursor in zip(nodes, cursors)]
+    page_info = PageInfo.from_edges(edges, has_previous_page, has_next_page)
+    return connection_cls(edges, page_info)
+
+
+def connection_from_slice(
+    data: Sequence[Node_],
+    *,
+    first: Optional[int] = None,
+    after: Optional[int] = None,
+    last: Optional[int] = None,
+    before: Optional[int] = None,
+    connection_cls: Type[Connection] = Connection,
+    edge_cls: Type[Edge] = Edge,
+) -> Connection:
+    """Build a connection from a sliceable data source, using offsets as cursors.
+
+    Only the requested page and one additional element are sliced, so data can
+    be a lazy sequence, e.g. a database query; its length is only needed for
+    `last` without `before`."""
+    check_count("first", first)
+    check_count("last", last)
+    # negative offsets would slice from the end of data
+    check_count("after", after)
+    check_count("before", before)
+    start = after + 1 if after is not None else 0
+    has_previous_page, has_next_page = start > 0, False
+    if first is not None:
+        stop = start + first + 1
+        if before is not None:
+            stop = min(stop, before)
+        nodes = list(data[start:stop])
+        has_next_page = len(nodes) > first
+        del nodes[first:]
+        if last is not None and len(nodes) > last:
+            has_previous_page = True
+            start += len(nodes) - last
+            del nodes[: len(nodes) - last]
+    elif last is not None:
+        stop = before if before is not None else len(data)
+        start = max(start, stop - last - 1)
+        nodes = list(data[start:stop])
+        has_previous_page = len(nodes) > last
+        if has_previous_page:
+            start += 1
+            del nodes[0]
+    else:
+        nodes = list(data[start:before])
+    return make_connection(
+        nodes,
+        range(start, start + len(nodes)),
+        has_previous_page,
+        has_next_page,
+        connection_cls,
+        edge_cls,
+    )
+
+
+Fetch = Callable[[Optional[Cursor_], Optional[Cursor_], Optional[int], bool], Any]
+
+
+def keyset_parameters(
+    first: Optional[int], last: Optional[int]
+) -> Tuple[Optional[int], bool]:
+    check_count("first", first)
+    check_count("last", last)
+    if first is not None:
+        return first + 1, False
+    elif last is not None:
+        return last + 1, True
+    else:
+        return None, False
+
+
+def keyset_connection(
+    nodes: List[Node_],
+    cursor: Callable[[Node_], Cursor_],
+    first: Optional[int],
+    last: Optional[int],
+    backward: bool,
+    connection_cls: Type[Connection],
+    edge_cls: Type[Edge],
+) -> Connection:
+    has_previous_page = has_next_page = False
+    if backward:
+        assert last is not None
+        has_previous_page = len(nodes) > last
+        del nodes[last:]
+        nodes.reverse()
+    elif first is not None:
+        has_next_page = len(nodes) > first
+        del nodes[first:]
+        if last is not None and len(nodes) > last:
+            has_previous_page = True
+            del nodes[: len(nodes) - last]
+    return make_connection(
+        nodes,
+        map(cursor, nodes),
+        has_previous_page,
+        has_next_page,
+        connection_cls,
+        edge_cls,
+    )
+
+
+def connection_from_keyset(
+    fetch: Fetch[Cursor_],
+    cursor: Callable[[Node_], Cursor_],
+    *,
+    first: Optional[int] = None,
+    after: Optional[Cursor_] = None,
+    last: Optional[int] = None,
+    before: Optional[Cursor_] = None,
+    connection_cls: Type[Connection] = Connection,
+    edge_cls: Type[Edge] = Edge,
+) -> Connection:
+    """Build a connection using keyset pagination.
+
+    `fetch(after, before, limit, backward)` must return the nodes strictly
+    between after and before (when not None), at most limit (when not None);
+    nodes are ordered from after, or from before in reverse order if backward.
+    Only first+1/last+1 nodes are fetched, the additional one being used to
+    compute hasNextPage/hasPreviousPage, and `cursor` gives the cursor of a
+    node."""
+    limit, backward = keyset_parameters(first, last)
+    nodes = list(islice(fetch(after, before, limit, backward), limit))
+    return keyset_connection(
+        nodes, cursor, first, last, backward, connection_cls, edge_cls
+    )
+
+
+async def async_connection_from_keyset(
+    fetch: Fetch[Cursor_],
+    cursor: Callable[[Node_], Cursor_],
+    *,
+    first: Optional[int] = None,
+    after: Optional[Cursor_] = None,
+    last: Optional[int] = None,
+    before: Optional[Cursor_] = None,
+    connection_cls: Type[Connection] = Connection,
+    edge_cls: Type[Edge] = Edge,
+) -> Connection:
+    """Asynchronous version of connection_from_keyset, where fetch can return
+    an awaitable or an async iterable, which stops to be iterated after
+    first+1/last+1 nodes."""
+    limit, backward = keyset_parameters(first, last)
+    result: Union[Iterable, Awaitable, AsyncIterable] = fetch(
+        after, before, limit, backward
+    )
+    if isawaitable(result):
+        result = await result
+    nodes: list
+    if isinstance(result, AsyncIterable):
+        nodes = []
+        if limit != 0:
+            async for node in result:
+                nodes.append(node)
+                if len(nodes) == limit:
+                    break
+            if hasattr(result, "aclose"):
+                await result.aclose()
+    else:
+        nodes = list(islice(cast(Iterable, result), limit))
+    return keyset_connection(
+        nodes, cursor, first, last, backward, connection_cls, edge_cls
+    )
@@ -1,12 +1,16 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from inspect import isawaitable
 from typing import (
+    Any,
     Awaitable,
     Collection,
     Dict,
     Generic,
     List,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
@@ -18,7 +22,7 @@ import graphql
 from apischema import deserialize, deserializer, serialize, serializer, type_name
 from apischema.graphql.interfaces import interface
 from apischema.graphql.resolvers import resolver
-from apischema.graphql.schema import ID
+from apischema.graphql.schema import ID, Query
 from apischema.metadata import skip
 from apischema.ordering import order
 from apischema.type_names import get_type_name
@@ -106,6 +110,17 @@ class Node(Generic[Id], ABC):
     ) -> Union[Node_, Awaitable[Node_]]:
         raise NotImplementedError
 
+    @classmethod
+    def get_by_ids(
+        cls: Type[Node_],
+        ids: Sequence[Id],
+        info: Optional[graphql.GraphQLResolveInfo] = None,
+    ) -> Union[Sequence[Optional[Node_]], Awaitable[Sequence[Optional[Node_]]]]:
+        nodes = [cls.get_by_id(id, info) for id in ids]
+        if any(map(isawaitable, nodes)):
+            return gather_nodes(nodes)
+        return cast(Sequence[Node_], nodes)
+
     @classmethod
     def _node_key(cls) -> str:
         node_name = get_type_name(cls).graphql
@@ -119,6 +134,11 @@ class Node(Generic[Id], ABC):
             _tmp_nodes.append(cls)
 
 
+async def gather_nodes(nodes: Sequence[Any]) -> Sequence[Any]:
+    awaited = iter(await asyncio.gather(*filter(isawaitable, nodes)))
+    return [next(awaited) if isawaitable(node) else node for node in nodes]
+
+
 _tmp_nodes: List[Type[Node]] = []
 _nodes: Dict[str, Type[Node]] = {}
 
@@ -126,16 +146,17 @@ _nodes: Dict[str, Type[Node]] = {}
 def process_node(node_cls: Type[Node]):
     if has_type_vars(node_cls) or node_cls.get_by_id is Node.get_by_id:
         return
-    for base in node_cls.__mro__:
-        if base != Node and Node.get_by_id.__name__ in base.__dict__:
-            if not isinstance(
-                base.__dict__[Node.get_by_id.__name__], (classmethod, staticmethod)
-            ):
-                raise TypeError(
-                    f"{node_cls.__name__}.get_by_id must be a"
-                    f" classmethod/staticmethod"
-                )
-            break
+    for method_name in (Node.get_by_id.__name__, Node.get_by_ids.__name__):
+        for base in node_cls.__mro__:
+            if base != Node and method_name in base.__dict__:
+                if not isinstance(
+                    base.__dict__[method_name], (classmethod, staticmethod)
+                ):
+                    raise TypeError(
+                        f"{node_cls.__name__}.{method_name} must be a"
+                        f" classmethod/staticmethod"
+                    )
+                break
     for base in generic_mro(node_cls):
         if get_origin(base) == Node:
             setattr(node_cls, ID_TYPE_ATTR, get_args(base)[0])
@@ -155,3 +176,57 @@ def node(id: ID, info: Optional[graphql.GraphQLResolveInfo] = None) -> Node:
     global_id = deserialize_global_id(id)
     node_type = global_id.node_type
     return node_type.get_by_id(node_type.id_from_global(global_id), info)
+
+
+def check_nodes_count(nodes: Sequence[Optional[Node]], count: int):
+    if len(nodes) != count:
+        raise ValueError(f"get_by_ids returned {len(nodes)} nodes for {count} ids")
+
+
+class SharedNodes:
+    """Nodes awaitable shared between the elements of get_nodes result"""
+
+    def __init__(self, nodes: Awaitable[Sequence[Optional[Node]]], count: int):
+        self.nodes = nodes
+        self.count = count
+        self.future: Optional[asyncio.Future] = None
+
+    async def get_node(self, index: int) -> Optional[Node]:
+        # Future is created when awaited, i.e. when an event loop is running
+        if self.future is None:
+            self.future = asyncio.ensure_future(self.nodes)
+        awaited = await self.future
+        check_nodes_count(awaited, self.count)
+        return awaited[index]
+
+
+def get_nodes(
+    ids: Sequence[ID], info: Optional[graphql.GraphQLResolveInfo] = None
+) -> Sequence[Optional[Node]]:
+    # ids are grouped by node type in order to make one get_by_ids call by type
+    ids_by_type: Dict[Type[Node], Dict[int, Any]] = {}
+    for index, id in enumerate(ids):
+        global_id = deserialize_global_id(id)
+        node_type = global_id.node_type
+        ids_by_type.setdefault(node_type, {})[index] = node_type.id_from_global(
+            global_id
+        )
+    results: List[Any] = [None] * len(ids)
+    for node_type, type_ids in ids_by_type.items():
+        nodes = node_type.get_by_ids(list(type_ids.values()), info)
+        if isawaitable(nodes):
+            # get_nodes is not async in order to be usable with synchronous
+            # execution, so a list of awaitables is returned instead, as
+            # graphql-core awaits list elements
+            shared = SharedNodes(nodes, len(type_ids))
+            for i, index in enumerate(type_ids):
+                results[index] = shared.get_node(i)
+        else:
+            sync_nodes = cast(Sequence[Optional[Node]], nodes)
+            check_nodes_count(sync_nodes, len(type_ids))
+            for index, node in zip(type_ids, sync_nodes):
+                results[index] = node
+    return results
+
+
+nodes_query = Query(get_nodes, alias="nodes")
@@ -1,7 +1,8 @@
 from dataclasses import MISSING, Field, field, make_dataclass
 from functools import wraps
-from inspect import Parameter, signature
+from inspect import Parameter, isawaitable, signature
 from typing import (
+    Any,
     Awaitable,
     Callable,
     ClassVar,
@@ -18,8 +19,11 @@ from typing import (
 from graphql.pyutils import camel_to_snake
 
 from apischema.aliases import alias
+from apischema.cache import cache
+from apischema.deserialization import deserialization_method
 from apischema.graphql.schema import Mutation as Mutation_
 from apischema.schemas import Schema
+from apischema.serialization import serialization_method
 from apischema.serialization.serialized_methods import ErrorHandler
 from apischema.type_names import type_name
 from apischema.types import AnyType, Undefined
@@ -37,6 +41,7 @@ class Mutation:
     _schema: ClassVar[Optional[Schema]] = None
     _client_mutation_id: ClassVar[Optional[bool]] = None
     _mutation: ClassVar[Mutation_]  # set in __init_subclass__
+    _input: ClassVar[Type]  # set in __init_subclass__
 
     # Mutate is not defined to prevent Mypy warning about signature of superclass
     mutate: ClassVar[Callable]
@@ -120,6 +125,7 @@ class Mutation:
 
             wrapper = wraps(wrapped)(wrapper)
 
+        cls._input = input_cls
         cls._mutation = Mutation_(
             function=wrapper,
             alias=camel_to_snake(cls.__name__),
@@ -127,6 +133,38 @@ class Mutation:
             error_handler=cls._error_handler,
         )
 
+    @classmethod
+    def deserialize_input(cls: Type[M], data: Any) -> Any:
+        return _mutation_methods(cls)[0](data)
+
+    @classmethod
+    def serialize_payload(cls: Type[M], payload: M) -> Any:
+        return _mutation_methods(cls)[1](payload)
+
+    @classmethod
+    def execute(cls: Type[M], data: Any) -> Any:
+        """Deserialize the mutation input, execute the mutation and serialize its
+        payload, e.g. for a REST endpoint; return an awaitable if mutate is
+        async."""
+        deserialize_input, serialize_payload = _mutation_methods(cls)
+        result = cls._mutation.function(deserialize_input(data))
+        if isawaitable(result):
+            return _serialize_async(serialize_payload, result)
+        return serialize_payload(result)
+
+
+@cache
+def _mutation_methods(
+    cls: Type[Mutation],
+) -> Tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    return deserialization_method(cls._input), serialization_method(cls)
+
+
+async def _serialize_async(
+    serialize_payload: Callable[[Any], Any], result: Awaitable
+) -> Any:
+    return serialize_payload(await result)
+
 
 def _mutations(cls: Type[Mutation] = Mutation) -> Iterator[Type[Mutation]]:
     for base in cls.__subclasses__():
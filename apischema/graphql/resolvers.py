@@ -1,8 +1,10 @@
-from collections import defaultdict
+import asyncio
+from collections import OrderedDict, abc, defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from functools import lru_cache
-from inspect import Parameter, signature
+from functools import lru_cache, partial
+from inspect import Parameter, isawaitable, signature
+from time import monotonic, perf_counter
 from typing import (
     Any,
     Awaitable,
@@ -17,6 +19,7 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
+    Union,
     overload,
 )
 
@@ -24,11 +27,11 @@ import graphql
 
 from apischema import UndefinedType
 from apischema.aliases import Aliaser
-from apischema.cache import CacheAwareDict, cache
+from apischema.cache import CacheAwareDict, cache, reset
 from apischema.conversions import Conversion
 from apischema.conversions.conversions import AnyConversion, DefaultConversion
 from apischema.deserialization import deserialization_method
-from apischema.methods import method_registerer
+from apischema.methods import METHOD_WRAPPER_ATTR, method_registerer
 from apischema.objects import ObjectField
 from apischema.ordering import Ordering
 from apischema.schemas import Schema
@@ -48,9 +51,11 @@ from apischema.serialization.serialized_methods import serialized as register_se
 from apischema.types import AnyType, NoneType, Undefined
 from apischema.typing import is_type
 from apischema.utils import (
+    PREFIX,
     awaitable_origin,
     empty_dict,
     get_args2,
+    get_origin2,
     get_origin_or_type2,
     identity,
     is_async,
@@ -114,16 +119,65 @@ def unwrap_awaitable(tp: AnyType) -> AnyType:
         return tp
 
 
+def unwrap_batch(tp: AnyType) -> AnyType:
+    origin = get_origin2(tp)
+    if origin is None or not issubclass(origin, abc.Sequence):
+        raise TypeError("Batch resolver must return a Sequence")
+    return keep_annotations(get_args2(tp)[0] if get_args2(tp) else Any, tp)
+
+
+class ResolverCache:
+    """Cache of resolvers results, keyed by parent object and arguments.
+
+    Entries are evicted in LRU order when maxsize is reached, and after ttl
+    seconds if ttl is not None."""
+
+    def __init__(self, maxsize: Optional[int] = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[Any, Any, float]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        if key not in self._entries:
+            return Undefined
+        _, value, expiration = self._entries[key]
+        if self.ttl is not None and expiration < monotonic():
+            del self._entries[key]
+            return Undefined
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, obj: Any, value: Any):
+        # obj is kept alive with the entry, so its id cannot be reused
+        expiration = monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (obj, value, expiration)
+        self._entries.move_to_end(key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Any):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
 @dataclass(frozen=True)
 class Resolver(SerializedMethod):
     parameters: Sequence[Parameter]
     parameters_metadata: Mapping[str, Mapping]
+    batch: bool = False
+    cache: Union[bool, ResolverCache] = False
+    cost: Optional[float] = None
 
     def error_type(self) -> AnyType:
         return unwrap_awaitable(super().error_type())
 
     def return_type(self, return_type: AnyType) -> AnyType:
-        return super().return_type(unwrap_awaitable(return_type))
+        return_type = unwrap_awaitable(return_type)
+        if self.batch:
+            return_type = unwrap_batch(return_type)
+        return super().return_type(return_type)
 
 
 _resolvers: MutableMapping[Type, Dict[str, Resolver]] = CacheAwareDict(
@@ -173,6 +227,9 @@ def resolver(
     schema: Optional[Schema] = None,
     parameters_metadata: Optional[Mapping[str, Mapping]] = None,
     serialized: bool = False,
+    batch: bool = False,
+    cache: Union[bool, ResolverCache] = False,
+    cost: Optional[float] = None,
     owner: Optional[Type] = None,
 ) -> Callable[[MethodOrProp], MethodOrProp]:
     ...
@@ -188,10 +245,21 @@ def resolver(
     schema: Optional[Schema] = None,
     parameters_metadata: Optional[Mapping[str, Mapping]] = None,
     serialized: bool = False,
+    batch: bool = False,
+    cache: Union[bool, ResolverCache] = False,
+    cost: Optional[float] = None,
     owner: Optional[Type] = None,
 ):
+    if batch and serialized:
+        raise TypeError("Batch resolver cannot be used as a serialized method")
+    if batch and cache:
+        raise TypeError("Batch resolver cannot be cached")
+
     def register(func: Callable, owner: Type, alias2: str):
         alias2 = alias or alias2
+        if batch and hasattr(func, METHOD_WRAPPER_ATTR):
+            # batch methods are called on the sequence of objects, not on an instance
+            func = func.__wrapped__  # type: ignore
         _, *parameters = resolver_parameters(func, check_first=owner is None)
         error_handler2 = error_handler
         if error_handler2 is None:
@@ -207,8 +275,13 @@ def resolver(
             schema,
             parameters,
             parameters_metadata or {},
+            batch,
+            cache,
+            cost,
         )
         _resolvers[owner][alias2] = resolver
+        # nested dict assignment is not seen by CacheAwareDict
+        reset()
         if serialized:
             if is_async(func):
                 raise TypeError("Async resolver cannot be used as a serialized method")
@@ -240,6 +313,24 @@ def as_async(func: Callable[[T], U]) -> Callable[[Awaitable[T]], Awaitable[U]]:
     return wrapper
 
 
+COERCED_SCALARS = (bool, float, int, str)
+
+
+def is_coerced_scalar(
+    tp: AnyType,
+    field: ObjectField,
+    default_conversion: Callable[[AnyType], Optional[AnyConversion]],
+) -> bool:
+    if field.deserialization is not None or field.schema is not None:
+        return False
+    if is_union_of(tp, NoneType):
+        args = [arg for arg in get_args2(tp) if arg is not NoneType]
+        if len(args) != 1:
+            return False
+        (tp,) = args
+    return tp in COERCED_SCALARS and default_conversion(tp) is None
+
+
 def resolver_resolve(
     resolver: Resolver,
     types: Mapping[str, AnyType],
@@ -267,16 +358,21 @@ def resolver_resolve(
                 resolver.parameters_metadata.get(param.name, empty_dict),
                 param.default,
             )
-            deserializer = deserialization_method(
-                param_type,
-                additional_properties=False,
-                aliaser=aliaser,
-                coerce=False,
-                conversion=param_field.deserialization,
-                default_conversion=handle_enum,
-                fall_back_on_default=False,
-                schema=param_field.schema,
-            )
+            deserializer: Optional[Callable[[Any], Any]]
+            if is_coerced_scalar(param_type, param_field, handle_enum):
+                # graphql-core has already coerced and checked the scalar value
+                deserializer = None
+            else:
+                deserializer = deserialization_method(
+                    param_type,
+                    additional_properties=False,
+                    aliaser=aliaser,
+                    coerce=False,
+                    conversion=param_field.deserialization,
+                    default_conversion=handle_enum,
+                    fall_back_on_default=False,
+                    schema=param_field.schema,
+                )
             opt_param = is_union_of(param_type, NoneType) or param.default is None
             parameters.append(
                 (
@@ -285,6 +381,7 @@ def resolver_resolve(
                     deserializer,
                     opt_param,
                     param_field.required,
+                    aliaser(param.name),
                 )
             )
     func, error_handler = resolver.func, resolver.error_handler
@@ -292,25 +389,17 @@ def resolver_resolve(
         aliaser, resolver.conversion, default_serialization
     )
 
-    serialize_result: Callable[[Any], Any]
-    if not serialized:
-        serialize_result = identity
-    elif is_async(resolver.func):
-        serialize_result = as_async(method_factory(types["return"]).serialize)
-    else:
-        serialize_result = method_factory(types["return"]).serialize
-    serialize_error: Optional[Callable[[Any], Any]]
-    if error_handler is None:
-        serialize_error = None
-    elif is_async(error_handler):
-        serialize_error = as_async(method_factory(resolver.error_type()).serialize)
-    else:
-        serialize_error = method_factory(resolver.error_type()).serialize
-
-    def resolve(__self, __info, **kwargs):
+    def deserialize_arguments(__info, kwargs: Mapping[str, Any]) -> Dict[str, Any]:
         values = {}
         errors: Dict[str, ValidationError] = {}
-        for alias, param_name, deserializer, opt_param, required in parameters:
+        for (
+            alias,
+            param_name,
+            deserializer,
+            opt_param,
+            required,
+            error_alias,
+        ) in parameters:
             if alias in kwargs:
                 # It is possible for the parameter to be non-optional in Python
                 # type hints but optional in the generated schema. In this case
@@ -319,10 +408,13 @@ def resolver_resolve(
                 if not opt_param and kwargs[alias] is None:
                     assert not required
                     continue
+                if deserializer is None:
+                    values[param_name] = kwargs[alias]
+                    continue
                 try:
                     values[param_name] = deserializer(kwargs[alias])
                 except ValidationError as err:
-                    errors[aliaser(param_name)] = err
+                    errors[error_alias] = err
             elif opt_param and required:
                 values[param_name] = None
 
@@ -331,6 +423,44 @@ def resolver_resolve(
             raise ValueError(ValidationError(children=errors).errors)  # type: ignore
         if info_parameter:
             values[info_parameter] = __info
+        return values
+
+    serialize_error: Optional[Callable[[Any], Any]]
+    if error_handler is None:
+        serialize_error = None
+    elif is_async(error_handler):
+        serialize_error = as_async(method_factory(resolver.error_type()).serialize)
+    else:
+        serialize_error = method_factory(resolver.error_type()).serialize
+
+    if resolver.batch:
+        return batch_resolve(
+            func,
+            deserialize_arguments,
+            method_factory(types["return"]).serialize,
+            error_handler,
+            serialize_error,
+        )
+
+    serialize_result: Callable[[Any], Any]
+    if not serialized:
+        serialize_result = identity
+    elif is_async(resolver.func):
+        serialize_result = as_async(method_factory(types["return"]).serialize)
+    else:
+        serialize_result = method_factory(types["return"]).serialize
+
+    def resolve_without_parameters(__self, __info, **kwargs):
+        try:
+            return serialize_result(func(__self))
+        except Exception as error:
+            if error_handler is None:
+                raise
+            assert serialize_error is not None
+            return serialize_error(error_handler(error, __self, __info, **kwargs))
+
+    def resolve_with_parameters(__self, __info, **kwargs):
+        values = deserialize_arguments(__info, kwargs)
         try:
             return serialize_result(func(__self, **values))
         except Exception as error:
@@ -339,4 +469,190 @@ def resolver_resolve(
             assert serialize_error is not None
             return serialize_error(error_handler(error, __self, __info, **kwargs))
 
+    resolve: Callable[..., Any] = (
+        resolve_with_parameters if resolver.parameters else resolve_without_parameters
+    )
+    if not resolver.cache:
+        return resolve
+    # results of a resolver using the info may depend on the request, so a shared
+    # cache must not serve them to other contexts
+    return cached_resolve(
+        resolve, resolver.cache, by_context=info_parameter is not None
+    )
+
+
+def hashable_arguments(data: Any) -> Any:
+    if isinstance(data, list):
+        return list, tuple(map(hashable_arguments, data))
+    elif isinstance(data, dict):
+        return dict, tuple((k, hashable_arguments(v)) for k, v in sorted(data.items()))
+    else:
+        return data
+
+
+CONTEXT_CACHE_ATTR = f"{PREFIX}resolver_cache"
+
+
+def context_cache(context: Any) -> Optional[ResolverCache]:
+    if isinstance(context, abc.MutableMapping):
+        return context.setdefault(CONTEXT_CACHE_ATTR, ResolverCache(None))
+    try:
+        return getattr(context, CONTEXT_CACHE_ATTR)
+    except AttributeError:
+        pass
+    try:
+        setattr(context, CONTEXT_CACHE_ATTR, ResolverCache(None))
+    except AttributeError:
+        return None
+    return getattr(context, CONTEXT_CACHE_ATTR)
+
+
+def discard_failure(cache: ResolverCache, key: Any, future: asyncio.Future):
+    if future.cancelled() or future.exception() is not None:
+        cache.discard(key)
+
+
+def cached_resolve(
+    resolve: Callable, cache: Union[bool, ResolverCache], by_context: bool = False
+) -> Callable:
+    """If by_context is True, entries are not shared between contexts, which is
+    needed when cache is not stored in the context"""
+
+    def wrapper(__self, __info, **kwargs):
+        if isinstance(cache, ResolverCache):
+            store: Optional[ResolverCache] = cache
+        else:
+            store = context_cache(__info.context)
+        if store is None:
+            return resolve(__self, __info, **kwargs)
+        try:
+            key: Any = (resolve, id(__self), hashable_arguments(kwargs))
+            if by_context:
+                key = (*key, id(__info.context))
+            hash(key)
+        except TypeError:
+            return resolve(__self, __info, **kwargs)
+        result = store.get(key)
+        if result is Undefined:
+            result = resolve(__self, __info, **kwargs)
+            if isawaitable(result):
+                # a coroutine can only be awaited once, contrary to a future
+                result = asyncio.ensure_future(result)
+                result.add_done_callback(partial(discard_failure, store, key))
+            # objects are kept alive with the entry, so their ids cannot be reused
+            store.set(key, (__self, __info.context) if by_context else __self, result)
+        return result
+
+    return wrapper
+
+
+Timing = Callable[[graphql.GraphQLResolveInfo, float], Any]
+
+
+def timed_resolve(resolve: Callable, timing: Timing) -> Callable:
+    async def wait_result(__info, result: Awaitable, start: float):
+        try:
+            return await result
+        finally:
+            timing(__info, perf_counter() - start)
+
+    def wrapper(__self, __info, **kwargs):
+        start = perf_counter()
+        try:
+            result = resolve(__self, __info, **kwargs)
+        except Exception:
+            timing(__info, perf_counter() - start)
+            raise
+        if isawaitable(result):
+            return wait_result(__info, result, start)
+        timing(__info, perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+Batch = Tuple[Dict[str, Any], list, list]
+
+
+def batch_resolve(
+    func: Callable,
+    deserialize_arguments: Callable[[Any, Mapping[str, Any]], Dict[str, Any]],
+    serialize_result: Callable[[Any], Any],
+    error_handler: Optional[Callable],
+    serialize_error: Optional[Callable[[Any], Any]],
+) -> Callable:
+    # Objects of an execution resolved during the same event loop iteration with
+    # the same arguments are gathered, and the batch function is called once for all
+    # of them, after graphql-core has finished to walk the current level
+    batches: Dict[Any, Batch] = {}
+
+    def set_results(futures: Sequence[asyncio.Future], results: Any):
+        if len(results) != len(futures):
+            error = ValueError(
+                f"Batch resolver {func.__name__} returned {len(results)}"
+                f" results for {len(futures)} objects"
+            )
+            set_exception(futures, error)
+        else:
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def set_exception(futures: Sequence[asyncio.Future], error: Exception):
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    async def await_results(futures: Sequence[asyncio.Future], results: Awaitable):
+        try:
+            set_results(futures, await results)
+        except Exception as error:
+            set_exception(futures, error)
+
+    def dispatch(key: Any):
+        values, objs, futures = batches.pop(key)
+        try:
+            results = func(objs, **values)
+        except Exception as error:
+            set_exception(futures, error)
+            return
+        if isawaitable(results):
+            asyncio.ensure_future(await_results(futures, results))
+        else:
+            set_results(futures, results)
+
+    async def wait_result(__self, __info, future: asyncio.Future, kwargs):
+        try:
+            return serialize_result(await future)
+        except Exception as error:
+            if error_handler is None:
+                raise
+            assert serialize_error is not None
+            result = serialize_error(error_handler(error, __self, __info, **kwargs))
+            return (await result) if isawaitable(result) else result
+
+    def resolve(__self, __info, **kwargs):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise TypeError("Batch resolver requires asynchronous execution")
+        # Concurrent executions must not be batched together, as the batch is
+        # called with the info (and context) of its first object; fragments
+        # mapping is built for each execution, so it identifies it
+        execution = (loop, id(__info.context), id(__info.fragments))
+        try:
+            key: Any = (execution, hashable_arguments(kwargs))
+            hash(key)
+        except TypeError:
+            key = (execution, object())
+        if key not in batches:
+            # arguments are deserialized once per batch
+            batches[key] = (deserialize_arguments(__info, kwargs), [], [])
+            loop.call_soon(dispatch, key)
+        _, objs, futures = batches[key]
+        future = loop.create_future()
+        objs.append(__self)
+        futures.append(future)
+        return wait_result(__self, __info, future, kwargs)
+
     return resolve
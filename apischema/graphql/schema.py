@@ -30,6 +30,7 @@ import graphql
 
 from apischema import settings
 from apischema.aliases import Aliaser
+from apischema.cache import cache
 from apischema.conversions.conversions import AnyConversion, DefaultConversion
 from apischema.conversions.visitor import (
     Conv,
@@ -38,14 +39,19 @@ from apischema.conversions.visitor import (
     Serialization,
     SerializationVisitor,
 )
+from apischema.graphql.cost import COST_EXTENSION
 from apischema.graphql.interfaces import get_interfaces, is_interface
 from apischema.graphql.resolvers import (
     Resolver,
+    ResolverCache,
+    Timing,
+    cached_resolve,
     get_resolvers,
     none_error_handler,
     partial_serialization_method_factory,
     resolver_parameters,
     resolver_resolve,
+    timed_resolve,
 )
 from apischema.json_schema.schema import get_field_schema, get_method_schema, get_schema
 from apischema.metadata.keys import SCHEMA_METADATA
@@ -58,11 +64,11 @@ from apischema.objects.visitor import (
 from apischema.ordering import Ordering, sort_by_order
 from apischema.recursion import RecursiveConversionsVisitor
 from apischema.schemas import Schema, merge_schema
-from apischema.serialization import SerializationMethod, serialize
+from apischema.serialization import IDENTITY_METHOD, SerializationMethod, serialize
 from apischema.serialization.serialized_methods import ErrorHandler
 from apischema.type_names import TypeName, TypeNameFactory, get_type_name
 from apischema.types import AnyType, NoneType, Undefined, UndefinedType
-from apischema.typing import get_args, get_origin, is_annotated
+from apischema.typing import get_args, get_origin, is_annotated, is_type
 from apischema.utils import (
     Lazy,
     as_predicate,
@@ -164,6 +170,7 @@ class ResolverField:
     parameters: Sequence[Parameter]
     metadata: Mapping[str, Mapping]
     subscribe: Optional[Callable] = None
+    share_events: bool = False
 
 
 IdPredicate = Callable[[AnyType], bool]
@@ -558,6 +565,20 @@ class InputSchemaBuilder(
 Func = TypeVar("Func", bound=Callable)
 
 
+EVENT_CACHE_SIZE = 16
+
+
+# Values of these types are never callable, so they can be resolved by
+# graphql-core default resolver
+def is_leaf_value_type(tp: AnyType) -> bool:
+    if is_union_of(tp, NoneType):
+        args = [arg for arg in get_args2(tp) if arg is not NoneType]
+        if len(args) != 1:
+            return False
+        (tp,) = args
+    return tp in (bool, float, int, str) or (is_type(tp) and issubclass(tp, Enum))
+
+
 class OutputSchemaBuilder(
     SchemaBuilder[Serialization, graphql.GraphQLOutputType],
     SerializationVisitor[TypeFactory[graphql.GraphQLOutputType]],
@@ -591,6 +612,7 @@ class OutputSchemaBuilder(
         # Share the same cache for input_builder in order to share scalar types
         self.input_builder._cache_by_name = self._cache_by_name
         self.get_flattened: Optional[Callable[[Any], Any]] = None
+        self.timing: Optional[Timing] = None
 
     def _field_serialization_method(self, field: ObjectField) -> SerializationMethod:
         return partial_serialization_method_factory(
@@ -610,11 +632,27 @@ class OutputSchemaBuilder(
 
     def _field(self, tp: AnyType, field: ObjectField) -> Lazy[graphql.GraphQLField]:
         field_name = field.name
-        partial_serialize = self._field_serialization_method(field).serialize
+        partial_method = self._field_serialization_method(field)
+        partial_serialize = partial_method.serialize
+        resolve: Optional[Callable]
+        if (
+            partial_method is IDENTITY_METHOD
+            and self.get_flattened is None
+            and is_leaf_value_type(field.type)
+        ):
+            if self.aliaser(field_name) == field_name:
+                # graphql-core default resolver does the same getattr
+                resolve = None
+            else:
 
-        @self._wrap_resolve
-        def resolve(obj, _):
-            return partial_serialize(getattr(obj, field_name))
+                def resolve(obj, _):
+                    return getattr(obj, field_name)
+
+        else:
+
+            @self._wrap_resolve
+            def resolve(obj, _):
+                return partial_serialize(getattr(obj, field_name))
 
         factory = self.visit_with_conv(field.type, field.serialization)
         field_schema = get_field_schema(tp, field)
@@ -638,6 +676,13 @@ class OutputSchemaBuilder(
                 self.default_conversion,
             )
         )
+        if field.share_events:
+            # Subscribers with the same context resolve the same events only once
+            resolve = cached_resolve(
+                resolve, ResolverCache(EVENT_CACHE_SIZE), by_context=True
+            )
+        if self.timing is not None:
+            resolve = timed_resolve(resolve, self.timing)
         args = None
         if field.parameters is not None:
             args = {}
@@ -696,6 +741,11 @@ class OutputSchemaBuilder(
             field.subscribe,
             get_description(field_schema),
             get_deprecated(field_schema),
+            extensions=(
+                {COST_EXTENSION: field.resolver.cost}
+                if field.resolver.cost is not None
+                else None
+            ),
         )
 
     def _visit_flattened(
@@ -825,7 +875,11 @@ class Operation(Generic[T]):
     error_handler: ErrorHandler = Undefined
     order: Optional[Ordering] = None
     schema: Optional[Schema] = None
-    parameters_metadata: Mapping[str, Mapping] = field_(default_factory=dict)
+    # Metadata mappings are not hashable, but still compared
+    parameters_metadata: Mapping[str, Mapping] = field_(
+        default_factory=dict, hash=False
+    )
+    cost: Optional[float] = None
 
 
 class Query(Operation):
@@ -839,6 +893,7 @@ class Mutation(Operation):
 @dataclass(frozen=True)
 class Subscription(Operation[AsyncIterable]):
     resolver: Optional[Callable] = None
+    share_events: bool = False
 
 
 Op = TypeVar("Op", bound=Operation)
@@ -879,6 +934,7 @@ def operation_resolver(operation: Union[Callable, Op], op_class: Type[Op]) -> Re
         operation.schema,
         parameters,
         operation.parameters_metadata,
+        cost=operation.cost,
     )
 
 
@@ -901,7 +957,62 @@ def graphql_schema(
     union_name: UnionNameFactory = "Or".join,
     default_deserialization: Optional[DefaultConversion] = None,
     default_serialization: Optional[DefaultConversion] = None,
+    timing: Optional[Timing] = None,
+    use_cache: bool = False,
 ) -> graphql.GraphQLSchema:
+    if use_cache:
+        # Iterables are consumed once, in case the cache cannot be used
+        query, mutation = tuple(query), tuple(mutation)
+        subscription, types = tuple(subscription), tuple(types)
+        directives_key = tuple(directives) if directives is not None else None
+        extensions_key = tuple(extensions.items()) if extensions is not None else None
+        enum_schemas_key = (
+            tuple(enum_schemas.items()) if enum_schemas is not None else None
+        )
+        id_types_key: Union[Collection[AnyType], IdPredicate] = (
+            id_types if callable(id_types) else tuple(id_types)
+        )
+        try:
+            hash(
+                (
+                    query,
+                    mutation,
+                    subscription,
+                    types,
+                    directives_key,
+                    extensions_key,
+                    aliaser,
+                    enum_aliaser,
+                    enum_schemas_key,
+                    id_types_key,
+                    id_encoding,
+                    union_name,
+                    default_deserialization,
+                    default_serialization,
+                    timing,
+                )
+            )
+        except TypeError:
+            pass
+        else:
+            return cached_graphql_schema(
+                query,
+                mutation,
+                subscription,
+                types,
+                directives_key,
+                description,
+                extensions_key,
+                aliaser,
+                enum_aliaser,
+                enum_schemas_key,
+                id_types_key,
+                id_encoding,
+                union_name,
+                default_deserialization,
+                default_serialization,
+                timing,
+            )
     if aliaser is None:
         aliaser = settings.aliaser
     if enum_aliaser is None:
@@ -942,6 +1053,7 @@ def graphql_schema(
                 sub_op.schema,
                 sub_parameters,
                 sub_op.parameters_metadata,
+                cost=sub_op.cost,
             )
             sub_types = resolver.types()
             subscriber = replace(subscriber2, error_handler=None)
@@ -964,6 +1076,7 @@ def graphql_schema(
                 sub_op.schema,
                 (),
                 {},
+                cost=sub_op.cost,
             )
             subscriber = replace(subscriber2, error_handler=None)
             sub_parameters = subscriber.parameters
@@ -984,7 +1097,12 @@ def graphql_schema(
             sub_types = {**sub_types, "return": resolver.return_type(event_type)}
 
         resolver_field = ResolverField(
-            resolver, sub_types, sub_parameters, sub_op.parameters_metadata, subscribe
+            resolver,
+            sub_types,
+            sub_parameters,
+            sub_op.parameters_metadata,
+            subscribe,
+            sub_op.share_events,
         )
         subscription_fields.append(resolver_field)
 
@@ -1011,6 +1129,7 @@ def graphql_schema(
         union_name,
         default_deserialization,
     )
+    output_builder.timing = timing
 
     def root_type(
         name: str, fields: Sequence[ResolverField]
@@ -1036,3 +1155,42 @@ def graphql_schema(
         description=description,
         extensions=extensions,
     )
+
+
+@cache
+def cached_graphql_schema(
+    query: Tuple[Union[Callable, Query], ...],
+    mutation: Tuple[Union[Callable, Mutation], ...],
+    subscription: Tuple[Union[Callable[..., AsyncIterable], Subscription], ...],
+    types: Tuple[Type, ...],
+    directives: Optional[Tuple[graphql.GraphQLDirective, ...]],
+    description: Optional[str],
+    extensions: Optional[Tuple[Tuple[str, Any], ...]],
+    aliaser: Optional[Aliaser],
+    enum_aliaser: Optional[Aliaser],
+    enum_schemas: Optional[Tuple[Tuple[Enum, Schema], ...]],
+    id_types: Union[Collection[AnyType], IdPredicate],
+    id_encoding: Tuple[Optional[Callable[[str], Any]], Optional[Callable[[Any], str]]],
+    union_name: UnionNameFactory,
+    default_deserialization: Optional[DefaultConversion],
+    default_serialization: Optional[DefaultConversion],
+    timing: Optional[Timing],
+) -> graphql.GraphQLSchema:
+    return graphql_schema(
+        query=query,
+        mutation=mutation,
+        subscription=subscription,
+        types=types,
+        directives=directives,
+        description=description,
+        extensions=dict(extensions) if extensions is not None else None,
+        aliaser=aliaser,
+        enum_aliaser=enum_aliaser,
+        enum_schemas=dict(enum_schemas) if enum_schemas is not None else None,
+        id_types=id_types,
+        id_encoding=id_encoding,
+        union_name=union_name,
+        default_deserialization=default_deserialization,
+        default_serialization=default_serialization,
+        timing=timing,
+    )
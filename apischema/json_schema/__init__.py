@@ -1,9 +1,14 @@
 __all__ = [
     "JsonSchemaVersion",
+    "SchemaChange",
+    "compile_validator",
     "definitions_schema",
     "deserialization_schema",
+    "diff_schemas",
     "serialization_schema",
 ]
 
+from .diff import SchemaChange, diff_schemas
 from .schema import definitions_schema, deserialization_schema, serialization_schema
+from .validator import compile_validator
 from .versions import JsonSchemaVersion
@@ -0,0 +1,539 @@
+from dataclasses import dataclass
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+Location = Tuple[Union[str, int], ...]
+
+ANNOTATIONS = {
+    "$schema",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "example",
+    "deprecated",
+    "readOnly",
+    "writeOnly",
+    "$comment",
+    "discriminator",
+}
+# Lower bounds narrow the accepted data when increased, upper bounds when decreased
+LOWER_BOUNDS = {"minimum", "exclusiveMinimum", "minLength", "minItems", "minProperties"}
+UPPER_BOUNDS = {"maximum", "exclusiveMaximum", "maxLength", "maxItems", "maxProperties"}
+# Modifications of these keywords cannot be classified, they are considered as both
+# narrowing and widening
+OPAQUE = ["format", "multipleOf", "pattern"]
+SUBSCHEMAS = ["items", "additionalProperties", "unevaluatedProperties"]
+ALTERNATIVES = ["anyOf", "oneOf"]
+HANDLED = {
+    "$ref",
+    "type",
+    "nullable",
+    "enum",
+    "const",
+    "properties",
+    "required",
+    "patternProperties",
+    "dependentRequired",
+    "prefixItems",
+    "allOf",
+    "uniqueItems",
+    *ANNOTATIONS,
+    *LOWER_BOUNDS,
+    *UPPER_BOUNDS,
+    *OPAQUE,
+    *SUBSCHEMAS,
+    *ALTERNATIVES,
+}
+
+
+@dataclass(frozen=True)
+class SchemaChange:
+    location: Location
+    description: str
+    breaking: bool
+
+
+@dataclass(frozen=True)
+class _Change:
+    location: Location
+    description: str
+    narrowing: bool
+    widening: bool
+
+    def prefixed(self, prefix: Location) -> "_Change":
+        return _Change(
+            (*prefix, *self.location), self.description, self.narrowing, self.widening
+        )
+
+
+def ref_name(ref: str) -> str:
+    return ref.rsplit("/", 1)[-1]
+
+
+def accepted_types(schema: Mapping[str, Any]) -> Optional[AbstractSet[str]]:
+    if "type" not in schema:
+        return None
+    types = schema["type"]
+    result = {types} if isinstance(types, str) else set(types)
+    if "number" in result:
+        result.add("integer")
+    if schema.get("nullable"):
+        result.add("null")
+    return result
+
+
+def json_key(value: Any) -> Any:
+    # JSON values are compared by value, but true is not 1
+    if isinstance(value, list):
+        return tuple(map(json_key, value))
+    elif isinstance(value, dict):
+        return tuple(sorted((k, json_key(v)) for k, v in value.items()))
+    else:
+        return value.__class__ is bool, value
+
+
+def enum_values(schema: Mapping[str, Any]) -> Optional[Mapping[Any, Any]]:
+    if "const" in schema:
+        return {json_key(schema["const"]): schema["const"]}
+    elif "enum" in schema:
+        return {json_key(value): value for value in schema["enum"]}
+    else:
+        return None
+
+
+def alternative_group(alt: Any) -> Any:
+    if isinstance(alt, Mapping) and "$ref" in alt:
+        return "$ref", ref_name(alt["$ref"])
+    elif isinstance(alt, Mapping):
+        return "type", json_key(alt.get("type"))
+    else:
+        return "schema", json_key(alt)
+
+
+def similarity(old: Any, new: Any) -> Tuple[bool, bool, int]:
+    """Equality, same title, then number of common properties/required/values"""
+    if not isinstance(old, Mapping) or not isinstance(new, Mapping):
+        return old == new, False, 0
+    common = 0
+    for keyword in ("properties", "required"):
+        common += len(set(old.get(keyword, ())) & set(new.get(keyword, ())))
+    old_values, new_values = enum_values(old), enum_values(new)
+    if old_values is not None and new_values is not None:
+        common += len(old_values.keys() & new_values.keys())
+    same_title = "title" in old and old["title"] == new.get("title")
+    return json_key(old) == json_key(new), same_title, common
+
+
+class SchemaDiffer:
+    def __init__(
+        self, old_definitions: Mapping[str, Any], new_definitions: Mapping[str, Any]
+    ):
+        self.old_definitions = old_definitions
+        self.new_definitions = new_definitions
+        self.definitions_changes: List[List[_Change]] = []
+        # Shared definitions are compared only once, whatever the number of their
+        # references, and recursion stops on definitions already being compared
+        self._compared: Dict[Tuple[str, str], Sequence[_Change]] = {}
+
+    def _resolve(self, schema: Any, definitions: Mapping[str, Any]) -> Any:
+        seen = set()
+        while isinstance(schema, Mapping) and "$ref" in schema:
+            name = ref_name(schema["$ref"])
+            if name in seen or name not in definitions:
+                break
+            seen.add(name)
+            schema = definitions[name]
+        return schema
+
+    def _refs(self, old_ref: str, new_ref: str, location: Location) -> List[_Change]:
+        old_name, new_name = ref_name(old_ref), ref_name(new_ref)
+        if old_name not in self.old_definitions or new_name not in self.new_definitions:
+            if old_ref == new_ref:
+                return []
+            return [_Change(location, f"reference {old_ref} -> {new_ref}", True, True)]
+        key = (old_name, new_name)
+        if key not in self._compared:
+            self._compared[key] = ()
+            # Reserve the place before the changes of nested definitions
+            definition_changes: List[_Change] = []
+            self.definitions_changes.append(definition_changes)
+            changes = self.diff(
+                self.old_definitions[old_name], self.new_definitions[new_name], ()
+            )
+            self._compared[key] = changes
+            if old_name == new_name:
+                definition_changes.extend(
+                    change.prefixed(("$defs", old_name)) for change in changes
+                )
+        if old_name == new_name:
+            return []
+        return [change.prefixed(location) for change in self._compared[key]]
+
+    def diff(self, old: Any, new: Any, location: Location) -> List[_Change]:
+        # Equal schemas can still reference modified definitions, so there is no
+        # shortcut on equality
+        if isinstance(old, Mapping) and isinstance(new, Mapping):
+            if "$ref" in old and "$ref" in new:
+                ref_changes = self._refs(old["$ref"], new["$ref"], location)
+                old_rest = {k: v for k, v in old.items() if k != "$ref"}
+                new_rest = {k: v for k, v in new.items() if k != "$ref"}
+                return ref_changes + self.diff(old_rest, new_rest, location)
+            old = self._resolve(old, self.old_definitions)
+            new = self._resolve(new, self.new_definitions)
+        if old is False or new is False:
+            if old is new:
+                return []
+            elif old is False:
+                return [_Change(location, "schema relaxed", False, True)]
+            else:
+                return [_Change(location, "schema restricted", True, False)]
+        old, new = {} if old is True else old, {} if new is True else new
+        if not old and not new:
+            return []
+        changes: List[_Change] = []
+        self._types(old, new, location, changes)
+        self._enum(old, new, location, changes)
+        self._bounds(old, new, location, changes)
+        self._object(old, new, location, changes)
+        self._array(old, new, location, changes)
+        self._composition(old, new, location, changes)
+        for keyword in OPAQUE:
+            old_value, new_value = old.get(keyword), new.get(keyword)
+            if old_value != new_value:
+                changes.append(
+                    _Change(
+                        (*location, keyword),
+                        f"{keyword} {old_value!r} -> {new_value!r}",
+                        new_value is not None,
+                        old_value is not None,
+                    )
+                )
+        for keyword in SUBSCHEMAS:
+            if keyword in old or keyword in new:
+                old_sub, new_sub = old.get(keyword, True), new.get(keyword, True)
+                changes.extend(self.diff(old_sub, new_sub, (*location, keyword)))
+        for keyword in sorted(ANNOTATIONS | (old.keys() | new.keys()) - HANDLED):
+            if old.get(keyword) != new.get(keyword):
+                unknown = keyword not in ANNOTATIONS
+                description = f"{keyword} modified"
+                changes.append(
+                    _Change((*location, keyword), description, unknown, unknown)
+                )
+        return changes
+
+    def _types(
+        self,
+        old: Mapping[str, Any],
+        new: Mapping[str, Any],
+        location: Location,
+        changes: List[_Change],
+    ):
+        old_types, new_types = accepted_types(old), accepted_types(new)
+        if old_types == new_types:
+            return
+        elif old_types is None:
+            assert new_types is not None
+            description = f"type restricted to {sorted(new_types)}"
+            changes.append(_Change((*location, "type"), description, True, False))
+            return
+        elif new_types is None:
+            changes.append(_Change((*location, "type"), "type relaxed", False, True))
+            return
+        removed, added = old_types - new_types, new_types - old_types
+        description = "type"
+        if removed:
+            description += f" removed {sorted(removed)}"
+        if added:
+            description += f" added {sorted(added)}"
+        changes.append(
+            _Change((*location, "type"), description, bool(removed), bool(added))
+        )
+
+    def _enum(
+        self,
+        old: Mapping[str, Any],
+        new: Mapping[str, Any],
+        location: Location,
+        changes: List[_Change],
+    ):
+        old_values, new_values = enum_values(old), enum_values(new)
+        if old_values is None and new_values is None:
+            return
+        keyword = "enum" if "enum" in old or "enum" in new else "const"
+        if old_values is None or new_values is None:
+            changes.append(
+                _Change(
+                    (*location, keyword),
+                    f"{keyword} {'added' if old_values is None else 'removed'}",
+                    old_values is None,
+                    new_values is None,
+                )
+            )
+            return
+        removed = [old_values[k] for k in old_values.keys() - new_values.keys()]
+        added = [new_values[k] for k in new_values.keys() - old_values.keys()]
+        if removed:
+            changes.append(
+                _Change((*location, keyword), f"values removed {removed}", True, False)
+            )
+        if added:
+            changes.append(
+                _Change((*location, keyword), f"values added {added}", False, True)
+            )
+
+    def _bounds(
+        self,
+        old: Mapping[str, Any],
+        new: Mapping[str, Any],
+        location: Location,
+        changes: List[_Change],
+    ):
+        for keyword in sorted(LOWER_BOUNDS | UPPER_BOUNDS):
+            old_bound, new_bound = old.get(keyword), new.get(keyword)
+            if old_bound == new_bound:
+                continue
+            if old_bound is None:
+                narrowing, widening = True, False
+            elif new_bound is None:
+                narrowing, widening = False, True
+            elif keyword in LOWER_BOUNDS:
+                narrowing, widening = new_bound > old_bound, new_bound < old_bound
+            else:
+                narrowing, widening = new_bound < old_bound, new_bound > old_bound
+            changes.append(
+                _Change(
+                    (*location, keyword),
+                    f"{keyword} {old_bound} -> {new_bound}",
+                    narrowing,
+                    widening,
+                )
+            )
+        if old.get("uniqueItems", False) != new.get("uniqueItems", False):
+            unique = new.get("uniqueItems", False)
+            changes.append(
+                _Change(
+                    (*location, "uniqueItems"),
+                    f"uniqueItems {not unique} -> {unique}",
+                    unique,
+                    not unique,
+                )
+            )
+
+    def _object(
+        self,
+        old: Mapping[str, Any],
+        new: Mapping[str, Any],
+        location: Location,
+        changes: List[_Change],
+    ):
+        old_props: Mapping[str, Any] = old.get("properties", {})
+        new_props: Mapping[str, Any] = new.get("properties", {})
+        old_required: AbstractSet[str] = set(old.get("required", ()))
+        new_required: AbstractSet[str] = set(new.get("required", ()))
+        # Undeclared properties are accepted unless additionalProperties is false
+        old_closed = old.get("additionalProperties", True) is False
+        new_closed = new.get("additionalProperties", True) is False
+        for name in [*old_props, *(n for n in new_props if n not in old_props)]:
+            prop_location = (*location, "properties", name)
+            if name not in new_props:
+                description = "property removed"
+                changes.append(
+                    _Change(prop_location, description, new_closed, not new_closed)
+                )
+            elif name not in old_props:
+                changes.append(
+                    _Change(prop_location, "property added", not old_closed, old_closed)
+                )
+            else:
+                changes.extend(
+                    self.diff(old_props[name], new_props[name], prop_location)
+                )
+        for name in sorted(new_required - old_required):
+            changes.append(
+                _Change((*location, "required", name), "required", True, False)
+            )
+        for name in sorted(old_required - new_required):
+            changes.append(
+                _Change((*location, "required", name), "not required", False, True)
+            )
+        old_patterns = old.get("patternProperties", {})
+        new_patterns = new.get("patternProperties", {})
+        for pattern in [
+            *old_patterns,
+            *(pattern for pattern in new_patterns if pattern not in old_patterns),
+        ]:
+            pattern_location = (*location, "patternProperties", pattern)
+            if pattern not in old_patterns or pattern not in new_patterns:
+                changes.append(
+                    _Change(
+                        pattern_location,
+                        "pattern properties modified",
+                        pattern in old_patterns or not old_closed,
+                        pattern in new_patterns or not new_closed,
+                    )
+                )
+            else:
+                changes.extend(
+                    self.diff(
+                        old_patterns[pattern], new_patterns[pattern], pattern_location
+                    )
+                )
+        old_dependent = old.get("dependentRequired", {})
+        new_dependent = new.get("dependentRequired", {})
+        for name in sorted(old_dependent.keys() | new_dependent.keys()):
+            added = set(new_dependent.get(name, ())) - set(old_dependent.get(name, ()))
+            removed = set(old_dependent.get(name, ())) - set(
+                new_dependent.get(name, ())
+            )
+            if added or removed:
+                changes.append(
+                    _Change(
+                        (*location, "dependentRequired", name),
+                        "dependent required modified",
+                        bool(added),
+                        bool(removed),
+                    )
+                )
+
+    def _array(
+        self,
+        old: Mapping[str, Any],
+        new: Mapping[str, Any],
+        location: Location,
+        changes: List[_Change],
+    ):
+        old_prefix, new_prefix = old.get("prefixItems", []), new.get("prefixItems", [])
+        for i in range(max(len(old_prefix), len(new_prefix))):
+            changes.extend(
+                self.diff(
+                    old_prefix[i] if i < len(old_prefix) else old.get("items", True),
+                    new_prefix[i] if i < len(new_prefix) else new.get("items", True),
+                    (*location, "prefixItems", i),
+                )
+            )
+
+    def _alternatives(
+        self, old: Sequence[Any], new: Sequence[Any], location: Location
+    ) -> List[_Change]:
+        # Alternatives are matched by reference, then structurally among the ones
+        # of the same type; the remaining ones are matched if there is only one of
+        # each, otherwise they are considered removed/added
+        groups: Dict[Any, Tuple[List[int], List[int]]] = {}
+        for alts, side in ((old, 0), (new, 1)):
+            for i, alt in enumerate(alts):
+                groups.setdefault(alternative_group(alt), ([], []))[side].append(i)
+        matched: Dict[int, int] = {}
+        added: List[int] = []
+        for old_indices, new_indices in groups.values():
+            pairs = sorted(
+                (
+                    (similarity(old[i], new[j]), i, j)
+                    for i in old_indices
+                    for j in new_indices
+                ),
+                key=lambda pair: pair[0],
+                reverse=True,
+            )
+            old_left, new_left = dict.fromkeys(old_indices), dict.fromkeys(new_indices)
+            for score, i, j in pairs:
+                if any(score) and i in old_left and j in new_left:
+                    matched[i] = j
+                    del old_left[i], new_left[j]
+            if len(old_left) == len(new_left) == 1:
+                matched[next(iter(old_left))] = next(iter(new_left))
+            else:
+                added.extend(new_left)
+        changes: List[_Change] = []
+        for i, alt in enumerate(old):
+            if i in matched:
+                changes.extend(self.diff(alt, new[matched[i]], (*location, matched[i])))
+            else:
+                description = "alternative removed"
+                changes.append(_Change((*location, i), description, True, False))
+        for j in sorted(added):
+            description = "alternative added"
+            changes.append(_Change((*location, j), description, False, True))
+        return changes
+
+    def _composition(
+        self,
+        old: Mapping[str, Any],
+        new: Mapping[str, Any],
+        location: Location,
+        changes: List[_Change],
+    ):
+        for keyword in ALTERNATIVES:
+            if keyword in old and keyword in new:
+                changes.extend(
+                    self._alternatives(old[keyword], new[keyword], (*location, keyword))
+                )
+            elif keyword in old or keyword in new:
+                changes.append(
+                    _Change(
+                        (*location, keyword),
+                        f"{keyword} {'added' if keyword in new else 'removed'}",
+                        keyword in new,
+                        keyword in old,
+                    )
+                )
+        old_all, new_all = old.get("allOf", []), new.get("allOf", [])
+        for i in range(max(len(old_all), len(new_all))):
+            changes.extend(
+                self.diff(
+                    old_all[i] if i < len(old_all) else {},
+                    new_all[i] if i < len(new_all) else {},
+                    (*location, "allOf", i),
+                )
+            )
+
+
+def _definitions(schema: Mapping[str, Any]) -> Mapping[str, Any]:
+    return schema.get("$defs", schema.get("definitions", {}))
+
+
+def diff_schemas(
+    old: Mapping[str, Any],
+    new: Mapping[str, Any],
+    *,
+    old_definitions: Optional[Mapping[str, Any]] = None,
+    new_definitions: Optional[Mapping[str, Any]] = None,
+    serialization: bool = False,
+) -> Sequence[SchemaChange]:
+    """Compute the changes between two generated JSON schemas.
+
+    For a deserialization schema, a change is breaking when data valid for the old
+    schema can be invalid for the new one; for a serialization schema
+    (serialization=True), when data valid for the new schema can be invalid for the
+    old one.
+
+    References are resolved by name in the definitions, which default to the
+    "$defs"/"definitions" of the schemas; definitions with the same name are
+    compared only once, and their changes are located in ("$defs", name)."""
+    differ = SchemaDiffer(
+        _definitions(old) if old_definitions is None else old_definitions,
+        _definitions(new) if new_definitions is None else new_definitions,
+    )
+    root = {k: v for k, v in old.items() if k not in ("$defs", "definitions")}
+    changes = differ.diff(
+        root, {k: v for k, v in new.items() if k not in ("$defs", "definitions")}, ()
+    )
+    for definition_changes in differ.definitions_changes:
+        changes.extend(definition_changes)
+    return [
+        SchemaChange(
+            change.location,
+            change.description,
+            change.widening if serialization else change.narrowing,
+        )
+        for change in changes
+    ]
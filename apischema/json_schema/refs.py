@@ -51,9 +51,16 @@ T = TypeVar("T")
 
 
 class RefsExtractor(ConversionsVisitor, ObjectVisitor, WithConversionsResolver):
-    def __init__(self, default_conversion: DefaultConversion, refs: Refs):
+    def __init__(
+        self,
+        default_conversion: DefaultConversion,
+        refs: Refs,
+        visited_refs: Optional[Collection[str]] = None,
+    ):
+        """If visited_refs is not None, other referenced types are not visited"""
         super().__init__(default_conversion)
         self.refs = refs
+        self.visited_refs = visited_refs
         self._rec_guard: Dict[
             Tuple[AnyType, Optional[AnyConversion]], int
         ] = defaultdict(lambda: 0)
@@ -68,7 +75,9 @@ class RefsExtractor(ConversionsVisitor, ObjectVisitor, WithConversionsResolver):
                     f"Types {tp} and {self.refs[ref][0]} share same reference '{ref}'"
                 )
             self.refs[ref] = (ref_cls, count + 1)
-            return count > 0
+            return count > 0 or (
+                self.visited_refs is not None and ref not in self.visited_refs
+            )
 
     def annotated(self, tp: AnyType, annotations: Sequence[Any]):
         for i, annotation in enumerate(reversed(annotations)):
@@ -1,6 +1,9 @@
+import os
+from concurrent.futures import Executor
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from itertools import chain
 from typing import (
     AbstractSet,
@@ -9,6 +12,7 @@ from typing import (
     ClassVar,
     Collection,
     Dict,
+    Generic,
     List,
     Mapping,
     Optional,
@@ -21,6 +25,7 @@ from typing import (
 )
 
 from apischema.aliases import Aliaser
+from apischema.cache import unbounded_cache
 from apischema.conversions import converters
 from apischema.conversions.conversions import AnyConversion, DefaultConversion
 from apischema.conversions.visitor import (
@@ -72,6 +77,7 @@ from apischema.utils import (
     is_hashable,
     is_union_of,
     literal_values,
+    replace_builtins,
 )
 from apischema.visitor import Unsupported
 
@@ -106,6 +112,7 @@ def full_schema(base_schema: JsonSchema, schema: Optional[Schema]) -> JsonSchema
     return base_schema
 
 
+T = TypeVar("T")
 Method = TypeVar("Method", bound=Callable)
 
 
@@ -554,12 +561,61 @@ def _default_version(
     return version, ref_factory, all_refs
 
 
+@unbounded_cache
+def _direct_refs(
+    builder: Type[SchemaBuilder],
+    tp: AnyType,
+    conversion: Optional[AnyConversion],
+    default_conversion: DefaultConversion,
+    ref: Optional[str],
+) -> Sequence[Tuple[str, AnyType]]:
+    # Referenced types are not visited, except tp itself if it is referenced by ref
+    refs: Refs = {}
+    builder.RefsExtractor(
+        default_conversion, refs, () if ref is None else (ref,)
+    ).visit_with_conv(tp, conversion)
+    return [(ref, ref_tp) for ref, (ref_tp, _) in refs.items()]
+
+
+def _reachable_refs(
+    types: TypesWithConversion,
+    default_conversion: DefaultConversion,
+    builder: Type[SchemaBuilder],
+) -> Mapping[str, AnyType]:
+    refs: Dict[str, AnyType] = {}
+    stack: List[Tuple[str, AnyType]] = []
+    for tp in reversed(list(types)):
+        conversion = None
+        if isinstance(tp, tuple):
+            tp, conversion = tp
+        direct_refs = _direct_refs(builder, tp, conversion, default_conversion, None)
+        stack.extend(reversed(direct_refs))
+    # Depth-first traversal, in order to keep the order of a whole visit
+    while stack:
+        ref, ref_tp = stack.pop()
+        if ref in refs:
+            if replace_builtins(refs[ref]) != replace_builtins(ref_tp):
+                raise ValueError(
+                    f"Types {ref_tp} and {refs[ref]} share same reference '{ref}'"
+                )
+            continue
+        refs[ref] = ref_tp
+        direct_refs = _direct_refs(builder, ref_tp, None, default_conversion, ref)
+        stack.extend(reversed(direct_refs))
+    return refs
+
+
 def _extract_refs(
     types: TypesWithConversion,
     default_conversion: DefaultConversion,
     builder: Type[SchemaBuilder],
     all_refs: bool,
 ) -> Mapping[str, AnyType]:
+    if all_refs:
+        # Reference counts don't matter, so references can be extracted from the
+        # cached direct references of each type, without visiting them again
+        with suppress(TypeError):
+            return _reachable_refs(types, default_conversion, builder)
     refs: Refs = {}
     for tp in types:
         conversion = None
@@ -570,21 +626,124 @@ def _extract_refs(
     return {ref: tp for ref, (tp, count) in refs.items() if filtr(count)}
 
 
+@dataclass(frozen=True)
+class _NotInCacheKey(Generic[T]):
+    value: T = field(compare=False)
+
+
+@unbounded_cache
+def _ref_schema(
+    builder: Type[SchemaBuilder],
+    tp: AnyType,
+    additional_properties: bool,
+    default_conversion: DefaultConversion,
+    ref_factory: RefFactory,
+    refs: _NotInCacheKey[Collection[str]],
+) -> JsonSchema:
+    # With all refs, every reference reachable from tp is a reference, so the
+    # schema doesn't depend on the other types: refs are just a superset of the
+    # references of tp, which would be costly to extract for each type
+    return builder(
+        additional_properties, default_conversion, True, ref_factory, refs.value
+    ).visit(tp)
+
+
+def _build_ref_schema(
+    builder: Type[SchemaBuilder],
+    default_conversion: DefaultConversion,
+    ref_factory: RefFactory,
+    additional_properties: bool,
+    refs: Collection[str],
+    tp: AnyType,
+) -> JsonSchema:
+    return builder(
+        additional_properties, default_conversion, True, ref_factory, refs
+    ).visit(tp)
+
+
 def _refs_schema(
     builder: Type[SchemaBuilder],
     default_conversion: DefaultConversion,
     refs: Mapping[str, AnyType],
     ref_factory: RefFactory,
     additional_properties: bool,
+    all_refs: bool,
+    executor: Optional[Executor] = None,
 ) -> Mapping[str, JsonSchema]:
+    if executor is not None:
+        # Each referenced schema only depends on the set of references, so they
+        # can be built independently; only picklable arguments are sent
+        build = partial(
+            _build_ref_schema,
+            builder,
+            default_conversion,
+            ref_factory,
+            additional_properties,
+            frozenset(refs),
+        )
+        chunksize = len(refs) // (4 * (os.cpu_count() or 1)) or 1
+        schemas = executor.map(build, refs.values(), chunksize=chunksize)
+        return dict(zip(refs, schemas))
+    if all_refs:
+        with suppress(TypeError):
+            return {
+                ref: _ref_schema(
+                    builder,
+                    tp,
+                    additional_properties,
+                    default_conversion,
+                    ref_factory,
+                    _NotInCacheKey(refs),
+                )
+                for ref, tp in refs.items()
+            }
     return {
-        ref: builder(
-            additional_properties, default_conversion, True, ref_factory, refs
-        ).visit(tp)
+        ref: _build_ref_schema(
+            builder, default_conversion, ref_factory, additional_properties, refs, tp
+        )
         for ref, tp in refs.items()
     }
 
 
+WRITTEN_AS_IS = {str, int, float, bool, type(None)}
+
+
+def write_schema(
+    schema: JsonSchema, aliaser: Aliaser, version: JsonSchemaVersion
+) -> Dict[str, Any]:
+    """Convert the schema to its final form, equivalent to (but faster than)
+    serializing JsonSchema with version conversion"""
+    to_version = version.serialization
+
+    def write(obj: Any) -> Any:
+        cls = obj.__class__
+        if cls is JsonSchema or cls is dict:
+            if cls is JsonSchema and to_version is not None:
+                obj = to_version(obj)
+            return {write(key): write(value) for key, value in obj.items()}
+        elif cls is list or cls is tuple:
+            return list(map(write, obj))
+        elif cls in WRITTEN_AS_IS:
+            return obj
+        elif cls is AliasedStr:
+            return aliaser(obj)
+        elif isinstance(obj, Enum):
+            return write(obj.value)
+        elif isinstance(obj, Pattern):
+            return obj.pattern
+        else:
+            return serialize(
+                cls,
+                obj,
+                aliaser=aliaser,
+                check_type=True,
+                default_conversion=converters.default_serialization,
+                fall_back_on_any=True,
+            )
+
+    return write(schema)
+
+
 def _schema(
     builder: Type[SchemaBuilder],
     tp: AnyType,
@@ -613,19 +772,16 @@ def _schema(
     json_schema = full_schema(json_schema, schema)
     if add_defs and version.defs:
         defs = _refs_schema(
-            builder, default_conversion, refs, ref_factory, additional_properties
+            builder,
+            default_conversion,
+            refs,
+            ref_factory,
+            additional_properties,
+            all_refs,
         )
         if defs:
             json_schema["$defs"] = defs
-    result = serialize(
-        JsonSchema,
-        json_schema,
-        aliaser=aliaser,
-        check_type=True,
-        conversion=version.conversion,
-        default_conversion=converters.default_serialization,
-        fall_back_on_any=True,
-    )
+    result = write_schema(json_schema, aliaser, version)
     if with_schema and version.schema is not None:
         result["$schema"] = version.schema
     return result
@@ -698,6 +854,7 @@ def _defs_schema(
     ref_factory: RefFactory,
     all_refs: bool,
     additional_properties: bool,
+    executor: Optional[Executor] = None,
 ) -> Mapping[str, JsonSchema]:
     return _refs_schema(
         builder,
@@ -705,6 +862,8 @@ def _defs_schema(
         _extract_refs(types, default_conversion, builder, all_refs),
         ref_factory,
         additional_properties,
+        all_refs,
+        executor,
     )
 
 
@@ -769,6 +928,7 @@ def definitions_schema(
     ref_factory: Optional[RefFactory] = None,
     all_refs: Optional[bool] = None,
     additional_properties: Optional[bool] = None,
+    executor: Optional[Executor] = None,
 ) -> Mapping[str, Mapping[str, Any]]:
     from apischema import settings
 
@@ -788,6 +948,7 @@ def definitions_schema(
         ref_factory,
         all_refs,
         additional_properties,
+        executor,
     )
     serialization_schemas = _defs_schema(
         serialization,
@@ -796,6 +957,7 @@ def definitions_schema(
         ref_factory,
         all_refs,
         additional_properties,
+        executor,
     )
     schemas = {}
     for ref in deserialization_schemas.keys() | serialization_schemas.keys():
@@ -814,14 +976,5 @@ def definitions_schema(
                 ref, serialization_schemas.get(ref)
             )
     return {
-        ref: serialize(
-            JsonSchema,
-            schema,
-            aliaser=aliaser,
-            fall_back_on_any=True,
-            check_type=True,
-            conversion=version.conversion,
-            default_conversion=converters.default_serialization,
-        )
-        for ref, schema in schemas.items()
+        ref: write_schema(schema, aliaser, version) for ref, schema in schemas.items()
     }
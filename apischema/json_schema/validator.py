@@ -0,0 +1,462 @@
+import re
+from dataclasses import fields
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from apischema.aliases import Aliaser
+from apischema.cache import cache
+from apischema.constraints import CONSTRAINT_METADATA_KEY, Constraints
+from apischema.conversions.conversions import AnyConversion, DefaultConversion
+from apischema.deserialization import constraint_classes
+from apischema.deserialization.methods import Constraint
+from apischema.json_schema.schema import deserialization_schema
+from apischema.json_schema.types import JsonType
+from apischema.json_schema.versions import JsonSchemaVersion
+from apischema.types import AnyType, NoneType
+from apischema.utils import opt_or, to_pascal_case
+
+Check = Callable[[Any], bool]
+
+
+def accept(data: Any) -> bool:
+    return True
+
+
+def reject(data: Any) -> bool:
+    return False
+
+
+def is_number(data: Any) -> bool:
+    return isinstance(data, (int, float)) and data.__class__ is not bool
+
+
+def is_integer(data: Any) -> bool:
+    return isinstance(data, int) and data.__class__ is not bool
+
+
+def is_array(data: Any) -> bool:
+    return isinstance(data, list)
+
+
+def is_object(data: Any) -> bool:
+    return isinstance(data, dict)
+
+
+TYPE_CHECKS: Mapping[str, Check] = {
+    JsonType.NULL.value: lambda data: data is None,
+    JsonType.BOOLEAN.value: lambda data: data.__class__ is bool,
+    JsonType.STRING.value: lambda data: isinstance(data, str),
+    JsonType.INTEGER.value: is_integer,
+    JsonType.NUMBER.value: is_number,
+    JsonType.ARRAY.value: is_array,
+    JsonType.OBJECT.value: is_object,
+}
+# Exact classes of deserialized JSON, checked before falling back on TYPE_CHECKS
+JSON_CLASSES: Mapping[str, Collection[type]] = {
+    JsonType.NULL.value: (NoneType,),
+    JsonType.BOOLEAN.value: (bool,),
+    JsonType.STRING.value: (str,),
+    JsonType.INTEGER.value: (int,),
+    JsonType.NUMBER.value: (int, float),
+    JsonType.ARRAY.value: (list,),
+    JsonType.OBJECT.value: (dict,),
+}
+# Constraints only apply to the data of their type, like in deserialization
+CONSTRAINTS: Mapping[str, Tuple[str, type]] = {
+    metadata.alias: (
+        JsonType.from_type(metadata.cls).value,
+        constraint_classes[to_pascal_case(metadata.alias) + "Constraint"],
+    )
+    for metadata in (f.metadata[CONSTRAINT_METADATA_KEY] for f in fields(Constraints))
+}
+
+
+def all_checks(checks: Sequence[Check]) -> Check:
+    if not checks:
+        return accept
+    elif len(checks) == 1:
+        return checks[0]
+    elif len(checks) == 2:
+        check1, check2 = checks
+        return lambda data: check1(data) and check2(data)
+    checks = tuple(checks)
+
+    def check(data: Any) -> bool:
+        for check in checks:
+            if not check(data):
+                return False
+        return True
+
+    return check
+
+
+def any_check(checks: Sequence[Check]) -> Check:
+    if len(checks) == 1:
+        return checks[0]
+    checks = tuple(checks)
+    return lambda data: any(check(data) for check in checks)
+
+
+def one_check(checks: Sequence[Check]) -> Check:
+    checks = tuple(checks)
+    return lambda data: sum(1 for check in checks if check(data)) == 1
+
+
+def type_check(types: Sequence[str]) -> Check:
+    classes = frozenset(chain.from_iterable(JSON_CLASSES[tp] for tp in types))
+    fallback = any_check([TYPE_CHECKS[tp] for tp in types])
+    return lambda data: data.__class__ in classes or fallback(data)
+
+
+def type_guarded(type_check: Check, check: Check) -> Check:
+    return lambda data: not type_check(data) or check(data)
+
+
+def constraints_check(constraints: Sequence[Constraint]) -> Check:
+    constraints = tuple(constraints)
+
+    def check(data: Any) -> bool:
+        for constraint in constraints:
+            if not constraint.validate(data):
+                return False
+        return True
+
+    return check
+
+
+def enum_check(values: Sequence[Any]) -> Check:
+    # bool is a subclass of int, but true is not 1 in JSON
+    try:
+        hashed = frozenset((v.__class__ is bool, v) for v in values)
+    except TypeError:
+
+        def check(data: Any) -> bool:
+            is_bool = data.__class__ is bool
+            return any(
+                data == value and is_bool == (value.__class__ is bool)
+                for value in values
+            )
+
+    else:
+
+        def check(data: Any) -> bool:
+            try:
+                return (data.__class__ is bool, data) in hashed
+            except TypeError:
+                return False
+
+    return check
+
+
+def array_check(prefix_items: Sequence[Check], items: Optional[Check]) -> Check:
+    if not prefix_items:
+        if items is None:
+            return accept
+        items_check = items
+        return lambda data: all(map(items_check, data))
+    prefix_items = tuple(prefix_items)
+    prefix_len = len(prefix_items)
+
+    def check(data: list) -> bool:
+        for i, elt in enumerate(data[:prefix_len]):
+            if not prefix_items[i](elt):
+                return False
+        if items is not None:
+            for i in range(prefix_len, len(data)):
+                if not items(data[i]):
+                    return False
+        return True
+
+    return check
+
+
+def object_check(
+    properties: Mapping[str, Check],
+    required: Collection[str],
+    dependent_required: Mapping[str, Collection[str]],
+    pattern_properties: Sequence[Tuple[re.Pattern, Check]],
+    additional_properties: Optional[Check],
+    ignored: Collection[str],
+) -> Check:
+    # Like deserialization, patterns only apply to undeclared properties, and each
+    # key is checked against the first pattern it matches
+    properties = dict(properties)
+    required = tuple(required)
+    dependent_required = {
+        key: tuple(requiring) for key, requiring in dependent_required.items()
+    }
+    pattern_properties = tuple(pattern_properties)
+
+    def check(data: dict) -> bool:
+        for key in required:
+            if key not in data:
+                return False
+        for key, value in data.items():
+            if key in properties:
+                if not properties[key](value):
+                    return False
+                if key in dependent_required:
+                    for dependent in dependent_required[key]:
+                        if dependent not in data:
+                            return False
+            elif key not in ignored:
+                for pattern, pattern_check in pattern_properties:
+                    if pattern.match(key):
+                        if not pattern_check(value):
+                            return False
+                        break
+                else:
+                    if additional_properties is not None:
+                        if not additional_properties(value):
+                            return False
+        return True
+
+    return check
+
+
+class ValidatorCompiler:
+    def __init__(self, defs: Mapping[str, Any], ref_prefix: str):
+        self.defs = defs
+        self.ref_prefix = ref_prefix
+        self._refs: Dict[Tuple[str, FrozenSet[str]], Check] = {}
+
+    def _ref_schema(self, ref: str) -> Any:
+        assert ref.startswith(self.ref_prefix)
+        return self.defs[ref[len(self.ref_prefix) :]]
+
+    def ref(self, ref: str, ignored: FrozenSet[str]) -> Check:
+        key = (ref, ignored)
+        if key not in self._refs:
+            # Recursive types refer to themselves while being compiled
+            compiled: List[Check] = []
+            self._refs[key] = lambda data: compiled[0](data)
+            compiled.append(self.compile(self._ref_schema(ref), ignored))
+            self._refs[key] = compiled[0]
+        return self._refs[key]
+
+    def _flattened(self, schema: Mapping[str, Any]) -> Dict[str, Any]:
+        # Flattened fields are generated as allOf + unevaluatedProperties, which
+        # is equivalent to a single object schema with all the properties
+        merged: Dict[str, Any] = {
+            key: value
+            for key, value in schema.items()
+            if key not in ("allOf", "unevaluatedProperties")
+        }
+        merged["type"] = JsonType.OBJECT.value
+        merged["additionalProperties"] = schema["unevaluatedProperties"]
+        for sub_schema in schema["allOf"]:
+            if "$ref" in sub_schema:
+                sub_schema = self._ref_schema(sub_schema["$ref"])
+            if "unevaluatedProperties" in sub_schema:
+                sub_schema = self._flattened(sub_schema)
+            for keyword in ("properties", "patternProperties", "dependentRequired"):
+                if keyword in sub_schema:
+                    merged[keyword] = {**merged.get(keyword, {}), **sub_schema[keyword]}
+            if "required" in sub_schema:
+                merged["required"] = [
+                    *merged.get("required", ()),
+                    *sub_schema["required"],
+                ]
+            if isinstance(sub_schema.get("additionalProperties"), Mapping):
+                merged["additionalProperties"] = sub_schema["additionalProperties"]
+        return merged
+
+    def _discriminator(self, schema: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
+        if "discriminator" in schema:
+            return schema["discriminator"]
+        # Inherited discriminator is put in the schema of the base class, which is
+        # referenced first in the allOf of each alternative
+        discriminators = []
+        for alternative in schema["oneOf"]:
+            if "$ref" not in alternative:
+                return None
+            alt_schema = self._ref_schema(alternative["$ref"])
+            if "allOf" not in alt_schema or "$ref" not in alt_schema["allOf"][0]:
+                return None
+            base_schema = self._ref_schema(alt_schema["allOf"][0]["$ref"])
+            discriminators.append(base_schema.get("discriminator"))
+        if (
+            not discriminators
+            or discriminators[0] is None
+            or any(disc != discriminators[0] for disc in discriminators)
+        ):
+            return None
+        return discriminators[0]
+
+    def _discriminated(
+        self,
+        schema: Mapping[str, Any],
+        discriminator: Mapping[str, Any],
+        ignored: FrozenSet[str],
+    ) -> Check:
+        property_name = discriminator["propertyName"]
+        # The discriminator is accepted as an additional property of the alternative
+        ignored = ignored | {property_name}
+        mapping: Dict[str, Check] = {}
+        for alternative in schema["oneOf"]:
+            if "$ref" not in alternative:
+                alternatives = schema["oneOf"]
+                return any_check([self.compile(alt, ignored) for alt in alternatives])
+            ref = alternative["$ref"]
+            mapping[ref[len(self.ref_prefix) :]] = self.ref(ref, ignored)
+        for key, ref in discriminator.get("mapping", {}).items():
+            mapping[key] = self.ref(ref, ignored)
+
+        def check(data: Any) -> bool:
+            if not isinstance(data, dict):
+                return False
+            try:
+                return mapping[data[property_name]](data)
+            except (KeyError, TypeError):
+                return False
+
+        return check
+
+    def compile(self, schema: Any, ignored: FrozenSet[str] = frozenset()) -> Check:
+        if schema is True:
+            return accept
+        elif schema is False:
+            return reject
+        if "unevaluatedProperties" in schema and "allOf" in schema:
+            schema = self._flattened(schema)
+        checks: List[Check] = []
+        types = schema.get("type")
+
+        def guarded(json_type: str, check: Check) -> Check:
+            # Type is already checked first when it's the only one allowed
+            if types == json_type or (types, json_type) == ("integer", "number"):
+                return check
+            return type_guarded(TYPE_CHECKS[json_type], check)
+
+        if types is not None:
+            checks.append(type_check([types] if isinstance(types, str) else types))
+        if "enum" in schema:
+            checks.append(enum_check(schema["enum"]))
+        if "const" in schema:
+            checks.append(enum_check([schema["const"]]))
+        if "$ref" in schema:
+            checks.append(self.ref(schema["$ref"], ignored))
+        if "allOf" in schema:
+            checks.extend(self.compile(sub, ignored) for sub in schema["allOf"])
+        if "anyOf" in schema:
+            checks.append(
+                any_check([self.compile(sub, ignored) for sub in schema["anyOf"]])
+            )
+        if "oneOf" in schema:
+            discriminator = self._discriminator(schema)
+            if discriminator is not None:
+                checks.append(self._discriminated(schema, discriminator, ignored))
+            else:
+                checks.append(
+                    one_check([self.compile(sub, ignored) for sub in schema["oneOf"]])
+                )
+        constraints: Dict[str, List[Constraint]] = {}
+        for keyword, value in schema.items():
+            if keyword in CONSTRAINTS and value is not False:
+                json_type, constraint_cls = CONSTRAINTS[keyword]
+                if keyword == "pattern":
+                    value = re.compile(value)
+                constraints.setdefault(json_type, []).append(
+                    constraint_cls(keyword, value)
+                )
+        for json_type, type_constraints in constraints.items():
+            checks.append(guarded(json_type, constraints_check(type_constraints)))
+        if "prefixItems" in schema or "items" in schema:
+            items = schema.get("items", True)
+            checks.append(
+                guarded(
+                    JsonType.ARRAY.value,
+                    array_check(
+                        [self.compile(item) for item in schema.get("prefixItems", ())],
+                        None if items is True else self.compile(items),
+                    ),
+                )
+            )
+        if {
+            "properties",
+            "required",
+            "dependentRequired",
+            "patternProperties",
+            "additionalProperties",
+        } & schema.keys():
+            additional = schema.get("additionalProperties", True)
+            checks.append(
+                guarded(
+                    JsonType.OBJECT.value,
+                    object_check(
+                        {
+                            key: self.compile(prop)
+                            for key, prop in schema.get("properties", {}).items()
+                        },
+                        schema.get("required", ()),
+                        schema.get("dependentRequired", {}),
+                        [
+                            (re.compile(pattern), self.compile(prop))
+                            for pattern, prop in schema.get(
+                                "patternProperties", {}
+                            ).items()
+                        ],
+                        None if additional is True else self.compile(additional),
+                        ignored,
+                    ),
+                )
+            )
+        return all_checks(checks)
+
+
+@cache
+def _compile_validator(
+    tp: AnyType,
+    additional_properties: bool,
+    aliaser: Aliaser,
+    conversion: Optional[AnyConversion],
+    default_conversion: DefaultConversion,
+) -> Check:
+    version = JsonSchemaVersion.DRAFT_2020_12
+    schema = deserialization_schema(
+        tp,
+        additional_properties=additional_properties,
+        aliaser=aliaser,
+        conversion=conversion,
+        default_conversion=default_conversion,
+        version=version,
+        with_schema=False,
+    )
+    return ValidatorCompiler(schema.get("$defs", {}), version.ref_prefix).compile(
+        schema
+    )
+
+
+def compile_validator(
+    tp: AnyType,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+) -> Callable[[Any], bool]:
+    """Return a function checking raw JSON data against the deserialization schema
+    of the type, without deserializing it.
+
+    Validators, formats and conversion logic are not executed, so accepted data can
+    still fail deserialization."""
+    from apischema import settings
+
+    return _compile_validator(
+        tp,
+        opt_or(additional_properties, settings.additional_properties),
+        opt_or(aliaser, settings.aliaser),
+        conversion,
+        opt_or(default_conversion, settings.deserialization.default_conversion),
+    )
@@ -1,4 +1,6 @@
+import operator
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Any, Callable, ClassVar, Dict, Optional
 
 from apischema.conversions import Conversion, LazyConversion
@@ -7,15 +9,19 @@ from apischema.json_schema.types import JsonSchema, JsonType
 RefFactory = Callable[[str], str]
 
 
+# Cached to return the same factory, as it is part of schemas cache keys
+@lru_cache()
 def ref_prefix(prefix: str) -> RefFactory:
     if not prefix.endswith("/"):
         prefix += "/"
-    return lambda ref: prefix + ref
+    # partial is picklable, contrary to a lambda
+    return partial(operator.add, prefix)
 
 
 def isolate_ref(schema: Dict[str, Any]):
     if "$ref" in schema and len(schema) > 1:
-        schema.setdefault("allOf", []).append({"$ref": schema.pop("$ref")})
+        # lists are not mutated, as they can be shared with cached schemas
+        schema["allOf"] = [*schema.get("allOf", ()), {"$ref": schema.pop("$ref")}]
 
 
 def to_json_schema_2019_09(schema: JsonSchema) -> Dict[str, Any]:
@@ -60,9 +66,10 @@ def to_open_api_3_0(schema: JsonSchema) -> Dict[str, Any]:
             result.setdefault("nullable", True)
         result["type"] = [t for t in result["type"] if t != "null"]
         if len(result["type"]) > 1:
-            result.setdefault("anyOf", []).extend(
-                {"type": t} for t in result.pop("type")
-            )
+            result["anyOf"] = [
+                *result.get("anyOf", ()),
+                *({"type": t} for t in result.pop("type")),
+            ]
         else:
             result["type"] = result["type"][0]
     if "examples" in result:
@@ -37,13 +37,21 @@ RecursionKey = Tuple[AnyType, Optional[AnyConversion]]
 
 
 class RecursiveChecker(ConversionsVisitor[Conv, Any], ObjectVisitor[Any]):
+    """Compute the strongly connected components of the type graph using Tarjan's
+    algorithm; types of a component with a cycle are recursive.
+
+    Every type reached is analysed exactly once, and the result is stored in the
+    recursion cache when its component is complete."""
+
     def __init__(self, default_conversion: DefaultConversion):
         super().__init__(default_conversion)
         self._cache = recursion_cache(self.__class__)
-        self._recursive: Dict[RecursionKey, Set[RecursionKey]] = {}
-        self._all_recursive: Set[RecursionKey] = set()
-        self._guard: List[RecursionKey] = []
-        self._guard_indices: Dict[RecursionKey, int] = {}
+        self._indices: Dict[RecursionKey, int] = {}
+        self._lowlinks: Dict[RecursionKey, int] = {}
+        self._stack: List[RecursionKey] = []
+        self._on_stack: Set[RecursionKey] = set()
+        self._self_referencing: Set[RecursionKey] = set()
+        self._path: List[RecursionKey] = []
 
     def any(self):
         pass
@@ -81,25 +89,38 @@ class RecursiveChecker(ConversionsVisitor[Conv, Any], ObjectVisitor[Any]):
     def visit(self, tp: AnyType):
         rec_key = (tp, self._conversion)
         if rec_key in self._cache:
-            pass
-        elif rec_key in self._guard_indices:
-            recursive = self._guard[self._guard_indices[rec_key] :]
-            self._recursive.setdefault(rec_key, set()).update(recursive)
-            self._all_recursive.update(recursive)
-        else:
-            self._guard_indices[rec_key] = len(self._guard)
-            self._guard.append(rec_key)
-            try:
-                super().visit(tp)
-            finally:
-                self._guard.pop()
-                self._guard_indices.pop(rec_key)
-            if rec_key in self._recursive:
-                for key in self._recursive[rec_key]:
-                    self._cache[key] = True
-                assert self._cache[rec_key]
-            elif rec_key not in self._all_recursive:
-                self._cache[rec_key] = False
+            return
+        if rec_key in self._indices:
+            # Not in cache, so its component is not complete, i.e. it's on the stack
+            assert rec_key in self._on_stack
+            parent = self._path[-1]
+            if parent == rec_key:
+                self._self_referencing.add(rec_key)
+            self._lowlinks[parent] = min(self._lowlinks[parent], self._indices[rec_key])
+            return
+        index = len(self._indices)
+        self._indices[rec_key] = self._lowlinks[rec_key] = index
+        self._stack.append(rec_key)
+        self._on_stack.add(rec_key)
+        self._path.append(rec_key)
+        try:
+            super().visit(tp)
+        finally:
+            self._path.pop()
+        lowlink = self._lowlinks[rec_key]
+        if lowlink == index:
+            component_index = len(self._stack) - 1
+            while self._stack[component_index] != rec_key:
+                component_index -= 1
+            component = self._stack[component_index:]
+            del self._stack[component_index:]
+            recursive = len(component) > 1 or rec_key in self._self_referencing
+            for key in component:
+                self._on_stack.remove(key)
+                self._cache[key] = recursive
+        if self._path:
+            parent = self._path[-1]
+            self._lowlinks[parent] = min(self._lowlinks[parent], lowlink)
 
 
 class DeserializationRecursiveChecker(
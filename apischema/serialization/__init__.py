@@ -31,6 +31,7 @@ from apischema.objects import AliasedStr, ObjectField, object_fields
 from apischema.objects.visitor import SerializationObjectVisitor
 from apischema.ordering import Ordering, sort_by_order
 from apischema.recursion import RecursiveConversionsVisitor
+from apischema.serialization.memo import memo_scope
 from apischema.serialization.methods import (
     AnyFallback,
     AnyMethod,
@@ -53,6 +54,7 @@ from apischema.serialization.methods import (
     ListMethod,
     MappingCheckOnlyMethod,
     MappingMethod,
+    MemoizedMethod,
     NoFallback,
     NoneMethod,
     ObjectAdditionalMethod,
@@ -63,6 +65,7 @@ from apischema.serialization.methods import (
     SerializedField,
     SimpleField,
     SimpleObjectMethod,
+    SimpleTypedDictMethod,
     StrMethod,
     TupleCheckOnlyMethod,
     TupleMethod,
@@ -138,6 +141,7 @@ class PassThroughOptions:
     dataclasses: bool = False
     enums: bool = False
     tuple: bool = False
+    typed_dicts: bool = False
     types: CollectionOrPredicate[AnyType] = ()
 
     def __post_init__(self):
@@ -175,6 +179,20 @@ def check_only(method: SerializationMethod) -> bool:
     )
 
 
+def is_memoizable(cls: type) -> bool:
+    from apischema import settings
+
+    return (
+        is_dataclass(cls)
+        and cls.__dataclass_params__.frozen  # type: ignore
+        and (
+            not settings.serialization.memoize_across_calls
+            or cls.__weakrefoffset__ != 0
+        )
+        and as_predicate(settings.serialization.memoize)(cls)
+    )
+
+
 class SerializationMethodVisitor(
     RecursiveConversionsVisitor[Serialization, SerializationMethod],
     SerializationVisitor[SerializationMethod],
@@ -360,11 +378,20 @@ class SerializationMethodVisitor(
         fields_to_order = []
         exclude_unset = self.exclude_unset and support_fields_set(cls)
         typed_dict = is_typed_dict(cls)
+        # TypedDict whose items are all kept as is can be copied with a single lookup
+        # per key, or even passed through
+        simple_typed_dict = typed_dict
         for field in fields:
             field_alias = self.aliaser(field.alias) if not field.is_aggregate else None
             field_method = self.visit_with_conv(field.type, field.serialization)
             field_default = ... if field.required else field.get_default()
             base_field: BaseField
+            simple_typed_dict = (
+                simple_typed_dict
+                and field_alias == field.name
+                and field_method is IDENTITY_METHOD
+                and not field.skippable(self.exclude_defaults, self.exclude_none)
+            )
             if (
                 typed_dict
                 or exclude_unset
@@ -420,6 +447,11 @@ class SerializationMethodVisitor(
             method = ObjectAdditionalMethod(
                 base_fields, {f.name for f in fields}, self.any()
             )
+        elif simple_typed_dict and len(base_fields) == len(fields):
+            if self.pass_through_options.typed_dicts and not self._has_skipped_field:
+                method = IDENTITY_METHOD
+            else:
+                method = SimpleTypedDictMethod(tuple(f.name for f in base_fields))
         elif not all(
             isinstance(f, IdentityField) and f.alias == f.name for f in base_fields
         ):
@@ -433,6 +465,10 @@ class SerializationMethodVisitor(
             method = IDENTITY_METHOD
         else:
             method = SimpleObjectMethod(tuple(f.name for f in base_fields))
+        if method is not IDENTITY_METHOD and is_memoizable(cls):
+            from apischema import settings
+
+            method = MemoizedMethod(method, settings.serialization.memoize_across_calls)
         return self._wrap(cls, method)
 
     def primitive(self, cls: Type) -> SerializationMethod:
@@ -509,7 +545,7 @@ class SerializationMethodVisitor(
         converter = conversion.converter
         if converter is identity:
             method = conv_method
-        elif conv_method is identity:
+        elif conv_method is IDENTITY_METHOD:
             method = METHODS.get(converter, WrapperMethod(converter))
         else:
             method = ConversionMethod(converter, conv_method)
@@ -590,7 +626,14 @@ def serialization_method(
         opt_or(no_copy, settings.serialization.no_copy),
         opt_or(pass_through, settings.serialization.pass_through),
     )(type)
-    return optimized_identity if method is IDENTITY_METHOD else method.serialize  # type: ignore
+    if method is IDENTITY_METHOD:
+        return optimized_identity
+    if (
+        settings.serialization.memoize
+        and not settings.serialization.memoize_across_calls
+    ):
+        return memo_scope(method.serialize)
+    return method.serialize
 
 
 NO_OBJ = object()
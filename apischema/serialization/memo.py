@@ -0,0 +1,19 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Kept out of methods module, which is compiled with Cython
+Memo = Dict[Tuple[int, int], Tuple[Any, Any]]
+call_memo: ContextVar[Optional[Memo]] = ContextVar("call_memo", default=None)
+
+
+def memo_scope(serialize: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Share a memo between the memoized objects of a same call."""
+
+    def wrapper(obj: Any) -> Any:
+        token = call_memo.set({})
+        try:
+            return serialize(obj)
+        finally:
+            call_memo.reset(token)
+
+    return wrapper
@@ -1,9 +1,11 @@
+import weakref
 from dataclasses import dataclass, field
 from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple, Union
 
 from apischema.conversions.utils import Converter
 from apischema.fields import FIELDS_SET_ATTR
 from apischema.serialization.errors import TypeCheckError
+from apischema.serialization.memo import call_memo, memo_scope
 from apischema.types import AnyType, Undefined
 from apischema.utils import Lazy
 
@@ -271,6 +273,14 @@ class SimpleObjectMethod(SerializationMethod):
         return {name: getattr(obj, name) for name in self.fields}
 
 
+@dataclass
+class SimpleTypedDictMethod(SerializationMethod):
+    fields: Tuple[str, ...]
+
+    def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
+        return {name: obj[name] for name in self.fields if name in obj}
+
+
 @dataclass
 class ObjectMethod(SerializationMethod):
     fields: Tuple[BaseField, ...]
@@ -295,6 +305,38 @@ class ObjectAdditionalMethod(ObjectMethod):
         return result
 
 
+@dataclass
+class MemoizedMethod(SerializationMethod):
+    method: SerializationMethod
+    shared: bool
+    memo: Dict[int, Any] = field(init=False)
+
+    def __post_init__(self):
+        self.memo = {}
+
+    def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
+        if self.shared:
+            key = id(obj)
+            if key in self.memo:
+                return self.memo[key]
+            result = self.method.serialize(obj, path)
+            # entry is removed when obj is collected, so its id cannot be reused
+            weakref.finalize(obj, self.memo.pop, key, None).atexit = False
+            self.memo[key] = result
+            return result
+        memo = call_memo.get()
+        if memo is None:
+            return memo_scope(self.serialize)(obj)
+        # the same object can be serialized differently by other methods
+        memo_key = (id(self), id(obj))
+        if memo_key in memo:
+            return memo[memo_key][1]
+        result = self.method.serialize(obj, path)
+        # obj is kept in the memo, so its id cannot be reused during the call
+        memo[memo_key] = (obj, result)
+        return result
+
+
 @dataclass
 class TupleCheckOnlyMethod(SerializationMethod):
     nb_elts: int
@@ -91,6 +91,7 @@ class settings(metaclass=MetaSettings):
         coercer: Coercer = coerce_
         default_conversion: DefaultConversion = default_deserialization
         fall_back_on_default: bool = False
+        intern_strings: bool = False
         no_copy: bool = True
         override_dataclass_constructors = False
         pass_through: CollectionOrPredicate[type] = ()
@@ -102,5 +103,7 @@ class settings(metaclass=MetaSettings):
         exclude_defaults: bool = False
         exclude_none: bool = False
         exclude_unset: bool = True
+        memoize: CollectionOrPredicate[type] = ()
+        memoize_across_calls: bool = False
         no_copy: bool = True
         pass_through: PassThroughOptions = PassThroughOptions()
@@ -1,23 +1,50 @@
-import ast
+import dis
 import inspect
-import textwrap
-from typing import AbstractSet, Callable, Collection, Dict, Set
+from types import CodeType
+from typing import AbstractSet, Callable, Collection, Dict, Optional, Set, Tuple
 
 Dependencies = AbstractSet[str]
 
+ATTRIBUTE_OPNAMES = {"LOAD_ATTR", "LOAD_METHOD", "STORE_ATTR", "DELETE_ATTR"}
+# Python 3.11+ also have LOAD_FAST_CHECK, LOAD_FAST_AND_CLEAR, LOAD_FAST_LOAD_FAST,
+# LOAD_FAST_BORROW, etc., which push one or two local variables
+LOCAL_OPNAMES_PREFIXES = ("LOAD_FAST", "LOAD_DEREF", "LOAD_CLOSURE")
 
-class DependencyFinder(ast.NodeVisitor):
-    def __init__(self, param: str):
-        self.param = param
-        self.dependencies: Set[str] = set()
 
-    def visit_Attribute(self, node):
-        self.generic_visit(node)
-        if isinstance(node.value, ast.Name) and node.value.id == self.param:
-            self.dependencies.add(node.attr)
+def _last_loaded(instruction: dis.Instruction) -> Optional[str]:
+    if not instruction.opname.startswith(LOCAL_OPNAMES_PREFIXES):
+        return None
+    argval = instruction.argval
+    return argval[-1] if isinstance(argval, tuple) else argval
 
-    # TODO Add warning in case of function call with self in parameter
-    # or better, follow the call, but it would be too hard (local import, etc.)
+
+def _code_dependencies(code: CodeType, param: str, deps: Set[str]):
+    """Collect attributes accessed on `param` variable, including in nested
+    functions (lambdas, comprehensions, etc.) where it is a free variable"""
+    previous: Optional[dis.Instruction] = None
+    for instruction in dis.get_instructions(code):
+        if (
+            instruction.opname in ATTRIBUTE_OPNAMES
+            and previous is not None
+            and _last_loaded(previous) == param
+        ):
+            deps.add(instruction.argval)
+        if instruction.opname != "EXTENDED_ARG":
+            previous = instruction
+    for const in code.co_consts:
+        if isinstance(const, CodeType) and param in const.co_freevars:
+            _code_dependencies(const, param, deps)
+
+
+code_cache: Dict[Tuple[CodeType, str], Dependencies] = {}
+
+
+def code_dependencies(code: CodeType, param: str) -> Dependencies:
+    if (code, param) not in code_cache:
+        deps: Set[str] = set()
+        _code_dependencies(code, param, deps)
+        code_cache[(code, param)] = deps
+    return code_cache[(code, param)]
 
 
 def first_parameter(func: Callable) -> str:
@@ -28,12 +55,16 @@ def first_parameter(func: Callable) -> str:
 
 
 def find_dependencies(func: Callable) -> Dependencies:
+    """Find the attributes of the first parameter used by the function, scanning its
+    bytecode, so source code is not needed."""
     try:
-        finder = DependencyFinder(first_parameter(func))
-        finder.visit(ast.parse(textwrap.dedent(inspect.getsource(func))))
+        param = first_parameter(func)
     except ValueError:
         return set()
-    return finder.dependencies
+    code = getattr(inspect.unwrap(getattr(func, "__func__", func)), "__code__", None)
+    if not isinstance(code, CodeType):
+        return set()
+    return code_dependencies(code, param)
 
 
 cache: Dict[Callable, Dependencies] = {}
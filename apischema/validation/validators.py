@@ -119,7 +119,7 @@ def validate(
 ) -> T:
     if validators is None:
         validators = get_validators(obj.__class__)
-    else:
+    elif not isinstance(validators, Sequence):
         validators = list(validators)
     error: Optional[ValidationError] = None
     for i, validator in enumerate(validators):
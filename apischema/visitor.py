@@ -20,6 +20,7 @@ from typing import (
     Union,
 )
 
+from apischema.cache import sized_cache
 from apischema.types import COLLECTION_TYPES, MAPPING_TYPES, PRIMITIVE_TYPES, AnyType
 from apischema.typing import (
     get_args,
@@ -34,7 +35,7 @@ from apischema.typing import (
     is_union,
     resolve_type_hints,
 )
-from apischema.utils import PREFIX, get_origin_or_type, has_type_vars
+from apischema.utils import PREFIX, get_origin_or_type, has_type_vars, is_hashable
 
 try:
     from apischema.typing import Annotated
@@ -44,7 +45,7 @@ except ImportError:
 TUPLE_TYPE = get_origin(Tuple[Any])
 
 
-def dataclass_types_and_fields(
+def _dataclass_types_and_fields(
     tp: AnyType,
 ) -> Tuple[Mapping[str, AnyType], Sequence[Field], Sequence[Field]]:
     from apischema.metadata.keys import INIT_VAR_METADATA
@@ -77,6 +78,41 @@ def dataclass_types_and_fields(
     return MappingProxyType(types), tuple(fields), tuple(init_fields)
 
 
+# Type hints resolution is cached (and reset with other caches) because it is
+# shared by all visitors: (de)serialization, JSON/GraphQL schema, recursion, etc.;
+# the cache has its own size, higher than methods caches, as it only grows with the
+# number of classes, but it is still bounded because classes can be created
+# dynamically (parametrized generic dataclasses, etc.)
+TYPE_HINTS_CACHE_SIZE = 4096
+type_hints_cache = sized_cache(TYPE_HINTS_CACHE_SIZE)
+_cached_dataclass_types_and_fields = type_hints_cache(_dataclass_types_and_fields)
+
+
+def dataclass_types_and_fields(
+    tp: AnyType,
+) -> Tuple[Mapping[str, AnyType], Sequence[Field], Sequence[Field]]:
+    if is_hashable(tp):
+        return _cached_dataclass_types_and_fields(tp)
+    else:
+        return _dataclass_types_and_fields(tp)
+
+
+@type_hints_cache
+def named_tuple_types(cls: type) -> Mapping[str, AnyType]:
+    if hasattr(cls, "__annotations__"):
+        return MappingProxyType(resolve_type_hints(cls))
+    # TODO is __field_types for python 3.6 only?
+    elif hasattr(cls, "__field_types"):  # pragma: no cover
+        return cls.__field_types
+    else:  # pragma: no cover
+        return MappingProxyType({f: Any for f in cls._fields})  # type: ignore
+
+
+@type_hints_cache
+def typed_dict_types(cls: type) -> Mapping[str, AnyType]:
+    return MappingProxyType(resolve_type_hints(cls))
+
+
 class Unsupported(TypeError):
     def __init__(self, tp: AnyType):
         self.type = tp
@@ -181,17 +217,12 @@ class Visitor(Generic[Result]):
                     return self.subprimitive(origin, primitive)
             # NamedTuple
             if is_named_tuple(origin):
-                if hasattr(origin, "__annotations__"):
-                    types = resolve_type_hints(origin)
-                # TODO is __field_types for python 3.6 only?
-                elif hasattr(origin, "__field_types"):  # pragma: no cover
-                    types = origin.__field_types
-                else:  # pragma: no cover
-                    types = {f: Any for f in origin._fields}  # noqa: E501
-                return self.named_tuple(origin, types, origin._field_defaults)
+                return self.named_tuple(
+                    origin, named_tuple_types(origin), origin._field_defaults
+                )
         if is_typed_dict(origin):
             required_keys = getattr(origin, "__required_keys__", ())  # py38
-            return self.typed_dict(origin, resolve_type_hints(origin), required_keys)
+            return self.typed_dict(origin, typed_dict_types(origin), required_keys)
         if is_literal_string(origin):
             return self.primitive(str)
         if is_type_var(origin):
@@ -0,0 +1,166 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+from apischema import deserialize, deserializer
+from apischema.conversions import Conversion
+
+Foo_ = TypeVar("Foo_", bound="Foo")
+
+
+# Use a dataclass in order to be easily testable with ==
+@dataclass
+class Foo:
+    value: int
+
+    @classmethod
+    def deserialize(cls: type[Foo_], value: int) -> Foo_:
+        return cls(value)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Register subclasses' conversion in __init_subclass__
+        deserializer(Conversion(cls.deserialize, target=cls))
+
+
+# Register main conversion after the class definition
+deserializer(Conversion(Foo.deserialize, target=Foo))
+
+
+class Bar(Foo):
+    pass
+
+
+def test_inherited_deserializer0():
+    assert deserialize(Foo, 0) == Foo(0)
+    assert deserialize(Bar, 0) == Bar(0)
+
+    # For external types (defines in imported library)
+
+
+@dataclass
+class ForeignType:
+    value: int
+
+
+class ForeignSubtype(ForeignType):
+    pass
+
+
+T = TypeVar("T")
+
+
+# Recursive implementation of type.__subclasses__
+def rec_subclasses(cls: type[T]) -> Iterator[type[T]]:
+    for sub_cls in cls.__subclasses__():
+        yield sub_cls
+        yield from rec_subclasses(sub_cls)
+
+
+# Register deserializers for all subclasses
+for cls in (ForeignType, *rec_subclasses(ForeignType)):
+    # cls=cls is an lambda idiom to capture variable by value inside loop
+    deserializer(Conversion(lambda value, cls=cls: cls(value), source=int, target=cls))
+
+
+def test_inherited_deserializer1():
+    assert deserialize(ForeignType, 0) == ForeignType(0)
+    assert deserialize(ForeignSubtype, 0) == ForeignSubtype(0)
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,189 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+import inspect
+from collections.abc import Mapping
+from typing import Any
+
+import pydantic
+import pytest
+
+from apischema import (
+    ValidationError,
+    deserialize,
+    schema,
+    serialize,
+    serializer,
+    settings,
+)
+from apischema.conversions import AnyConversion, Conversion
+from apischema.json_schema import deserialization_schema
+from apischema.schemas import Schema
+
+# ---------- Pydantic support code starts here ----------
+prev_deserialization = settings.deserialization.default_conversion
+
+
+def default_deserialization(tp: Any) -> Union[AnyConversion, None]:
+    if inspect.isclass(tp) and issubclass(tp, pydantic.BaseModel):
+
+        def deserialize_pydantic(data):
+            try:
+                return tp.parse_obj(data)
+            except pydantic.ValidationError as error:
+                raise ValidationError.from_errors(
+                    [{"loc": err["loc"], "err": err["msg"]} for err in error.errors()]
+                )
+
+        return Conversion(
+            deserialize_pydantic,
+            source=tp.__annotations__.get("__root__", Mapping[str, Any]),
+            target=tp,
+        )
+    else:
+        return prev_deserialization(tp)
+
+
+settings.deserialization.default_conversion = default_deserialization
+
+prev_schema = settings.base_schema.type
+
+
+def default_schema(tp: Any) -> Union[Schema, None]:
+    if inspect.isclass(tp) and issubclass(tp, pydantic.BaseModel):
+        return schema(extra=tp.schema(), override=True)
+    else:
+        return prev_schema(tp)
+
+
+settings.base_schema.type = default_schema
+
+
+# No need to use settings.serialization because serializer is inherited
+@serializer
+def serialize_pydantic(obj: pydantic.BaseModel) -> Any:
+    # There is currently no way to retrieve `serialize` parameters inside converters,
+    # so exclude_unset is set to True as it's the default apischema setting
+    return getattr(obj, "__root__", obj.dict(exclude_unset=True))
+
+
+# ---------- Pydantic support code ends here ----------
+
+
+class Foo(pydantic.BaseModel):
+    bar: int
+
+
+def test_pydantic_support0():
+    assert deserialize(Foo, {"bar": 0}) == Foo(bar=0)
+    assert serialize(Foo, Foo(bar=0)) == {"bar": 0}
+    assert deserialization_schema(Foo) == {
+        "$schema": "http://json-schema.org/draft/2020-12/schema#",
+        "title": "Foo",  # pydantic title
+        "type": "object",
+        "properties": {"bar": {"title": "Bar", "type": "integer"}},
+        "required": ["bar"],
+    }
+    with pytest.raises(ValidationError) as err:
+        deserialize(Foo, {"bar": "not an int"})
+    assert err.value.errors == [
+        {
+            "loc": ["bar"],
+            "err": "value is not a valid integer",
+        }  # pydantic error message
+    ]
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,165 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from typing import Any, Dict, Generic, TypeVar
+
+import pytest
+
+from apischema import deserialize, deserializer, schema, serialize, serializer
+from apischema.json_schema import deserialization_schema, serialization_schema
+
+
+# Add a dummy placeholder comment in order to not have an empty schema
+# (because Union member with empty schema would "contaminate" whole Union schema)
+@schema(extra={"$comment": "recoverable"})
+class RecoverableRaw(Exception):
+    def __init__(self, raw: Any):
+        self.raw = raw
+
+
+deserializer(RecoverableRaw)
+
+T = TypeVar("T")
+
+
+def remove_recoverable_schema(json_schema: Dict[str, Any]):
+    if "anyOf" in json_schema:  # deserialization schema
+        value_schema, recoverable_comment = json_schema.pop("anyOf")
+        assert recoverable_comment == {"$comment": "recoverable"}
+        json_schema.update(value_schema)
+
+
+@schema(extra=remove_recoverable_schema)
+class Recoverable(Generic[T]):
+    def __init__(self, value: Union[T, RecoverableRaw]):
+        self._value = value
+
+    @property
+    def value(self) -> T:
+        if isinstance(self._value, RecoverableRaw):
+            raise self._value
+        return self._value
+
+    @value.setter
+    def value(self, value: T):
+        self._value = value
+
+
+deserializer(Recoverable)
+serializer(Recoverable.value)
+
+
+def test_recoverable_fields0():
+    assert deserialize(Recoverable[int], 0).value == 0
+    with pytest.raises(RecoverableRaw) as err:
+        _ = deserialize(Recoverable[int], "bad").value
+    assert err.value.raw == "bad"
+
+    assert serialize(Recoverable[int], Recoverable(0)) == 0
+    with pytest.raises(RecoverableRaw) as err:
+        serialize(Recoverable[int], Recoverable(RecoverableRaw("bad")))
+    assert err.value.raw == "bad"
+
+    assert (
+        deserialization_schema(Recoverable[int])
+        == serialization_schema(Recoverable[int])
+        == {
+            "$schema": "http://json-schema.org/draft/2020-12/schema#",
+            "type": "integer",
+        }
+    )
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
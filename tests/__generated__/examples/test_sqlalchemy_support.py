@@ -0,0 +1,179 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from collections.abc import Collection
+from inspect import getmembers
+from itertools import starmap
+from typing import Any
+
+from graphql import print_schema
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.ext.declarative import as_declarative
+
+from apischema import Undefined, deserialize, serialize
+from apischema.graphql import graphql_schema
+from apischema.json_schema import deserialization_schema
+from apischema.objects import ObjectField, set_object_fields
+
+
+def column_field(name: str, column: Column) -> ObjectField:
+    required = False
+    default: Any = ...
+    if column.default is not None:
+        default = column.default
+    elif column.server_default is not None:
+        default = Undefined
+    elif column.nullable:
+        default = None
+    else:
+        required = True
+    col_type = column.type.python_type
+    if column.nullable:
+        col_type = Union[col_type, None]
+    return ObjectField(column.name or name, col_type, required, default=default)
+
+
+# Very basic SQLAlchemy support
+@as_declarative()
+class Base:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        columns = getmembers(cls, lambda m: isinstance(m, Column))
+        if not columns:
+            return
+        set_object_fields(cls, starmap(column_field, columns))
+
+
+class Foo(Base):
+    __tablename__ = "foo"
+    bar = Column(Integer, primary_key=True)
+    baz = Column(String)
+
+
+foo = deserialize(Foo, {"bar": 0})
+
+
+def test_sqlalchemy_support0():
+    assert isinstance(foo, Foo)
+    assert foo.bar == 0
+    assert serialize(Foo, foo) == {"bar": 0, "baz": None}
+    assert deserialization_schema(Foo) == {
+        "$schema": "http://json-schema.org/draft/2020-12/schema#",
+        "type": "object",
+        "properties": {
+            "bar": {"type": "integer"},
+            "baz": {"type": ["string", "null"], "default": None},
+        },
+        "required": ["bar"],
+        "additionalProperties": False,
+    }
+
+    def foos() -> Union[Collection[Foo], None]:
+        ...
+
+    schema = graphql_schema(query=[foos])
+    schema_str = """\
+type Query {
+  foos: [Foo!]
+}
+
+type Foo {
+  bar: Int!
+  baz: String
+}"""
+    assert print_schema(schema) == schema_str
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,155 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from dataclasses import dataclass
+from typing import Any, Union
+
+from apischema import deserialize, deserializer, identity, serializer
+from apischema.conversions import Conversion
+from apischema.json_schema import deserialization_schema, serialization_schema
+
+
+class Base:
+    _union: Any = None
+
+    # You can use __init_subclass__ to register new subclass automatically
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Deserializers stack directly as a Union
+        deserializer(Conversion(identity, source=cls, target=Base))
+        # Only Base serializer must be registered (and updated for each subclass) as
+        # a Union, and not be inherited
+        Base._union = cls if Base._union is None else Union[Base._union, cls]
+        serializer(
+            Conversion(identity, source=Base, target=Base._union, inherited=False)
+        )
+
+
+@dataclass
+class Foo(Base):
+    foo: int
+
+
+@dataclass
+class Bar(Base):
+    bar: str
+
+
+def test_subclass_union0():
+    assert (
+        deserialization_schema(Base)
+        == serialization_schema(Base)
+        == {
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {"foo": {"type": "integer"}},
+                    "required": ["foo"],
+                    "additionalProperties": False,
+                },
+                {
+                    "type": "object",
+                    "properties": {"bar": {"type": "string"}},
+                    "required": ["bar"],
+                    "additionalProperties": False,
+                },
+            ],
+            "$schema": "http://json-schema.org/draft/2020-12/schema#",
+        }
+    )
+    assert deserialize(Base, {"foo": 0}) == Foo(0)
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,172 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from dataclasses import dataclass, field
+from typing import Any, Callable, get_origin
+
+import docstring_parser
+
+from apischema import schema, serialized, settings
+from apischema.json_schema import serialization_schema
+from apischema.schemas import Schema
+from apischema.type_names import get_type_name
+
+
+@dataclass
+class Foo:
+    """Foo class
+
+    :var bar: bar attribute"""
+
+    bar: str = field(metadata=schema(max_len=10))
+
+    @serialized
+    @property
+    def baz(self) -> int:
+        """baz method"""
+        ...
+
+
+def type_base_schema(tp: Any) -> Union[Schema, None]:
+    if not hasattr(tp, "__doc__"):
+        return None
+    return schema(
+        title=get_type_name(tp).json_schema,
+        description=docstring_parser.parse(tp.__doc__).short_description,
+    )
+
+
+def field_base_schema(tp: Any, name: str, alias: str) -> Union[Schema, None]:
+    title = alias.replace("_", " ").capitalize()
+    tp = get_origin(tp) or tp  # tp can be generic
+    for meta in docstring_parser.parse(tp.__doc__).meta:
+        if meta.args == ["var", name]:
+            return schema(title=title, description=meta.description)
+    return schema(title=title)
+
+
+def method_base_schema(tp: Any, method: Callable, alias: str) -> Union[Schema, None]:
+    return schema(
+        title=alias.replace("_", " ").capitalize(),
+        description=docstring_parser.parse(method.__doc__).short_description,
+    )
+
+
+settings.base_schema.type = type_base_schema
+settings.base_schema.field = field_base_schema
+settings.base_schema.method = method_base_schema
+
+
+def test_base_schema0():
+    assert serialization_schema(Foo) == {
+        "$schema": "http://json-schema.org/draft/2020-12/schema#",
+        "additionalProperties": False,
+        "title": "Foo",
+        "description": "Foo class",
+        "properties": {
+            "bar": {
+                "description": "bar attribute",
+                "title": "Bar",
+                "type": "string",
+                "maxLength": 10,
+            },
+            "baz": {"description": "baz method", "title": "Baz", "type": "integer"},
+        },
+        "required": ["bar", "baz"],
+        "type": "object",
+    }
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
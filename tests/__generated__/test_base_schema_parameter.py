@@ -0,0 +1,159 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import docstring_parser
+from graphql.utilities import print_schema
+
+from apischema import schema, settings
+from apischema.graphql import graphql_schema, resolver
+from apischema.schemas import Schema
+
+
+@dataclass
+class Foo:
+    @resolver
+    def bar(self, arg: str) -> int:
+        """bar method
+
+        :param arg: arg parameter
+        """
+        ...
+
+
+def method_base_schema(tp: Any, method: Callable, alias: str) -> Union[Schema, None]:
+    return schema(description=docstring_parser.parse(method.__doc__).short_description)
+
+
+def parameter_base_schema(
+    method: Callable, parameter: inspect.Parameter, alias: str
+) -> Union[Schema, None]:
+    for doc_param in docstring_parser.parse(method.__doc__).params:
+        if doc_param.arg_name == parameter.name:
+            return schema(description=doc_param.description)
+    return None
+
+
+settings.base_schema.method = method_base_schema
+settings.base_schema.parameter = parameter_base_schema
+
+
+def foo() -> Foo:
+    ...
+
+
+schema_ = graphql_schema(query=[foo])
+schema_str = '''\
+type Query {
+  foo: Foo!
+}
+
+type Foo {
+  """bar method"""
+  bar(
+    """arg parameter"""
+    arg: String!
+  ): Int!
+}'''
+
+
+def test_base_schema_parameter0():
+    assert print_schema(schema_) == schema_str
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,142 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from dataclasses import InitVar, dataclass, field
+
+import pytest
+
+from apischema import ValidationError, deserialize, serialize, validator
+from apischema.json_schema import definitions_schema
+from apischema.metadata import init_var
+
+
+@dataclass
+class Foo:
+    bar: int
+    init_only: InitVar[int] = field(metadata=init_var(int))
+    no_init: int = field(init=False)
+
+    def __post_init__(self, init_only: int):
+        self.no_init = init_only
+
+    # InitVar are passed as kwargs, like in __post_init__
+    @validator
+    def validate(self, init_only: int):
+        if self.bar == init_only:
+            raise ValueError("Error")
+
+
+def test_dataclass_init0():
+    assert deserialize(Foo, {"bar": 0, "init_only": 1}) == Foo(0, 1)
+    assert serialize(Foo, Foo(0, 1)) == {"bar": 0, "no_init": 1}
+    with pytest.raises(ValidationError) as err:
+        deserialize(Foo, {"bar": 0})
+    assert definitions_schema(
+        deserialization=[Foo], serialization=[Foo], all_refs=True
+    ) == {
+        "Foo": {
+            "type": "object",
+            "properties": {
+                "bar": {"type": "integer"},
+                "no_init": {"readOnly": True, "type": "integer"},
+                "init_only": {"writeOnly": True, "type": "integer"},
+            },
+            "additionalProperties": False,
+            "required": ["bar", "init_only"],
+        }
+    }
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,145 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from dataclasses import dataclass, field
+
+import pytest
+
+from apischema import ValidationError, deserialize, validator
+from apischema.objects import get_alias, get_field
+
+
+@dataclass
+class BoundedValues:
+    # field must be assign to be used, even with empty `field()`
+    bounds: tuple[int, int] = field()
+    values: list[int]
+
+    # validator("bounds") would also work, but it's not handled by IDE refactoring, etc.
+    @validator(discard=bounds)
+    def bounds_are_sorted(self):
+        min_bound, max_bound = self.bounds
+        if min_bound > max_bound:
+            yield get_alias(self).bounds, "bounds are not sorted"
+
+    @validator
+    def values_dont_exceed_bounds(self):
+        min_bound, max_bound = self.bounds
+        for index, value in enumerate(self.values):
+            if not min_bound <= value <= max_bound:
+                yield (get_alias(self).values, index), "value exceeds bounds"
+
+
+# Outside class, fields can still be accessed in a "static" way, to avoid use raw string
+@validator(discard=get_field(BoundedValues).bounds)
+def bounds_are_sorted_equivalent(bounded: BoundedValues):
+    min_bound, max_bound = bounded.bounds
+    if min_bound > max_bound:
+        yield get_alias(bounded).bounds, "bounds are not sorted"
+
+
+with pytest.raises(ValidationError) as err:
+    deserialize(BoundedValues, {"bounds": [10, 0], "values": [-1, 2, 4]})
+
+
+def test_discard0():
+    assert err.value.errors == [
+        {"loc": ["bounds"], "err": "bounds are not sorted"}
+        # Without discard, there would have been an other error
+        # {"loc": ["values", 1], "err": "value exceeds bounds"}
+    ]
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
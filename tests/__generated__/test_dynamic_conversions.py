@@ -0,0 +1,142 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated
+
+from apischema import deserialize, serialize
+from apischema.metadata import conversion
+
+# Set UTC timezone for example
+os.environ["TZ"] = "UTC"
+time.tzset()
+
+
+def datetime_from_timestamp(timestamp: int) -> datetime:
+    return datetime.fromtimestamp(timestamp)
+
+
+date = datetime(2017, 9, 2)
+
+
+def test_dynamic_conversions0():
+    assert deserialize(datetime, 1504310400, conversion=datetime_from_timestamp) == date
+
+
+@dataclass
+class Foo:
+    bar: int
+    baz: int
+
+    def sum(self) -> int:
+        return self.bar + self.baz
+
+    @property
+    def diff(self) -> int:
+        return int(self.bar - self.baz)
+
+
+def test_dynamic_conversions1():
+    assert serialize(Foo, Foo(0, 1)) == {"bar": 0, "baz": 1}
+    assert serialize(Foo, Foo(0, 1), conversion=Foo.sum) == 1
+    assert serialize(Foo, Foo(0, 1), conversion=Foo.diff) == -1
+    # conversions can be specified using Annotated
+    assert serialize(Annotated[Foo, conversion(serialization=Foo.sum)], Foo(0, 1)) == 1
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
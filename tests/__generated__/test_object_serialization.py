@@ -0,0 +1,172 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from dataclasses import dataclass
+from typing import Any
+
+from apischema import alias, serialize, type_name
+from apischema.json_schema import JsonSchemaVersion, definitions_schema
+from apischema.objects import get_field, object_serialization
+
+
+@dataclass
+class Data:
+    id: int
+    content: str
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def get_details(self) -> Any:
+        ...
+
+
+# Serialization fields can be a str/field or a function/method/property
+size_only = object_serialization(
+    Data, [get_field(Data).id, Data.size], type_name("DataSize")
+)
+# ["id", Data.size] would also work
+
+
+def complete_data():
+    return [
+        ...,  # shortcut to include all the fields
+        Data.size,
+        (Data.get_details, alias("details")),  # add/override metadata using tuple
+    ]
+
+
+# Serialization fields computation can be deferred in a function
+# The serialization name will then be defaulted to the function name
+complete = object_serialization(Data, complete_data)
+
+data = Data(0, "data")
+
+
+def test_object_serialization0():
+    assert serialize(Data, data, conversion=size_only) == {"id": 0, "size": 4}
+    assert serialize(Data, data, conversion=complete) == {
+        "id": 0,
+        "content": "data",
+        "size": 4,
+        "details": None,  # because get_details return None in this example
+    }
+
+    assert definitions_schema(
+        serialization=[(Data, size_only), (Data, complete)],
+        version=JsonSchemaVersion.OPEN_API_3_0,
+    ) == {
+        "DataSize": {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "size": {"type": "integer"}},
+            "required": ["id", "size"],
+            "additionalProperties": False,
+        },
+        "CompleteData": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "content": {"type": "string"},
+                "size": {"type": "integer"},
+                "details": {},
+            },
+            "required": ["id", "content", "size", "details"],
+            "additionalProperties": False,
+        },
+    }
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
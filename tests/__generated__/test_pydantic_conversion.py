@@ -0,0 +1,172 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+import re
+from typing import NamedTuple, NewType
+
+import pydantic.validators
+
+import apischema
+
+
+# Serialization can only be customized into the enclosing models
+class RGB(NamedTuple):
+    red: int
+    green: int
+    blue: int
+
+    # If you don't put this method, RGB schema will be:
+    # {'title': 'Rgb', 'type': 'array', 'items': {}}
+    @classmethod
+    def __modify_schema__(cls, field_schema) -> None:
+        field_schema.update({"type": "string", "pattern": r"#[0-9A-Fa-f]{6}"})
+        field_schema.pop("items", ...)
+
+    @classmethod
+    def __get_validators__(cls):
+        yield pydantic.validators.str_validator
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value) -> "RGB":
+        if (
+            not isinstance(value, str)
+            or re.fullmatch(r"#[0-9A-Fa-f]{6}", value) is None
+        ):
+            raise ValueError("Invalid RGB")
+        return RGB(
+            red=int(value[1:3], 16), green=int(value[3:5], 16), blue=int(value[5:7], 16)
+        )
+
+
+# Simpler with apischema
+
+
+class RGB(NamedTuple):
+    red: int
+    green: int
+    blue: int
+
+
+# NewType can be used to add schema to conversion source/target
+# but Annotated[str, apischema.schema(pattern=r"#[0-9A-Fa-f]{6}")] would have worked too
+HexaRGB = NewType("HexaRGB", str)
+# pattern is used in JSON schema and in deserialization validation
+apischema.schema(pattern=r"#[0-9A-Fa-f]{6}")(HexaRGB)
+
+
+@apischema.deserializer  # could be declared as a staticmethod of RGB class
+def from_hexa(hexa: HexaRGB) -> RGB:
+    return RGB(int(hexa[1:3], 16), int(hexa[3:5], 16), int(hexa[5:7], 16))
+
+
+@apischema.serializer  # could be declared as a method/property of RGB class
+def to_hexa(rgb: RGB) -> HexaRGB:
+    return HexaRGB(f"#{rgb.red:02x}{rgb.green:02x}{rgb.blue:02x}")
+
+
+def test_pydantic_conversion0():
+    assert (  # schema is inherited from deserialized type
+        apischema.json_schema.deserialization_schema(RGB)
+        == apischema.json_schema.deserialization_schema(HexaRGB)
+        == {
+            "$schema": "http://json-schema.org/draft/2020-12/schema#",
+            "type": "string",
+            "pattern": "#[0-9A-Fa-f]{6}",
+        }
+    )
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
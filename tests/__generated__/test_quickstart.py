@@ -0,0 +1,172 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import pytest
+from graphql import print_schema
+
+from apischema import ValidationError, deserialize, serialize
+from apischema.graphql import graphql_schema
+from apischema.json_schema import deserialization_schema
+
+
+# Define a schema with standard dataclasses
+@dataclass
+class Resource:
+    id: UUID
+    name: str
+    tags: set[str] = field(default_factory=set)
+
+
+# Get some data
+uuid = uuid4()
+data = {"id": str(uuid), "name": "wyfo", "tags": ["some_tag"]}
+# Deserialize data
+resource = deserialize(Resource, data)
+
+
+def test_quickstart0():
+    assert resource == Resource(uuid, "wyfo", {"some_tag"})
+    # Serialize objects
+    assert serialize(Resource, resource) == data
+    # Validate during deserialization
+    with pytest.raises(ValidationError) as err:  # pytest checks exception is raised
+        deserialize(Resource, {"id": "42", "name": "wyfo"})
+    assert err.value.errors == [
+        {"loc": ["id"], "err": "badly formed hexadecimal UUID string"}
+    ]
+    # Generate JSON Schema
+    assert deserialization_schema(Resource) == {
+        "$schema": "http://json-schema.org/draft/2020-12/schema#",
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "format": "uuid"},
+            "name": {"type": "string"},
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "uniqueItems": True,
+                "default": [],
+            },
+        },
+        "required": ["id", "name"],
+        "additionalProperties": False,
+    }
+
+    # Define GraphQL operations
+    def resources(
+        tags: Union[Collection[str], None] = None
+    ) -> Union[Collection[Resource], None]:
+        ...
+
+    # Generate GraphQL schema
+    schema = graphql_schema(query=[resources], id_types={UUID})
+    schema_str = """\
+type Query {
+  resources(tags: [String!]): [Resource!]
+}
+
+type Resource {
+  id: ID!
+  name: String!
+  tags: [String!]!
+}"""
+    assert print_schema(schema) == schema_str
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
@@ -0,0 +1,153 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any
+
+import graphql
+from graphql.utilities import print_schema
+
+from apischema.graphql import graphql_schema, resolver
+
+logger = getLogger(__name__)
+
+
+def log_error(
+    error: Exception, obj: Any, info: graphql.GraphQLResolveInfo, **kwargs
+) -> None:
+    logger.error(
+        "Resolve error in %s", ".".join(map(str, info.path.as_list())), exc_info=error
+    )
+    return None
+
+
+@dataclass
+class Foo:
+    @resolver(error_handler=log_error)
+    def bar(self) -> int:
+        raise RuntimeError("Bar error")
+
+    @resolver
+    def baz(self) -> int:
+        raise RuntimeError("Baz error")
+
+
+def foo(info: graphql.GraphQLResolveInfo) -> Foo:
+    return Foo()
+
+
+schema = graphql_schema(query=[foo])
+# Notice that bar is Int while baz is Int!
+schema_str = """\
+type Query {
+  foo: Foo!
+}
+
+type Foo {
+  bar: Int
+  baz: Int!
+}"""
+
+
+def test_resolver_error0():
+    assert print_schema(schema) == schema_str
+    # Logs "Resolve error in foo.bar", no error raised
+    assert graphql.graphql_sync(schema, "{foo{bar}}").data == {"foo": {"bar": None}}
+    # Error is raised
+    assert graphql.graphql_sync(schema, "{foo{baz}}").errors[0].message == "Baz error"
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
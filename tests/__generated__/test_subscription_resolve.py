@@ -0,0 +1,154 @@
+# flake8: noqa
+# type: ignore
+import inspect
+import json
+import sys
+import timeit
+import typing
+from typing import *
+from unittest.mock import MagicMock
+
+import pytest
+
+from apischema import settings
+from apischema.typing import Annotated, get_args, get_origin, is_type
+
+typing.get_origin, typing.get_args = get_origin, get_args
+typing.Annotated = Annotated
+if "include_extras" not in inspect.signature(typing.get_type_hints).parameters:
+    gth = typing.get_type_hints
+
+    def get_type_hints(*args, include_extras=False, **kwargs):
+        return gth(*args, **kwargs)
+
+    typing.get_type_hints = get_type_hints
+inspect.isclass = is_type
+if sys.version_info < (3, 9):
+
+    class CollectionABC:
+        def __getattribute__(self, name):
+            return globals()[name] if name in globals() else MagicMock()
+
+    sys.modules["collections.abc"] = CollectionABC()
+    del CollectionABC
+
+
+class Wrapper:
+    def __init__(self, cls):
+        self.cls = cls
+        self.implem = cls.__origin__
+
+    def __getitem__(self, item):
+        return self.cls[item]
+
+    def __call__(self, *args, **kwargs):
+        return self.implem(*args, **kwargs)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.implem)
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self.implem)
+
+
+for cls in (Dict, List, Set, FrozenSet, Tuple, Type):  # type: ignore # noqa
+    wrapper = Wrapper(cls)
+    globals()[wrapper.implem.__name__] = wrapper
+
+Set = AbstractSet
+
+del Wrapper
+
+__timeit = timeit.timeit
+timeit.timeit = lambda stmt, number=None, **kwargs: __timeit(stmt, number=1, **kwargs)
+
+sys.modules["orjson"] = json
+
+settings_classes = (
+    settings,
+    settings.errors,
+    settings.base_schema,
+    settings.deserialization,
+    settings.serialization,
+)
+settings_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+
+
+##
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable
+
+import graphql
+from graphql import print_schema
+
+from apischema.graphql import Subscription, graphql_schema
+
+
+def hello() -> str:
+    return "world"
+
+
+async def events() -> AsyncIterable[str]:
+    yield "bonjour"
+    yield "au revoir"
+
+
+@dataclass
+class Message:
+    body: str
+
+
+# Message can also be used directly as a function
+schema = graphql_schema(
+    query=[hello],
+    subscription=[Subscription(events, alias="messageReceived", resolver=Message)],
+)
+schema_str = """\
+type Query {
+  hello: String!
+}
+
+type Subscription {
+  messageReceived: Message!
+}
+
+type Message {
+  body: String!
+}"""
+
+
+def test_subscription_resolve0():
+    assert print_schema(schema) == schema_str
+
+    async def test():
+        subscription = await graphql.subscribe(
+            schema, graphql.parse("subscription {messageReceived {body}}")
+        )
+        assert [event.data async for event in subscription] == [
+            {"messageReceived": {"body": "bonjour"}},
+            {"messageReceived": {"body": "au revoir"}},
+        ]
+
+    asyncio.run(test())
+
+
+##
+
+
+def set_settings(dicts: Mapping[type, Mapping[str, Any]]):
+    for cls, dict_ in dicts.items():
+        for key, value in dict_.items():
+            if not key.startswith("_"):
+                setattr(cls, key, value)
+
+
+test_dicts = {cls: dict(cls.__dict__) for cls in settings_classes}
+set_settings(settings_dicts)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    set_settings(test_dicts)
+    yield
+    set_settings(settings_dicts)
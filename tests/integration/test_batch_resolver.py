@@ -0,0 +1,104 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, cast
+
+import graphql
+import pytest
+
+from apischema.graphql import graphql_schema, resolver
+
+calls: List[tuple] = []
+
+
+@dataclass
+class Foo:
+    id: int
+
+    @resolver(batch=True)
+    def double(self, offset: int = 0) -> Sequence[int]:
+        foos = cast(Sequence[Foo], self)
+        calls.append(([foo.id for foo in foos], offset))
+        return [2 * foo.id + offset for foo in foos]
+
+    @resolver(batch=True, error_handler=None)
+    async def wrong(self) -> Sequence[int]:
+        return []
+
+    @resolver(batch=True)
+    def owner(self, info: graphql.GraphQLResolveInfo) -> Sequence[str]:
+        foos = cast(Sequence[Foo], self)
+        calls.append(([foo.id for foo in foos], info.context["user"]))
+        return [info.context["user"]] * len(foos)
+
+
+def foos() -> Sequence[Foo]:
+    return [Foo(0), Foo(1), Foo(2)]
+
+
+schema = graphql_schema(query=[foos])
+
+
+def test_batch_resolver_schema():
+    assert (
+        graphql.print_schema(schema)
+        == """\
+type Query {
+  foos: [Foo!]!
+}
+
+type Foo {
+  id: Int!
+  double(offset: Int! = 0): Int!
+  wrong: Int
+  owner: String!
+}"""
+    )
+
+
+async def test_batch_resolver_called_once_per_arguments():
+    calls.clear()
+    result = await graphql.graphql(
+        schema, "{foos{double a: double(offset: 1) b: double(offset: 1)}}"
+    )
+    assert result.errors is None
+    assert result.data == {
+        "foos": [{"double": 2 * i, "a": 2 * i + 1, "b": 2 * i + 1} for i in range(3)]
+    }
+    assert sorted(calls) == [([0, 0, 1, 1, 2, 2], 1), ([0, 1, 2], 0)]
+
+
+async def test_batch_resolver_wrong_results_length():
+    result = await graphql.graphql(schema, "{foos{wrong}}")
+    assert result.errors is None
+    assert result.data == {"foos": [{"wrong": None}] * 3}
+
+
+def test_batch_resolver_requires_sequence():
+    with pytest.raises(TypeError):
+
+        @dataclass
+        class Bar:
+            @resolver(batch=True)
+            def bar(self) -> Optional[int]:
+                ...
+
+        graphql_schema(query=[lambda: Bar()])  # pragma: no cover
+
+
+def test_batch_resolver_not_serialized():
+    with pytest.raises(TypeError):
+        resolver(batch=True, serialized=True)
+
+
+async def test_concurrent_executions_are_not_batched_together():
+    calls.clear()
+    results = await asyncio.gather(
+        *(
+            graphql.graphql(schema, "{foos{owner}}", context_value={"user": user})
+            for user in ("alice", "bob")
+        )
+    )
+    assert [result.data for result in results] == [
+        {"foos": [{"owner": user}] * 3} for user in ("alice", "bob")
+    ]
+    assert sorted(calls) == [([0, 1, 2], "alice"), ([0, 1, 2], "bob")]
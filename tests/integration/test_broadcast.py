@@ -0,0 +1,135 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable, List
+
+import graphql
+
+from apischema.graphql import Broadcast, Subscription, graphql_schema
+
+broadcast: Broadcast[int] = Broadcast(maxsize=1)
+resolved: List[int] = []
+
+
+@dataclass
+class Event:
+    value: int
+
+
+def events() -> AsyncIterable[int]:
+    return broadcast.subscribe()
+
+
+def event(value: int) -> Event:
+    resolved.append(value)
+    return Event(value)
+
+
+def query() -> int:
+    return 0
+
+
+schema = graphql_schema(
+    query=[query],
+    subscription=[
+        Subscription(events, alias="event", resolver=event, share_events=True)
+    ],
+)
+
+
+async def test_broadcast_subscriptions():
+    subscriptions = [
+        await graphql.subscribe(schema, graphql.parse("subscription {event{value}}"))
+        for _ in range(3)
+    ]
+    results = [
+        asyncio.ensure_future(sub.__anext__()) for sub in subscriptions  # type: ignore
+    ]
+    # subscribers are registered when the event generators start
+    while broadcast.subscribers < 3:
+        await asyncio.sleep(0)
+    await broadcast.publish(42)
+    for result in results:
+        assert (await result).data == {"event": {"value": 42}}
+    # event is resolved/serialized only once for all subscribers
+    assert resolved == [42]
+    await broadcast.close()
+    for sub in subscriptions:
+        assert [res async for res in sub] == []  # type: ignore
+    assert broadcast.subscribers == 0
+
+
+async def test_broadcast_backpressure():
+    broadcast2: Broadcast[int] = Broadcast(maxsize=1)
+    events = broadcast2.subscribe()
+    first = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0)
+    await broadcast2.publish(0)
+    assert await first == 0
+    await broadcast2.publish(1)
+    publish = asyncio.ensure_future(broadcast2.publish(2))
+    await asyncio.sleep(0)
+    assert not publish.done()
+    broadcast2.publish_nowait(3)  # dropped
+    assert await events.__anext__() == 1
+    await publish
+    assert await events.__anext__() == 2
+    await broadcast2.close()
+    assert [event async for event in events] == []
+
+
+async def test_broadcast_not_iterated_subscription():
+    broadcast2: Broadcast[int] = Broadcast(maxsize=1)
+    broadcast2.subscribe()
+    assert broadcast2.subscribers == 0
+    await asyncio.wait_for(broadcast2.publish(0), 1)
+    await asyncio.wait_for(broadcast2.publish(1), 1)
+
+
+counter = 0
+
+
+async def same_events() -> AsyncIterable[int]:
+    for _ in range(3):
+        yield 1
+
+
+def count(event: int) -> int:
+    global counter
+    counter += 1
+    return counter
+
+
+def user(event: int, info: graphql.GraphQLResolveInfo) -> str:
+    return info.context["user"]
+
+
+async def shared_events() -> AsyncIterable[Event]:
+    yield shared_event
+
+
+shared_event = Event(0)
+
+schema2 = graphql_schema(
+    query=[query],
+    subscription=[
+        Subscription(same_events, alias="count", resolver=count),
+        Subscription(shared_events, alias="user", resolver=user, share_events=True),
+    ],
+)
+
+
+async def test_events_are_not_shared_by_default():
+    sub = await graphql.subscribe(schema2, graphql.parse("subscription {count}"))
+    assert [res.data async for res in sub] == [  # type: ignore
+        {"count": 1},
+        {"count": 2},
+        {"count": 3},
+    ]
+
+
+async def test_shared_events_are_not_shared_between_contexts():
+    for user_ in ("alice", "bob"):
+        sub = await graphql.subscribe(
+            schema2, graphql.parse("subscription {user}"), context_value={"user": user_}
+        )
+        assert [res.data async for res in sub] == [{"user": user_}]  # type: ignore
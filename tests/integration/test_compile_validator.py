@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, Union
+
+import pytest
+from typing_extensions import Annotated
+
+from apischema import ValidationError, deserialize, discriminator, schema
+from apischema.json_schema import compile_validator
+from apischema.metadata import flatten, properties
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+@dataclass
+class Node:
+    value: int = field(metadata=schema(min=0))
+    children: List["Node"] = field(default_factory=list)
+
+
+@dataclass
+class Base:
+    base: str = field(metadata=schema(pattern=r"^\w+$"))
+
+
+@dataclass
+class Foo:
+    flattened: Base = field(metadata=flatten)
+    tags: List[str] = field(default_factory=list, metadata=schema(unique=True))
+    color: Color = Color.red
+    pair: Optional[Tuple[int, bool]] = None
+    extra: Mapping[str, int] = field(default_factory=dict, metadata=properties("^x-"))
+
+
+@dataclass
+class Cat:
+    meow: bool = True
+
+
+@dataclass
+class Dog:
+    pass
+
+
+Pet = Annotated[Union[Cat, Dog], discriminator("type", {"dog": Dog})]
+
+
+@discriminator("kind")
+class Shape:
+    pass
+
+
+@dataclass
+class Square(Shape):
+    side: float
+
+
+@dataclass
+class Circle(Shape):
+    radius: float
+
+
+@pytest.mark.parametrize(
+    "tp, data",
+    [
+        (int, 0),
+        (int, True),
+        (int, 1.5),
+        (float, 1),
+        (bool, 0),
+        (Optional[str], None),
+        (Optional[str], 0),
+        (Literal[1, "a"], 1),
+        (Literal[1, "a"], "b"),
+        (Dict[str, int], {"a": 1}),
+        (Dict[str, int], {"a": "1"}),
+        (Dict[str, int], [("a", 1)]),
+        (Node, {"value": 0, "children": [{"value": 1}]}),
+        (Node, {"value": 0, "children": [{"value": -1}]}),
+        (Node, {"value": 0, "other": 0}),
+        (Node, {"children": []}),
+        (Foo, {"base": "a"}),
+        (Foo, {"base": "a b"}),
+        (Foo, {"base": "a", "tags": ["a", "a"]}),
+        (Foo, {"base": "a", "color": "blue", "pair": [0, False]}),
+        (Foo, {"base": "a", "color": "green"}),
+        (Foo, {"base": "a", "pair": [0]}),
+        (Foo, {"base": "a", "pair": [0, False, 0]}),
+        (Foo, {"base": "a", "x-a": 0}),
+        (Foo, {"base": "a", "x-a": "0"}),
+        (Foo, {"base": "a", "y": 0}),
+        (Pet, {"type": "Cat", "meow": False}),
+        (Pet, {"type": "dog"}),
+        (Pet, {"type": "dog", "meow": False}),
+        (Pet, {"type": "lizard"}),
+        (Pet, {}),
+        (Shape, {"kind": "Square", "side": 1.0}),
+        (Shape, {"kind": "Circle", "side": 1.0}),
+        (List[Shape], [{"kind": "Circle", "radius": 1}]),
+        (Any, object()),
+    ],
+)
+def test_compile_validator(tp, data):
+    try:
+        deserialize(tp, data)
+    except ValidationError:
+        valid = False
+    else:
+        valid = True
+    assert compile_validator(tp)(data) == valid
+
+
+def test_compile_validator_is_cached():
+    assert compile_validator(Foo) is compile_validator(Foo)
+    assert compile_validator(Foo) is not compile_validator(
+        Foo, additional_properties=True
+    )
+    assert compile_validator(Node, additional_properties=True)({"value": 0, "a": 0})
@@ -0,0 +1,92 @@
+from dataclasses import dataclass, make_dataclass
+from typing import Any, List
+
+from apischema import schema
+from apischema.json_schema import JsonSchemaVersion, definitions_schema
+from apischema.json_schema.schema import _direct_refs, _ref_schema
+from apischema.typing import Annotated
+
+
+def cache_misses(cached: Any) -> int:
+    return cached.cache_info().misses
+
+
+@dataclass
+class Baz:
+    value: int
+
+
+@dataclass
+class Bar:
+    baz: Baz
+
+
+@dataclass
+class Foo:
+    bars: List[Bar]
+    baz: Baz
+
+
+def test_definitions_schema_cache():
+    expected = {
+        "Foo": {
+            "type": "object",
+            "properties": {
+                "bars": {"type": "array", "items": {"$ref": "#/$defs/Bar"}},
+                "baz": {"$ref": "#/$defs/Baz"},
+            },
+            "required": ["bars", "baz"],
+            "additionalProperties": False,
+        },
+        "Bar": {
+            "type": "object",
+            "properties": {"baz": {"$ref": "#/$defs/Baz"}},
+            "required": ["baz"],
+            "additionalProperties": False,
+        },
+        "Baz": {
+            "type": "object",
+            "properties": {"value": {"type": "integer"}},
+            "required": ["value"],
+            "additionalProperties": False,
+        },
+    }
+    assert definitions_schema(serialization=[Foo], all_refs=True) == expected
+    misses = cache_misses(_ref_schema)
+    refs_misses = cache_misses(_direct_refs)
+    assert definitions_schema(serialization=[Bar], all_refs=True) == {
+        "Bar": expected["Bar"],
+        "Baz": expected["Baz"],
+    }
+    # only Bar as a top-level type is visited, referenced types are not
+    assert cache_misses(_direct_refs) == refs_misses + 1
+    assert definitions_schema(serialization=[Foo], all_refs=True) == expected
+    assert cache_misses(_ref_schema) == misses
+    assert cache_misses(_direct_refs) == refs_misses + 1
+
+
+def test_definitions_schema_cache_many_types():
+    classes: list = []
+    for i in range(300):
+        fields = [("previous", classes[-1])] if classes else []
+        classes.append(make_dataclass(f"Chained{i}", fields))
+    definitions_schema(serialization=classes, all_refs=True)
+    misses = cache_misses(_ref_schema)
+    refs_misses = cache_misses(_direct_refs)
+    assert len(definitions_schema(serialization=classes, all_refs=True)) == 300
+    assert cache_misses(_ref_schema) == misses
+    assert cache_misses(_direct_refs) == refs_misses
+
+
+@dataclass
+class Qux:
+    baz: Annotated[Baz, schema(extra={"allOf": [{"minProperties": 1}]})]
+
+
+def test_version_conversion_does_not_mutate_cached_schema():
+    expected = {"allOf": [{"minProperties": 1}, {"$ref": "#/definitions/Baz"}]}
+    for _ in range(2):
+        defs = definitions_schema(
+            serialization=[Qux], version=JsonSchemaVersion.DRAFT_7, all_refs=True
+        )
+        assert defs["Qux"]["properties"]["baz"] == expected
@@ -0,0 +1,83 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from apischema import serializer
+from apischema.json_schema import JsonSchemaVersion, definitions_schema
+
+
+@dataclass
+class Node:
+    value: int
+    children: List["Node"]
+
+
+@dataclass
+class Baz:
+    value: int
+
+
+@dataclass
+class Bar:
+    baz: Baz
+    node: Node
+
+
+@dataclass
+class Foo:
+    bars: List[Bar]
+    parent: Optional["Foo"]
+
+
+class Id:
+    def __init__(self, value: str):
+        self.value = value
+
+
+@serializer
+def serialize_id(id: Id) -> str:
+    return id.value
+
+
+@dataclass
+class Qux:
+    id: Id
+    baz: Baz
+
+
+def process_pool() -> Executor:
+    # Workers must share the configuration of the current process
+    return ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork"))
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        lambda: ThreadPoolExecutor(2),
+        pytest.param(
+            process_pool,
+            marks=pytest.mark.skipif(
+                "fork" not in multiprocessing.get_all_start_methods(),
+                reason="fork start method is not available",
+            ),
+        ),
+    ],
+)
+@pytest.mark.parametrize("all_refs", [False, True])
+@pytest.mark.parametrize(
+    "version", [JsonSchemaVersion.DRAFT_2020_12, JsonSchemaVersion.OPEN_API_3_0]
+)
+def test_definitions_schema_executor(executor_factory, all_refs, version):
+    kwargs = dict(
+        deserialization=[Foo, Bar],
+        serialization=[Foo, Qux],
+        all_refs=all_refs,
+        version=version,
+    )
+    with executor_factory() as executor:
+        assert definitions_schema(**kwargs, executor=executor) == definitions_schema(
+            **kwargs
+        )
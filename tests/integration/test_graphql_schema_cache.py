@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+import graphql
+
+from apischema.graphql import Query, graphql_schema, resolver
+
+
+@dataclass
+class Foo:
+    bar: int
+
+
+def foo() -> Foo:
+    return Foo(0)
+
+
+def test_graphql_schema_cache():
+    schema = graphql_schema(query=[foo], use_cache=True)
+    assert graphql_schema(query=[foo], use_cache=True) is schema
+    assert graphql_schema(query=[foo]) is not schema
+    assert graphql_schema(query=[foo], extensions={}, use_cache=True) is not schema
+    # unhashable arguments disable the cache
+    unhashable: dict = {"a": []}
+    assert graphql_schema(
+        query=[foo], extensions=unhashable, use_cache=True
+    ) is not graphql_schema(query=[foo], extensions=unhashable, use_cache=True)
+
+
+def test_graphql_schema_cache_with_operations():
+    def query():
+        return [Query(foo), Query(foo, alias="foo2", parameters_metadata={})]
+
+    schema = graphql_schema(query=query(), use_cache=True)
+    assert graphql_schema(query=query(), use_cache=True) is schema
+    # iterables can be used
+    assert graphql_schema(query=iter(query()), use_cache=True) is schema
+
+
+def test_graphql_schema_cache_reset_on_registration():
+    schema = graphql_schema(query=[foo], use_cache=True)
+
+    def baz(self) -> int:
+        return 0
+
+    resolver(owner=Foo)(baz)
+    schema2 = graphql_schema(query=[foo], use_cache=True)
+    assert schema2 is not schema
+    assert "baz" in graphql.print_schema(schema2)
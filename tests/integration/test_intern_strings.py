@@ -0,0 +1,29 @@
+import json
+from typing import Dict, List
+
+import pytest
+
+from apischema import deserialize, settings
+
+
+@pytest.fixture
+def intern_strings():
+    settings.deserialization.intern_strings = True
+    yield
+    settings.deserialization.intern_strings = False
+
+
+def test_strings_are_not_interned_by_default():
+    data = json.loads('["category", "category"]')
+    assert deserialize(List[str], data) is data
+
+
+@pytest.mark.usefixtures("intern_strings")
+def test_intern_strings():
+    data = json.loads('[{"category": "value"}, {"category": "value"}]')
+    assert data[0]["category"] is not data[1]["category"]
+    values = deserialize(List[Dict[str, str]], data)
+    assert values == data
+    assert values[0]["category"] is values[1]["category"]
+    [key0], [key1] = values
+    assert key0 is key1
@@ -0,0 +1,55 @@
+from enum import Enum
+from typing import Literal
+
+import pytest
+
+from apischema import ValidationError, deserialize
+from apischema.deserialization import literal_tables
+from apischema.deserialization.coercion import coerce
+
+
+class Status(Enum):
+    OK = 0
+    KO = "1"
+
+
+@pytest.mark.parametrize(
+    "tp, data, expected",
+    [
+        (Status, 0, Status.OK),
+        (Status, "0", Status.OK),
+        (Status, 1, Status.KO),
+        (Literal[1, "a"], "1", 1),
+        (Literal["1", "a"], 1, "1"),
+        (Literal[True], "yes", True),
+    ],
+)
+def test_literal_coercion(tp, data, expected):
+    assert deserialize(tp, data, coerce=True) == expected
+
+
+@pytest.mark.parametrize(
+    "tp, data",
+    [
+        (Literal["a", "b"], "c"),
+        (Literal[1, "a"], "b"),
+        (Status, "2"),
+        (Literal["1", "a"], 1.0),
+        (Literal["1", "a"], True),
+        (Status, True),
+    ],
+)
+def test_literal_coercion_error(tp, data):
+    with pytest.raises(ValidationError):
+        deserialize(tp, data, coerce=True)
+
+
+def test_literal_tables():
+    assert literal_tables(tuple(Status), coerce) == (
+        {0: Status.OK, "1": Status.KO},
+        {(str, "0"): Status.OK, (int, 1): Status.KO},
+    )
+    assert literal_tables(tuple(Status), coerce) is literal_tables(
+        tuple(Status), coerce
+    )
+    assert literal_tables(tuple(Status), None)[1] == {}
@@ -0,0 +1,113 @@
+import gc
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from apischema import serialization_method, serialize, settings
+from apischema.serialization.methods import MemoizedMethod
+
+
+@dataclass(frozen=True)
+class Client:
+    name: str
+
+
+@dataclass
+class Receipt:
+    client: Client
+    amount: int
+
+
+@pytest.fixture
+def memoize():
+    settings.serialization.memoize = {Client}
+    yield
+    settings.serialization.memoize = ()
+
+
+@dataclass(frozen=True)
+class Account:
+    owners: List[str]
+
+
+@pytest.mark.usefixtures("memoize")
+def test_memoized_serialization():
+    client = Client("client")
+    receipts = [Receipt(client, i) for i in range(3)]
+    data = serialization_method(List[Receipt])(receipts)
+    assert data == [{"client": {"name": "client"}, "amount": i} for i in range(3)]
+    assert data[0]["client"] is data[1]["client"] is data[2]["client"]
+    # memo is not shared between calls by default
+    assert serialization_method(Client)(client) is not data[0]["client"]
+
+
+def test_memo_is_not_stale_between_calls():
+    settings.serialization.memoize = {Account}
+    try:
+        account = Account(["alice"])
+        assert serialize(Account, account) == {"owners": ["alice"]}
+        account.owners.append("bob")
+        assert serialize(Account, account) == {"owners": ["alice", "bob"]}
+    finally:
+        settings.serialization.memoize = ()
+
+
+@pytest.fixture
+def memoize_across_calls(memoize):
+    settings.serialization.memoize_across_calls = True
+    yield
+    settings.serialization.memoize_across_calls = False
+
+
+@pytest.mark.usefixtures("memoize_across_calls")
+def test_memo_shared_across_calls():
+    client = Client("client")
+    data = serialization_method(List[Receipt])([Receipt(client, 0)])
+    assert serialization_method(Client)(client) is data[0]["client"]
+
+
+@pytest.mark.usefixtures("memoize_across_calls")
+def test_memo_is_cleared_when_object_is_collected():
+    method = serialization_method(Client).__self__  # type: ignore
+    assert isinstance(method, MemoizedMethod)
+    assert method.serialize(Client("client")) == {"name": "client"}
+    gc.collect()
+    assert not method.memo
+
+
+@pytest.mark.usefixtures("memoize")
+def test_not_frozen_dataclass_is_not_memoized():
+    settings.serialization.memoize = lambda _: True
+    receipt = Receipt(Client("client"), 0)
+    data = serialize(List[Receipt], [receipt, receipt])
+    assert data[0] is not data[1]
+    assert data[0]["client"] is data[1]["client"]
+
+
+@dataclass(frozen=True)
+class Base:
+    a: int
+
+
+@dataclass(frozen=True)
+class Child(Base):
+    b: int
+
+
+@dataclass(frozen=True)
+class Holder:
+    base: Base
+    child: Child
+
+
+def test_memo_is_not_shared_between_methods():
+    settings.serialization.memoize = lambda _: True
+    try:
+        child = Child(1, 2)
+        assert serialize(Holder, Holder(child, child)) == {
+            "base": {"a": 1},
+            "child": {"a": 1, "b": 2},
+        }
+    finally:
+        settings.serialization.memoize = ()
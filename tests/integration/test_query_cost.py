@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import List
+
+import graphql
+
+from apischema.graphql import (
+    Query,
+    cost_validation_rule,
+    graphql_schema,
+    query_cost,
+    resolver,
+)
+
+
+@dataclass
+class Bar:
+    name: str
+
+    @resolver(cost=2)
+    def detail(self) -> str:
+        return self.name
+
+
+@dataclass
+class Foo:
+    @resolver(cost=10)
+    def bars(self, first: int = 10) -> List[Bar]:
+        return [Bar(str(i)) for i in range(first)]
+
+
+def foo() -> Foo:
+    return Foo()
+
+
+timings = []
+schema = graphql_schema(
+    query=[Query(foo, cost=1)], timing=lambda info, t: timings.append(info.path.key)
+)
+
+
+def test_query_cost():
+    query = """query($n: Int!) {
+        foo {bars(first: 3) {name detail} a: bars(first: $n) {detail}}
+    }"""
+    document = graphql.parse(query)
+    assert query_cost(schema, document, variables={"n": 2}) == 1 + 10 + 3 * 2 + 10 + 4
+    # unresolved variables fall back to the argument default value
+    assert query_cost(schema, document) == 1 + 10 + 3 * 2 + 10 + 10 * 2
+    fragment_query = "{foo{...F}} fragment F on Foo {bars{detail}}"
+    assert query_cost(schema, graphql.parse(fragment_query)) == 1 + 10 + 10 * 2
+    negative_query = "{foo{bars(first: -5){detail}}}"
+    assert query_cost(schema, graphql.parse(negative_query)) == 1 + 10
+    assert query_cost(schema, graphql.parse("{__typename}")) == 0
+
+
+def test_cost_validation_rule():
+    document = graphql.parse("{foo{bars(first: 3){detail}}}")
+    rule = cost_validation_rule(10)
+    errors = graphql.validate(schema, document, [*graphql.specified_rules, rule])
+    assert [err.message for err in errors] == [
+        "Query cost 17.0 exceeds maximum cost 10"
+    ]
+    assert graphql.validate(schema, document, [cost_validation_rule(17)]) == []
+
+
+def test_cost_validation_rule_with_variables():
+    document = graphql.parse("query($n: Int!) {foo{bars(first: $n){detail}}}")
+    rule = cost_validation_rule(100, max_multiplier=50)
+    errors = graphql.validate(schema, document, [rule])
+    assert [err.message for err in errors] == [
+        "Query cost 111.0 exceeds maximum cost 100"
+    ]
+    assert graphql.validate(schema, document, [cost_validation_rule(111)]) != []
+    rule = cost_validation_rule(111, max_multiplier=50)
+    assert graphql.validate(schema, document, [rule]) == []
+
+
+def test_timing():
+    timings.clear()
+    result = graphql.graphql_sync(schema, "{foo{bars(first: 1){name detail}}}")
+    assert result.errors is None
+    assert sorted(timings) == ["bars", "detail", "foo"]
+
+
+def test_cost_extension():
+    foo_type = schema.type_map["Foo"]
+    assert isinstance(foo_type, graphql.GraphQLObjectType)
+    assert foo_type.fields["bars"].extensions == {"cost": 10}
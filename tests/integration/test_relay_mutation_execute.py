@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+import pytest
+
+from apischema import ValidationError
+from apischema.graphql import relay
+
+
+@dataclass
+class AddOne(relay.Mutation):
+    result: int
+
+    @staticmethod
+    def mutate(value: int) -> "AddOne":
+        return AddOne(value + 1)
+
+
+@dataclass
+class AsyncAddOne(relay.Mutation):
+    result: int
+
+    @staticmethod
+    async def mutate(value: int) -> "AsyncAddOne":
+        return AsyncAddOne(value + 1)
+
+
+def test_execute():
+    assert AddOne.execute({"value": 0, "client_mutation_id": "42"}) == {
+        "result": 1,
+        "client_mutation_id": "42",
+    }
+    assert AddOne.deserialize_input({"value": 0}).value == 0
+    with pytest.raises(ValidationError):
+        AddOne.execute({"value": "0"})
+
+
+async def test_execute_async():
+    assert await AsyncAddOne.execute({"value": 0}) == {
+        "result": 1,
+        "client_mutation_id": None,
+    }
@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import List, Optional, Sequence
+
+import graphql
+
+from apischema import serialize
+from apischema.graphql import graphql_schema, relay
+from apischema.graphql.relay.global_identification import get_nodes
+
+calls: List[Sequence] = []
+
+
+@dataclass
+class Ship(relay.Node[int]):
+    name: str
+
+    @classmethod
+    def get_by_id(
+        cls, id: int, info: Optional[graphql.GraphQLResolveInfo] = None
+    ) -> "Ship":
+        raise NotImplementedError
+
+    @classmethod
+    async def get_by_ids(
+        cls, ids: Sequence[int], info: Optional[graphql.GraphQLResolveInfo] = None
+    ) -> Sequence[Optional["Ship"]]:
+        calls.append(ids)
+        return [Ship(id, f"ship{id}") if id < 10 else None for id in ids]
+
+
+@dataclass
+class Faction(relay.Node[str]):
+    name: str
+
+    @classmethod
+    async def get_by_id(
+        cls, id: str, info: Optional[graphql.GraphQLResolveInfo] = None
+    ) -> "Faction":
+        return Faction(id, id.capitalize())
+
+
+@dataclass
+class Planet(relay.Node[int]):
+    name: str
+
+    @classmethod
+    def id_from_global(cls, global_id: relay.GlobalId["Planet"]) -> int:
+        # Accept legacy "planet-<id>" ids
+        return int(global_id.id.split("-")[-1])
+
+    @classmethod
+    def get_by_id(
+        cls, id: int, info: Optional[graphql.GraphQLResolveInfo] = None
+    ) -> "Planet":
+        return Planet(id, f"planet{id}")
+
+    @classmethod
+    def get_by_ids(
+        cls, ids: Sequence[int], info: Optional[graphql.GraphQLResolveInfo] = None
+    ) -> Sequence[Optional["Planet"]]:
+        return [Planet(id, f"planet{id}") for id in ids]
+
+
+schema = graphql_schema(query=[relay.node, relay.nodes_query], types=relay.nodes())
+
+
+async def test_nodes():
+    query = """query ($ids: [ID!]!) {
+        nodes(ids: $ids) {
+            id
+            ... on Ship { name }
+            ... on Faction { name }
+        }
+    }"""
+    global_ids = [
+        Ship.id_to_global(0),
+        Faction.id_to_global("rebels"),
+        Ship.id_to_global(1),
+        Ship.id_to_global(42),
+    ]
+    ids = serialize(List[relay.GlobalId], global_ids)
+    result = await graphql.graphql(schema, query, variable_values={"ids": ids})
+    assert result.errors is None
+    assert result.data == {
+        "nodes": [
+            {"id": ids[0], "name": "ship0"},
+            {"id": ids[1], "name": "Rebels"},
+            {"id": ids[2], "name": "ship1"},
+            None,
+        ]
+    }
+    assert calls == [[0, 1, 42]]
+
+
+def test_nodes_schema():
+    assert "nodes(ids: [ID!]!): [Node]!" in graphql.print_schema(schema)
+
+
+def test_nodes_use_id_from_global():
+    query = """query ($ids: [ID!]!, $id: ID!) {
+        nodes(ids: $ids) { ... on Planet { name } }
+        node(id: $id) { ... on Planet { name } }
+    }"""
+    global_ids = [relay.GlobalId("planet-1", Planet), Planet.id_to_global(2)]
+    ids = serialize(List[relay.GlobalId], global_ids)
+    result = graphql.graphql_sync(
+        schema, query, variable_values={"ids": ids, "id": ids[0]}
+    )
+    assert result.errors is None
+    assert result.data == {
+        "nodes": [{"name": "planet1"}, {"name": "planet2"}],
+        "node": {"name": "planet1"},
+    }
+
+
+def test_async_nodes_without_running_loop():
+    nodes = get_nodes(serialize(List[relay.GlobalId], [Ship.id_to_global(0)]))
+    (node,) = nodes
+    assert isawaitable(node)
+
+    async def await_node():
+        return await node
+
+    assert asyncio.run(await_node()) == Ship(0, "ship0")
@@ -0,0 +1,102 @@
+from typing import List, Sequence, cast
+
+import pytest
+
+from apischema.graphql import relay
+
+DATA = list(range(10))
+
+
+class CountingSlice:
+    def __init__(self):
+        self.sliced: List[int] = []
+
+    def __len__(self):
+        return len(DATA)
+
+    def __getitem__(self, item: slice):
+        result = DATA[item]
+        self.sliced.extend(result)
+        return result
+
+
+def page(connection: relay.Connection):
+    assert connection.edges is not None
+    return (
+        [edge.node for edge in connection.edges if edge is not None],
+        connection.page_info.has_previous_page,
+        connection.page_info.has_next_page,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, (DATA, False, False)),
+        ({"first": 2}, ([0, 1], False, True)),
+        ({"first": 2, "after": 7}, ([8, 9], True, False)),
+        ({"first": 5, "before": 3}, ([0, 1, 2], False, False)),
+        ({"first": 4, "last": 2}, ([2, 3], True, True)),
+        ({"last": 2}, ([8, 9], True, False)),
+        ({"last": 2, "before": 1}, ([0], False, False)),
+        ({"first": 0}, ([], False, True)),
+    ],
+)
+def test_connection_from_slice(kwargs, expected):
+    data = CountingSlice()
+    connection = relay.connection_from_slice(cast(Sequence[int], data), **kwargs)
+    assert page(connection) == expected
+    count = kwargs.get("first", kwargs.get("last"))
+    if count is not None:
+        assert len(data.sliced) <= count + 1
+    if expected[0]:
+        assert connection.page_info.start_cursor == expected[0][0]
+        assert connection.page_info.end_cursor == expected[0][-1]
+
+
+def fetch_list(after, before, limit, backward):
+    nodes = [
+        n
+        for n in DATA
+        if (after is None or n > after) and (before is None or n < before)
+    ]
+    return nodes[::-1][:limit] if backward else nodes[:limit]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, (DATA, False, False)),
+        ({"first": 2, "after": 3}, ([4, 5], False, True)),
+        ({"last": 2, "before": 5}, ([3, 4], True, False)),
+        ({"last": 3}, ([7, 8, 9], True, False)),
+        ({"first": 3, "last": 1}, ([2], True, True)),
+    ],
+)
+async def test_connection_from_keyset(kwargs, expected):
+    cursor = lambda n: n  # noqa: E731
+    connection = relay.connection_from_keyset(fetch_list, cursor, **kwargs)
+    assert page(connection) == expected
+
+    async def async_fetch(after, before, limit, backward):
+        for node in fetch_list(after, before, None, backward):
+            yield node
+
+    connection = await relay.async_connection_from_keyset(async_fetch, cursor, **kwargs)
+    assert page(connection) == expected
+
+    async def awaitable_fetch(*args):
+        return fetch_list(*args)
+
+    connection = await relay.async_connection_from_keyset(
+        awaitable_fetch, cursor, **kwargs
+    )
+    assert page(connection) == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"first": -1}, {"first": 2, "after": -5}, {"last": 2, "before": -1}]
+)
+def test_negative_count_or_offset(kwargs):
+    with pytest.raises(ValueError):
+        relay.connection_from_slice(DATA, **kwargs)
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import List
+
+import graphql
+import pytest
+
+from apischema.graphql import ResolverCache, graphql_schema, resolver
+
+calls: List[tuple] = []
+shared_cache = ResolverCache(maxsize=1)
+
+
+@dataclass
+class Foo:
+    id: int
+
+    @resolver(cache=True)
+    def bar(self, arg: int = 0) -> int:
+        calls.append(("bar", self.id, arg))
+        return self.id + arg
+
+    @resolver(cache=True)
+    async def baz(self) -> int:
+        calls.append(("baz", self.id))
+        return self.id
+
+    @resolver(cache=shared_cache)
+    def qux(self) -> int:
+        calls.append(("qux", self.id))
+        return self.id
+
+    @resolver(cache=shared_cache)
+    def user(self, info: graphql.GraphQLResolveInfo) -> str:
+        calls.append(("user", self.id))
+        return info.context["user"]
+
+
+FOO = Foo(0)
+
+
+def foo() -> Foo:
+    return FOO
+
+
+schema = graphql_schema(query=[foo])
+
+
+def test_cache_in_context():
+    calls.clear()
+    query = "{foo{bar a: bar b: bar(arg: 1) ...F} } fragment F on Foo {c: bar(arg: 1)}"
+    result = graphql.graphql_sync(schema, query, context_value={})
+    assert result.data == {"foo": {"bar": 0, "a": 0, "b": 1, "c": 1}}
+    assert calls == [("bar", 0, 0), ("bar", 0, 1)]
+    # cache is scoped to the context
+    graphql.graphql_sync(schema, query, context_value={})
+    assert len(calls) == 4
+
+
+def test_no_cache_without_context():
+    calls.clear()
+    graphql.graphql_sync(schema, "{foo{bar a: bar}}")
+    assert len(calls) == 2
+
+
+async def test_async_cache():
+    calls.clear()
+    result = await graphql.graphql(schema, "{foo{baz a: baz}}", context_value={})
+    assert result.data == {"foo": {"baz": 0, "a": 0}}
+    assert calls == [("baz", 0)]
+
+
+def test_shared_cache():
+    calls.clear()
+    shared_cache.clear()
+    for _ in range(2):
+        assert graphql.graphql_sync(schema, "{foo{qux}}").data == {"foo": {"qux": 0}}
+    assert calls == [("qux", 0)]
+
+
+def test_shared_cache_with_info_is_scoped_to_context():
+    calls.clear()
+    shared_cache.clear()
+    alice, bob = {"user": "alice"}, {"user": "bob"}
+    for context in (alice, bob, alice):
+        result = graphql.graphql_sync(schema, "{foo{user}}", context_value=context)
+        assert result.data == {"foo": {"user": context["user"]}}
+    assert calls == [("user", 0), ("user", 0), ("user", 0)]
+    shared_cache.clear()
+    graphql.graphql_sync(schema, "{foo{user a: user}}", context_value=alice)
+    assert calls[3:] == [("user", 0)]
+
+
+def test_resolver_cache_eviction(monkeypatch):
+    cache = ResolverCache(maxsize=1, ttl=10)
+    obj = object()
+    cache.set("a", obj, 0)
+    assert cache.get("a") == 0
+    cache.set("b", obj, 1)
+    assert cache.get("a") is cache.get("c")
+    assert cache.get("b") == 1
+    monkeypatch.setattr("apischema.graphql.resolvers.monotonic", lambda: 1e12)
+    assert cache.get("b") is cache.get("c")
+
+
+def test_batch_resolver_not_cached():
+    with pytest.raises(TypeError):
+        resolver(batch=True, cache=True)
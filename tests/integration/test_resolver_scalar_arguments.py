@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import graphql
+import pytest
+
+from apischema import schema
+from apischema.graphql import graphql_schema, resolver
+from apischema.graphql.resolvers import is_coerced_scalar
+from apischema.objects import ObjectField
+from apischema.typing import Annotated
+
+
+@dataclass
+class Foo:
+    @resolver
+    def bar(self, a: int, b: Optional[str] = None, c: float = 0.0) -> str:
+        return f"{a!r} {b!r} {c!r}"
+
+    @resolver
+    def baz(self, a: Annotated[int, schema(min=0)]) -> int:
+        return a
+
+
+def foo() -> Foo:
+    return Foo()
+
+
+foo_schema = graphql_schema(query=[foo])
+
+
+def test_scalar_arguments():
+    result = graphql.graphql_sync(foo_schema, '{foo{bar(a: 1, b: "b", c: 2)}}')
+    assert result.data == {"foo": {"bar": "1 'b' 2.0"}}
+    result = graphql.graphql_sync(foo_schema, "{foo{bar(a: 1, b: null)}}")
+    assert result.data == {"foo": {"bar": "1 None 0.0"}}
+
+
+def test_constrained_scalar_arguments_are_validated():
+    result = graphql.graphql_sync(foo_schema, "{foo{baz(a: -1)}}")
+    assert result.errors is not None
+
+
+@pytest.mark.parametrize(
+    "tp, metadata, expected",
+    [
+        (int, {}, True),
+        (Optional[str], {}, True),
+        (Annotated[int, schema(min=0)], {}, False),
+        (int, schema(min=0), False),
+        (Optional[Foo], {}, False),
+    ],
+)
+def test_is_coerced_scalar(tp, metadata, expected):
+    field = ObjectField("a", tp, metadata=metadata)
+    assert is_coerced_scalar(tp, field, lambda _: None) == expected
@@ -0,0 +1,178 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional, Union
+
+from apischema import schema
+from apischema.json_schema import (
+    SchemaChange,
+    deserialization_schema,
+    diff_schemas,
+    serialization_schema,
+)
+
+
+class ColorV1(Enum):
+    red = "red"
+    green = "green"
+
+
+class ColorV2(Enum):
+    red = "red"
+    blue = "blue"
+
+
+@dataclass
+class Item:
+    name: str
+    color: ColorV1
+
+
+@dataclass
+class ItemV2:
+    name: str = field(metadata=schema(max_len=10, description="item name"))
+    color: ColorV2 = ColorV2.red
+    quantity: int = 0
+
+
+@dataclass
+class Order:
+    items: List[Item]
+    other_items: List[Item]
+    comment: Optional[str] = None
+
+
+@dataclass
+class OrderV2:
+    items: List[ItemV2]
+    other_items: List[ItemV2]
+    priority: int
+
+
+def rename(schema, old, new):
+    if isinstance(schema, dict):
+        return {
+            (new if k == old else k): rename(v, old, new) for k, v in schema.items()
+        }
+    elif isinstance(schema, list):
+        return [rename(elt, old, new) for elt in schema]
+    elif isinstance(schema, str):
+        return schema.replace(old, new)
+    else:
+        return schema
+
+
+def test_diff_schemas():
+    old = deserialization_schema(Order, all_refs=True)
+    new = rename(
+        rename(deserialization_schema(OrderV2, all_refs=True), "OrderV2", "Order"),
+        "ItemV2",
+        "Item",
+    )
+    assert diff_schemas(old, old) == []
+    assert diff_schemas(old, new) == [
+        SchemaChange(
+            ("$defs", "Order", "properties", "comment"), "property removed", True
+        ),
+        SchemaChange(
+            ("$defs", "Order", "properties", "priority"), "property added", False
+        ),
+        SchemaChange(("$defs", "Order", "required", "priority"), "required", True),
+        # Item is referenced twice but compared once
+        SchemaChange(
+            ("$defs", "Item", "properties", "name", "maxLength"),
+            "maxLength None -> 10",
+            True,
+        ),
+        SchemaChange(
+            ("$defs", "Item", "properties", "name", "description"),
+            "description modified",
+            False,
+        ),
+        SchemaChange(
+            ("$defs", "Item", "properties", "color", "enum"),
+            "values removed ['green']",
+            True,
+        ),
+        SchemaChange(
+            ("$defs", "Item", "properties", "color", "enum"),
+            "values added ['blue']",
+            False,
+        ),
+        SchemaChange(
+            ("$defs", "Item", "properties", "color", "default"),
+            "default modified",
+            False,
+        ),
+        SchemaChange(
+            ("$defs", "Item", "properties", "quantity"), "property added", False
+        ),
+        SchemaChange(("$defs", "Item", "required", "color"), "not required", False),
+    ]
+
+
+def test_diff_serialization_schemas():
+    old = serialization_schema(Optional[List[int]])
+    new = serialization_schema(List[int])
+    assert [c.breaking for c in diff_schemas(old, new)] == [True]
+    assert [c.breaking for c in diff_schemas(old, new, serialization=True)] == [False]
+    assert [c.breaking for c in diff_schemas(new, old, serialization=True)] == [True]
+
+
+@dataclass
+class Tree:
+    children: List["Tree"] = field(default_factory=list)
+
+
+@dataclass
+class TreeV2:
+    children: List["TreeV2"] = field(default_factory=list, metadata=schema(max_items=2))
+
+
+def test_diff_recursive_renamed_definitions():
+    old, new = deserialization_schema(Tree), deserialization_schema(TreeV2)
+    assert diff_schemas(
+        {"$ref": "#/$defs/Tree"},
+        {"$ref": "#/$defs/TreeV2"},
+        old_definitions=old["$defs"],
+        new_definitions=new["$defs"],
+    ) == [
+        SchemaChange(("properties", "children", "maxItems"), "maxItems None -> 2", True)
+    ]
+
+
+@dataclass
+class A:
+    a: int
+
+
+@dataclass
+class B:
+    b: str
+
+
+@dataclass
+class BV2:
+    b: int
+
+
+def test_diff_inline_object_alternatives():
+    old = deserialization_schema(Union[A, B], all_refs=False)
+    new = deserialization_schema(Union[A, BV2], all_refs=False)
+    assert diff_schemas(old, new) == [
+        SchemaChange(
+            ("anyOf", 1, "properties", "b", "type"),
+            "type removed ['string'] added ['integer']",
+            True,
+        )
+    ]
+    old = deserialization_schema(Union[A, B, int], all_refs=False)
+    new = deserialization_schema(Union[A, int], all_refs=False)
+    assert diff_schemas(old, new) == [
+        SchemaChange(("anyOf", 1), "alternative removed", True)
+    ]
+    old = deserialization_schema(Union[A, B], all_refs=False)
+    new = deserialization_schema(Union[A, int], all_refs=False)
+    assert diff_schemas(old, new) == [
+        SchemaChange(("anyOf", 1), "alternative removed", True),
+        SchemaChange(("anyOf", 1), "alternative added", False),
+    ]
@@ -0,0 +1,34 @@
+from datetime import date, datetime
+from uuid import UUID
+
+import pytest
+
+from apischema import ValidationError, deserialization_method, serialization_method
+from apischema.deserialization.methods import StrParserMethod
+from apischema.serialization.methods import StrMethod, WrapperMethod
+
+uuid = UUID("00000000-0000-0000-0000-000000000000")
+
+
+@pytest.mark.parametrize(
+    "tp, data, expected",
+    [
+        (date, "1970-01-01", date(1970, 1, 1)),
+        (datetime, "1970-01-01T00:00:00", datetime(1970, 1, 1)),
+        (UUID, str(uuid), uuid),
+    ],
+)
+def test_str_parsing(tp, data, expected):
+    method = deserialization_method(tp)
+    assert isinstance(method.__self__, StrParserMethod)  # type: ignore
+    assert method(data) == expected
+    with pytest.raises(ValidationError, match="expected type string"):
+        method(0)
+    with pytest.raises(ValidationError):
+        method("invalid")
+
+
+def test_std_types_serialization_methods():
+    assert isinstance(serialization_method(datetime).__self__, WrapperMethod)  # type: ignore
+    assert isinstance(serialization_method(UUID).__self__, StrMethod)  # type: ignore
+    assert serialization_method(UUID)(uuid) == str(uuid)
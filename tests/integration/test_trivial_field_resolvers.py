@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional
+
+import graphql
+
+from apischema.graphql import graphql_schema
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Foo:
+    bar: int
+    color: Optional[Color]
+    snake_case: str
+    list_field: List[int]
+
+
+def foo() -> Foo:
+    return Foo(0, Color.RED, "", [0])
+
+
+schema = graphql_schema(query=[foo])
+
+
+def test_trivial_field_resolvers():
+    foo_type = schema.type_map["Foo"]
+    assert isinstance(foo_type, graphql.GraphQLObjectType)
+    assert foo_type.fields["bar"].resolve is None
+    assert foo_type.fields["color"].resolve is None
+    assert foo_type.fields["snakeCase"].resolve is not None
+    assert foo_type.fields["listField"].resolve is not None
+    assert graphql.graphql_sync(
+        schema, "{foo{bar color snakeCase listField}}"
+    ).data == {"foo": {"bar": 0, "color": "RED", "snakeCase": "", "listField": [0]}}
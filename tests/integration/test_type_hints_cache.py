@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional, Tuple, TypedDict
+
+import pytest
+
+from apischema import deserialize, serialize
+from apischema.cache import reset
+from apischema.json_schema import deserialization_schema
+from apischema.visitor import (
+    TYPE_HINTS_CACHE_SIZE,
+    _cached_dataclass_types_and_fields,
+    named_tuple_types,
+    typed_dict_types,
+)
+
+CACHED: Tuple[Any, ...] = (
+    _cached_dataclass_types_and_fields,
+    named_tuple_types,
+    typed_dict_types,
+)
+
+
+@dataclass
+class Foo:
+    bar: "Bar"
+    baz: Optional["Baz"] = None
+
+
+class Bar(NamedTuple):
+    qux: "Qux"
+
+
+class Baz(TypedDict):
+    qux: "Qux"
+
+
+@dataclass
+class Unresolved:
+    qux: "Qux"
+
+
+def test_type_hints_cache():
+    assert deserialize(Foo, {"bar": {"qux": {"quux": 0}}}) == Foo(Bar(Qux(0)))
+    misses = [cached.cache_info().misses for cached in CACHED]
+    serialize(Foo, Foo(Bar(Qux(0)), {"qux": Qux(0)}))
+    deserialization_schema(Foo)
+    assert [cached.cache_info().misses for cached in CACHED] == misses
+
+
+def test_type_hints_cache_is_bounded_and_reset():
+    deserialize(Foo, {"bar": {"qux": {"quux": 0}}})
+    assert [cached.cache_info().maxsize for cached in CACHED] == [
+        TYPE_HINTS_CACHE_SIZE
+    ] * 3
+    reset()
+    assert [cached.cache_info().currsize for cached in CACHED] == [0] * 3
+
+
+def test_unresolved_forward_ref_not_cached():
+    qux = globals().pop("Qux")
+    with pytest.raises(NameError):
+        deserialize(Unresolved, {"qux": {"quux": 0}})
+    globals()["Qux"] = qux
+    assert deserialize(Unresolved, {"qux": {"quux": 0}}) == Unresolved(Qux(0))
+
+
+@dataclass
+class Qux:
+    quux: int
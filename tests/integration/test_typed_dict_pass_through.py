@@ -0,0 +1,43 @@
+from typing import Dict, List, TypedDict
+
+import pytest
+
+from apischema import PassThroughOptions, serialization_method, serialize
+from apischema.serialization.errors import TypeCheckError
+
+
+class Point(TypedDict, total=False):
+    x: float
+    y: float
+
+
+class Series(TypedDict):
+    name: str
+    points: List[Point]
+    tags: Dict[str, int]
+
+
+series: Series = {
+    "name": "series",
+    "points": [{"x": 0.0, "y": 1.0}, {"x": 1.0}],
+    "tags": {"a": 0},
+}
+
+
+@pytest.mark.parametrize("no_copy", [False, True])
+def test_typed_dict_serialization(no_copy):
+    data = serialize(Series, series, no_copy=no_copy)
+    assert data == series and data is not series
+
+
+def test_typed_dict_serialization_removes_undeclared_keys():
+    assert serialize(Point, {"x": 0.0, "z": 0}) == {"x": 0.0}
+
+
+def test_typed_dict_pass_through():
+    pass_through = PassThroughOptions(typed_dicts=True)
+    assert serialize(Series, series, pass_through=pass_through) is series
+    method = serialization_method(Series, check_type=True, pass_through=pass_through)
+    assert method(series) == series
+    with pytest.raises(TypeCheckError):
+        method({**series, "name": 0})
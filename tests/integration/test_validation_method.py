@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, FrozenSet, List, NewType, Optional, Tuple
+
+import pytest
+
+from apischema import ValidationError, deserialize, schema, validation_method, validator
+from apischema.conversions import Conversion
+from apischema.metadata import conversion, flatten
+
+constructed: List[object] = []
+
+
+class Id(int):
+    def __new__(cls, value):
+        constructed.append(cls)
+        return super().__new__(cls, value)
+
+
+@dataclass
+class Base:
+    id: Id = field(metadata=schema(min=0))
+
+
+@dataclass
+class Foo:
+    base: Base = field(metadata=flatten)
+    tags: FrozenSet[str] = field(default_factory=frozenset)
+    pair: Optional[Tuple[int, str]] = None
+    values: Dict[str, List[float]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        constructed.append(Foo)
+
+    @validator
+    def check(self):
+        raise AssertionError("validators must not run")
+
+
+Temperature = NewType("Temperature", float)
+
+
+def to_temperature(value: int) -> Temperature:
+    constructed.append(Temperature)
+    return Temperature(value)
+
+
+@dataclass
+class Bar:
+    temperature: Temperature = field(
+        metadata=conversion(Conversion(to_temperature, source=int))
+    )
+    date: Optional[datetime] = None
+
+
+@pytest.mark.parametrize(
+    "tp, data, error_locs",
+    [
+        (Foo, {"id": 0, "tags": ["a"], "values": {"a": [0, 1.5]}}, None),
+        (Foo, {"id": -1}, [["id"]]),
+        (Foo, {"id": 0, "pair": [0, 0]}, [["pair"], ["pair", 1]]),
+        (Foo, {"id": 0, "values": {"a": ["b"]}}, [["values", "a", 0]]),
+        (Foo, {"id": 0, "other": 0}, [["other"]]),
+        # converters are not called, so datetime string is not parsed
+        (Bar, {"temperature": 0, "date": "not a date"}, None),
+        (Bar, {"temperature": 0.5}, [["temperature"]]),
+    ],
+)
+def test_validation_method(tp, data, error_locs):
+    validate = validation_method(tp)
+    if error_locs is None:
+        assert validate(data) is None
+    else:
+        with pytest.raises(ValidationError) as err:
+            validate(data)
+        assert [e["loc"] for e in err.value.errors] == error_locs
+    assert constructed == []
+
+
+def test_validation_method_same_errors_as_deserialization():
+    data = {"id": "0", "pair": [0, 0], "values": []}
+    with pytest.raises(ValidationError) as deserialization_err:
+        deserialize(Foo, data)
+    with pytest.raises(ValidationError) as validation_err:
+        validation_method(Foo)(data)
+    assert validation_err.value.errors == deserialization_err.value.errors
+    assert constructed == []
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from apischema import ValidationError, deserialize, validator
+
+called: List[str] = []
+
+
+@dataclass
+class Foo:
+    a: int = 0
+    b: int = 0
+    c: int = 0
+
+    @validator
+    def a_positive(self):
+        called.append("a_positive")
+        if self.a < 0:
+            yield "a negative"
+
+    @validator
+    def b_positive(self):
+        called.append("b_positive")
+        if self.b < 0:
+            yield "b negative"
+
+    @validator
+    def a_close_to_b(self):
+        called.append("a_close_to_b")
+        if abs(self.a - self.b) > 10:
+            yield "a too far from b"
+
+    @validator
+    def a_not_zero(self):
+        called.append("a_not_zero")
+        if self.a == 0:
+            yield "a is zero"
+
+
+@pytest.fixture(autouse=True)
+def reset_called():
+    called.clear()
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"c": 0}, []),
+        ({"a": 1}, ["a_positive", "a_close_to_b", "a_not_zero"]),
+        ({"b": 1}, ["b_positive", "a_close_to_b"]),
+        ({"a": 1, "b": 1}, ["a_positive", "b_positive", "a_close_to_b", "a_not_zero"]),
+    ],
+)
+def test_validators_run_when_dependencies_are_not_default(data, expected):
+    deserialize(Foo, data)
+    assert called == expected
+
+
+def test_validators_of_invalid_fields_are_not_run():
+    with pytest.raises(ValidationError) as err:
+        deserialize(Foo, {"a": "", "b": -1})
+    assert called == ["b_positive"]
+    assert err.value.errors == [
+        {"loc": [], "err": "b negative"},
+        {"loc": ["a"], "err": "expected type integer, found string"},
+    ]
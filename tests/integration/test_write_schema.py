@@ -0,0 +1,67 @@
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Pattern, Tuple
+
+import pytest
+
+from apischema import schema
+from apischema.aliases import Aliaser
+from apischema.conversions import converters
+from apischema.json_schema import JsonSchemaVersion, deserialization_schema
+from apischema.json_schema.schema import DeserializationSchemaBuilder, write_schema
+from apischema.json_schema.types import JsonSchema
+from apischema.serialization import serialize
+from apischema.utils import to_camel_case
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+@dataclass
+class Foo:
+    snake_case: Optional[int] = field(default=None, metadata=schema(min=0))
+    color: Color = Color.red
+    pattern: Pattern = re.compile(r"\d+")
+    pair: Tuple[int, str] = (0, "")
+    mapping: Dict[str, Any] = field(default_factory=dict, metadata=schema(max_len=2))
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        JsonSchemaVersion.DRAFT_7,
+        JsonSchemaVersion.DRAFT_2020_12,
+        JsonSchemaVersion.OPEN_API_3_0,
+        JsonSchemaVersion.OPEN_API_3_1,
+    ],
+)
+@pytest.mark.parametrize("aliaser", [lambda s: s, to_camel_case])
+def test_write_schema(version: JsonSchemaVersion, aliaser: Aliaser):
+    json_schema = DeserializationSchemaBuilder(
+        False, converters.default_deserialization, False, version.ref_factory, ()
+    ).visit(Foo)
+    assert isinstance(json_schema, JsonSchema)
+    expected = serialize(
+        JsonSchema,
+        json_schema,
+        aliaser=aliaser,
+        check_type=True,
+        conversion=version.conversion,
+        default_conversion=converters.default_serialization,
+        fall_back_on_any=True,
+    )
+    assert write_schema(json_schema, aliaser, version) == expected
+
+
+def test_write_schema_key_order():
+    result = deserialization_schema(Foo, aliaser=to_camel_case, with_schema=False)
+    assert list(result["properties"]) == [
+        "snakeCase",
+        "color",
+        "pattern",
+        "pair",
+        "mapping",
+    ]
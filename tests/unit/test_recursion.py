@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, make_dataclass
 from typing import List, Optional
 
 import pytest
@@ -53,9 +53,24 @@ class G:
 rec_conv = Conversion(lambda _: None, source=Optional[G], target=A)
 
 
+@dataclass
+class H:
+    b: B
+    c: List[C]
+
+
 @pytest.mark.parametrize(
     "tp, expected",
-    [(A, False), (B, True), (C, True), (D, True), (E, True), (F, True), (G, True)],
+    [
+        (A, False),
+        (B, True),
+        (C, True),
+        (D, True),
+        (E, True),
+        (F, True),
+        (G, True),
+        (H, False),
+    ],
 )
 def test_is_recursive(tp, expected):
     assert (
@@ -67,3 +82,26 @@ def test_is_recursive(tp, expected):
         )
         == expected
     )
+
+
+def test_recursion_analysis_visits_types_once():
+    n = 30
+    classes = [
+        make_dataclass(f"Rec{i}", [(f"field{j}", object, None) for j in (1, 2)])
+        for i in range(n)
+    ]
+    # Types referencing each other are set after all the classes are created
+    for i, cls in enumerate(classes):
+        for j in (1, 2):
+            cls.__annotations__[f"field{j}"] = Optional[classes[(i + j) % n]]
+    visited: List[type] = []
+
+    class CountingChecker(DeserializationRecursiveChecker):
+        def object(self, tp, fields):
+            visited.append(tp)
+            return super().object(tp, fields)
+
+    default_conversion = settings.deserialization.default_conversion
+    for cls in classes:
+        assert is_recursive(cls, None, default_conversion, CountingChecker)
+    assert sorted(visited, key=classes.index) == classes
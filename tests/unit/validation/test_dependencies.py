@@ -7,7 +7,33 @@ def a_equal_b(param):
     assert param.a == param.b
 
 
-@pytest.mark.parametrize("func, deps", [(a_equal_b, {"a", "b"}), (int, set())])
+def nested(param):
+    def check(values):
+        return all(v < param.max for v in values) and param.values is not None
+
+    assert check([elt.a for elt in param.elts]) and param.c.d()
+
+
+def assign(param):
+    param.a, param.b = param.b, param.a
+    del param.c
+
+
+# Source is not available for this function
+exec("def no_source(param):\n    assert param.a.b == param.c.d()")
+
+
+@pytest.mark.parametrize(
+    "func, deps",
+    [
+        (a_equal_b, {"a", "b"}),
+        (int, set()),
+        (lambda x: x.a > x.b, {"a", "b"}),
+        (nested, {"c", "elts", "max", "values"}),
+        (assign, {"a", "b", "c"}),
+        (no_source, {"a", "c"}),  # type: ignore # noqa: F821
+    ],
+)
 def test_find_dependencies(func, deps):
     assert find_dependencies(func) == deps
 